@@ -11,9 +11,15 @@ sys.path.append(str(Path(__file__).parent))
 from src.data_ingestion import load_and_clean_data
 from src.features import perform_feature_engineering, split_data, scale_train_test
 from src.modeling import train_logistic_regression, get_strategic_insights
+from src.explainability import explain_model, top_k_reasons
+from src.inference import export_bundle, save_bundle
+from src.uncertainty import fit_bootstrap_ensemble, score_with_intervals
+from src.partial_dependence import partial_dependence
+from src.scenarios import ScenarioEngine
+from src.retention import optimize_retention_budget, summarize_plan
 from src.visualization import (setup_styles, plot_attrition_by_overtime, 
                                plot_feature_importance, plot_risk_distribution,
-                               plot_correlation_heatmap)
+                               plot_correlation_heatmap, plot_partial_dependence)
 import json
 
 # Configure Logging
@@ -41,6 +47,26 @@ def main():
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Number of per-employee risk reasons written to the watch list
+TOP_K_REASONS = 3
+
+# Bootstrap replicas behind the RiskScoreLow/RiskScoreHigh interval (0 disables)
+RISK_INTERVAL_REPLICAS = 50
+
+# What-if interventions summarised in results/scenario_summary.csv
+RETENTION_SCENARIOS = [
+    {'name': 'Cap overtime in Sales', 'cohort': {'Department': 'Sales'}, 'set': {'OverTime': 0}},
+    {'name': 'Cap overtime everywhere', 'set': {'OverTime': 0}},
+    {'name': 'Stock option +1 level', 'add': {'StockOptionLevel': 1}},
+    {'name': '10% raise for Sales Reps', 'cohort': {'JobRole': 'Sales Representative'},
+     'multiply': {'MonthlyIncome': 1.10}},
+]
+
+# Intervention funded by the retention budget; its cost is RETENTION_COST_MONTHS of salary
+RETENTION_INTERVENTION = {'name': 'Stock option +1 level', 'add': {'StockOptionLevel': 1}}
+RETENTION_COST_MONTHS = 1.0
+RETENTION_BUDGET = 250_000
+
 def main():
     # 1. Setup
     logger.info("Starting Forge Launch Data Science Sprint...")
@@ -109,9 +135,13 @@ def main():
 
     logger.info(f"Strategic insights saved: {global_drivers}")
 
+    # Portable NumPy-only copy of the model for lightweight scoring processes
+    save_bundle(export_bundle(model, feature_names), results_dir / 'model_bundle.npz')
+
     # 6. Model Interpretation
     logger.info("Phase 5: Visualizing Model Drivers...")
     plot_feature_importance(model, X_scaled, X_scaled.columns, figures_dir)
+    plot_partial_dependence(partial_dependence(model, X_scaled, ice=True), figures_dir)
 
     # 7. Risk Scoring (The Product)
     logger.info("Phase 6: Generating Risk Watch List...")
@@ -131,6 +161,11 @@ def main():
     # Visualize Risk Distribution
     plot_risk_distribution(risk_scores, figures_dir)
 
+    # Per-employee reasons: one contribution matrix for the whole active population
+    contributions, _ = explain_model(model, X_active_scaled, background=X_scaled)
+    reasons = top_k_reasons(contributions, feature_names, k=TOP_K_REASONS,
+                            index=X_active_scaled.index)
+
     # Create Export CSV
     watch_list = pd.DataFrame({
         'EmployeeNumber': employees_active,
@@ -140,13 +175,42 @@ def main():
     watch_list['RiskLevel'] = pd.cut(watch_list['RiskScore'], 
                                      bins=[0, 0.3, 0.7, 1.0], 
                                      labels=['Low', 'Medium', 'High'])
+    watch_list = watch_list.join(reasons)
+
+    if RISK_INTERVAL_REPLICAS:
+        # 90% interval from bootstrap replicas, scored in one matrix multiply
+        ensemble = fit_bootstrap_ensemble(X_scaled, y, n_replicas=RISK_INTERVAL_REPLICAS)
+        intervals = score_with_intervals(ensemble, X_active_scaled)
+        watch_list = watch_list.join(intervals[['RiskScoreLow', 'RiskScoreHigh']])
 
     output_path = results_dir / 'risk_watch_list.csv'
     watch_list.to_csv(output_path, index=False)
+
+    # 8. What-if scenarios over the active population
+    engine = ScenarioEngine(model, X, cohort_frame=clean_df.loc[X.index])
+    scenarios = engine.run(RETENTION_SCENARIOS, population=active_mask.to_numpy())
+    scenarios.to_csv(results_dir / 'scenario_summary.csv', index=False)
+    logger.info(f"Scenario summary:\n{scenarios[['scenario', 'cohort_size', 'leavers_avoided']]}")
+
+    # 9. Retention budget: whom to fund under RETENTION_BUDGET
+    active = active_mask.to_numpy()
+    plan = optimize_retention_budget(
+        engine.risk_reduction(RETENTION_INTERVENTION)[active],
+        RETENTION_COST_MONTHS * X.loc[active_mask, 'MonthlyIncome'],
+        RETENTION_BUDGET,
+        index=X.index[active],
+    )
+    plan = plan[plan['Selected']].copy()
+    plan.insert(0, 'EmployeeNumber', employees_active.loc[plan.index])
+    plan.to_csv(results_dir / 'retention_plan.csv', index=False)
+    logger.info(f"Retention plan: {summarize_plan(plan, RETENTION_BUDGET)}")
     
     logger.info(f"SUCCESS. Pipeline Complete.")
     logger.info(f"1. Risk Watch List saved to: {output_path}")
     logger.info(f"2. Figures saved to: {figures_dir}")
+    logger.info(f"3. Scoring bundle saved to: {results_dir / 'model_bundle.npz'}")
+    logger.info(f"4. Scenario summary saved to: {results_dir / 'scenario_summary.csv'}")
+    logger.info(f"5. Retention plan saved to: {results_dir / 'retention_plan.csv'}")
 
 if __name__ == "__main__":
     main()
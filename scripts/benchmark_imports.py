@@ -0,0 +1,110 @@
+"""
+Import-Time Benchmark
+
+Measures the cumulative import cost of every module in `src/` with
+`python -X importtime` (one fresh interpreter per module) and fails when a
+module exceeds its budget or pulls in a heavy dependency at import time.
+
+Usage:
+    python scripts/benchmark_imports.py            # report + budget check
+    python scripts/benchmark_imports.py --top 15   # also list the slowest imports
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+ROOT_DIR = SCRIPT_DIR.parent
+
+# Cumulative import-time budget per module, in milliseconds. numpy + pandas
+# alone cost ~0.5-0.7 s; the budget leaves room for machine noise, while a
+# heavy dependency sneaking back in (sklearn, shap, xgboost) costs seconds.
+DEFAULT_BUDGET_MS = 1200
+BUDGETS_MS = {
+    'src': 50,
+    'src.inference': 400,
+}
+
+# Dependencies that must only be imported on first use
+HEAVY_MODULES = ('sklearn', 'xgboost', 'lightgbm', 'shap', 'imblearn', 'seaborn', 'matplotlib', 'scipy')
+
+_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)')
+
+
+def discover_modules():
+    """List importable module names under src/."""
+    modules = []
+    for path in sorted((ROOT_DIR / 'src').rglob('*.py')):
+        rel = path.relative_to(ROOT_DIR).with_suffix('')
+        parts = rel.parts[:-1] if rel.name == '__init__' else rel.parts
+        modules.append('.'.join(parts))
+    return modules
+
+
+def measure(module):
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative ms of the module itself, list of (ms, name) for
+        every module imported along the way)
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}:\n{proc.stderr[-2000:]}")
+
+    total_us, packages = 0, []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative, name = int(match.group(2)), match.group(3)
+        if name == module:
+            total_us = cumulative
+        packages.append((cumulative / 1000, name))
+    return total_us / 1000, packages
+
+
+def run(top=0):
+    """Measure all modules and return a list of budget violations."""
+    failures = []
+    print(f"{'module':<28}{'import ms':>10}{'budget':>8}  heavy deps")
+    for module in discover_modules():
+        ms, packages = measure(module)
+        budget = BUDGETS_MS.get(module, DEFAULT_BUDGET_MS)
+        heavy = sorted({name.split('.')[0] for _, name in packages} & set(HEAVY_MODULES))
+        flag = '❌' if ms > budget or heavy else '✅'
+        print(f"{module:<28}{ms:>10.1f}{budget:>8}  {', '.join(heavy) or '-'} {flag}")
+        if ms > budget:
+            failures.append(f"{module}: {ms:.0f} ms > {budget} ms budget")
+        if heavy:
+            failures.append(f"{module}: imports {', '.join(heavy)} at module load")
+        if top:
+            top_level = [(cost, name) for cost, name in packages if '.' not in name]
+            for cost, name in sorted(top_level, reverse=True)[:top]:
+                print(f"    {cost:>8.1f} ms  {name}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--top', type=int, default=0, help='Show the N slowest top-level imports per module')
+    args = parser.parse_args()
+
+    failures = run(top=args.top)
+    if failures:
+        print("\n⚠️  Import budget exceeded:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ All modules within import budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Approximate-Kernel Benchmark
+
+Compares the exact RBF SVM/SVR against the Nystroem and random-Fourier
+approximations ('svm_approx' / 'svr_approx'): fit time, predict time, peak
+resident memory and held-out accuracy (classification) or R^2 (regression).
+Each model runs in its own process so peak RSS is measured in isolation.
+
+Usage:
+    python scripts/benchmark_kernel_approx.py --rows 5000 20000 --features 40
+"""
+
+import argparse
+import multiprocessing as mp
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = Path(__file__).parent
+ROOT_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+# (label, model_type suffix, extra model params)
+VARIANTS = [
+    ('exact', '', {}),
+    ('nystroem', '_approx', {'method': 'nystroem'}),
+    ('rff', '_approx', {'method': 'rff'}),
+]
+
+
+def make_synthetic(rows, features, task, seed=42):
+    """Standardised features with a non-linear target, attrition-like class balance."""
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((rows, features))
+    signal = np.sin(X[:, 0]) + X[:, 1] * X[:, 2] + 0.5 * X[:, 3:6].sum(axis=1)
+    noise = 0.5 * rng.standard_normal(rows)
+    y = (signal + noise > 1.0).astype(int) if task == 'classification' else signal + noise
+    return X, y
+
+
+def _run(task, label, suffix, params, rows, features, n_components, queue):
+    from src.models import train_classifier, train_regressor
+
+    X, y = make_synthetic(rows, features, task)
+    if suffix:
+        params = {**params, 'n_components': n_components, 'random_state': 42}
+    start = time.perf_counter()
+    if task == 'classification':
+        result = train_classifier(X, y, model_type='svm' + suffix, **params)
+        score = result['metrics']['accuracy']
+    else:
+        result = train_regressor(X, y, model_type='svr' + suffix, **params)
+        score = result['metrics']['r2']
+    elapsed = time.perf_counter() - start
+
+    predict_start = time.perf_counter()
+    result['model'].predict(result['X_test'])
+    predict_seconds = time.perf_counter() - predict_start
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux reports KiB
+    queue.put({'task': task, 'rows': rows, 'model': label, 'fit_seconds': round(elapsed, 2),
+               'predict_seconds': round(predict_seconds, 3), 'peak_rss_mb': round(peak_mb, 1),
+               'score': round(score, 4)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[2_000, 10_000])
+    parser.add_argument('--features', type=int, default=40)
+    parser.add_argument('--n-components', type=int, default=1000)
+    parser.add_argument('--tasks', nargs='+', default=['classification', 'regression'],
+                        choices=['classification', 'regression'])
+    args = parser.parse_args()
+
+    ctx = mp.get_context('spawn')
+    results = []
+    for task in args.tasks:
+        for rows in args.rows:
+            for label, suffix, params in VARIANTS:
+                queue = ctx.Queue()
+                proc = ctx.Process(target=_run, args=(task, label, suffix, params, rows, args.features,
+                                                      args.n_components, queue))
+                proc.start()
+                results.append(queue.get())
+                proc.join()
+                print(f"✅ {results[-1]}")
+
+    print("\n" + pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+XGBoost Memory Benchmark
+
+Compares in-memory hist training against external-memory training over
+Parquet chunks: wall time, peak resident memory and training accuracy.
+Each mode runs in its own process so peak RSS is measured in isolation.
+
+Usage:
+    python scripts/benchmark_xgboost_memory.py --rows 2000000 --features 40
+"""
+
+import argparse
+import multiprocessing as mp
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = Path(__file__).parent
+ROOT_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+
+def write_synthetic_chunks(out_dir, rows, features, chunk_rows, seed=42):
+    """Write a synthetic attrition-like dataset as Parquet files of `chunk_rows` rows."""
+    rng = np.random.default_rng(seed)
+    weights = rng.standard_normal(features)
+    paths = []
+    for i, start in enumerate(range(0, rows, chunk_rows)):
+        n = min(chunk_rows, rows - start)
+        X = rng.random((n, features), dtype=np.float32)
+        logits = (X - 0.5) @ weights + rng.standard_normal(n)
+        df = pd.DataFrame(X, columns=[f"f{j}" for j in range(features)])
+        df['Attrition'] = (logits > 1.0).astype(np.int8)
+        path = Path(out_dir) / f"chunk_{i:04d}.parquet"
+        df.to_parquet(path, index=False, row_group_size=min(n, 100_000))
+        paths.append(path)
+    return paths
+
+
+def _run(mode, paths, n_jobs, queue):
+    from src.modeling import train_xgboost, train_xgboost_external_memory
+
+    start = time.perf_counter()
+    if mode == 'in_memory':
+        df = pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+        X, y = df.drop(columns=['Attrition']), df['Attrition']
+        model = train_xgboost(X, y, tree_method='hist', n_jobs=n_jobs)
+    else:
+        model = train_xgboost_external_memory(paths, n_jobs=n_jobs)
+    elapsed = time.perf_counter() - start
+
+    sample = pd.read_parquet(paths[0])
+    accuracy = float((model.predict(sample.drop(columns=['Attrition'])) == sample['Attrition']).mean())
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux reports KiB
+    queue.put({'mode': mode, 'seconds': round(elapsed, 2), 'peak_rss_mb': round(peak_mb, 1),
+               'accuracy': round(accuracy, 4)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--features', type=int, default=40)
+    parser.add_argument('--chunk-rows', type=int, default=250_000)
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    args = parser.parse_args()
+
+    ctx = mp.get_context('spawn')
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"📦 Writing {args.rows:,} x {args.features} synthetic rows...")
+        paths = write_synthetic_chunks(tmp, args.rows, args.features, args.chunk_rows)
+        for mode in ('in_memory', 'external_memory'):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run, args=(mode, paths, args.n_jobs, queue))
+            proc.start()
+            results.append(queue.get())
+            proc.join()
+            print(f"✅ {results[-1]}")
+
+    print("\n" + pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,9 +14,16 @@ from .eda import (
 from .preprocessing import (
     handle_missing_values,
     detect_outliers,
+    fit_outlier_bounds,
+    outlier_bounds_from_summary,
+    apply_outlier_bounds,
+    iter_outlier_masks,
     validate_data_types,
 )
 
+from .group_metrics import group_metrics
+from .streaming import SummaryAccumulator
+
 __all__ = [
     'explore_dataframe',
     'get_summary_statistics', 
@@ -24,5 +31,11 @@ __all__ = [
     'correlation_analysis',
     'handle_missing_values',
     'detect_outliers',
+    'fit_outlier_bounds',
+    'outlier_bounds_from_summary',
+    'apply_outlier_bounds',
+    'iter_outlier_masks',
     'validate_data_types',
+    'group_metrics',
+    'SummaryAccumulator',
 ]
@@ -4,11 +4,15 @@ Exploratory Data Analysis (EDA) Utilities
 This module provides functions for exploring and understanding datasets.
 """
 
+from __future__ import annotations
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterable, Union
+
+# matplotlib/seaborn are imported inside the plotting functions
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 def explore_dataframe(df: pd.DataFrame, verbose: bool = True) -> Dict[str, Any]:
@@ -43,19 +47,37 @@ def explore_dataframe(df: pd.DataFrame, verbose: bool = True) -> Dict[str, Any]:
 
 
 def get_summary_statistics(
-    df: pd.DataFrame, 
-    columns: Optional[List[str]] = None
+    df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    columns: Optional[List[str]] = None,
+    streaming: bool = False,
+    chunk_size: int = 100_000,
+    n_jobs: int = 1,
+    relative_accuracy: float = 0.01
 ) -> pd.DataFrame:
     """
     Generate comprehensive summary statistics for numeric columns.
     
     Args:
-        df: Input DataFrame
+        df: Input DataFrame, or (streaming only) an iterable of DataFrame
+            chunks such as `pd.read_csv(path, chunksize=...)`
         columns: Specific columns to analyze (defaults to all numeric)
+        streaming: Accumulate everything in one pass over chunks with
+            mergeable accumulators (see analysis/streaming.py); quartiles
+            and median then come from a quantile sketch and are within
+            `relative_accuracy` of the exact values
+        chunk_size: Rows per chunk when streaming over a DataFrame
+        n_jobs: Worker processes for streaming (1 = in this process)
+        relative_accuracy: Relative error bound of the streaming quantiles
         
     Returns:
         DataFrame with summary statistics
     """
+    if streaming:
+        from .streaming import streaming_summary
+
+        return streaming_summary(df, columns=columns, chunk_size=chunk_size, n_jobs=n_jobs,
+                                 relative_accuracy=relative_accuracy).summary()
+
     if columns is None:
         numeric_df = df.select_dtypes(include=[np.number])
     else:
@@ -88,6 +110,8 @@ def plot_distributions(
     Returns:
         Matplotlib figure object
     """
+    import matplotlib.pyplot as plt
+
     if columns is None:
         numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     else:
@@ -114,11 +138,106 @@ def plot_distributions(
     return fig
 
 
+def _correlation_pairs(columns, i: np.ndarray, j: np.ndarray, r: np.ndarray) -> pd.DataFrame:
+    """Pairs frame from row/column positions and their correlations."""
+    columns = np.asarray(columns, dtype=object)
+    return pd.DataFrame({'feature_1': columns[i], 'feature_2': columns[j], 'correlation': r})
+
+
+def _plot_correlation_heatmap(corr_matrix: pd.DataFrame, method: str, figsize: tuple,
+                              annot_max: int = 30) -> plt.Figure:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Per-cell annotations dominate render time and are unreadable on wide frames
+    annot = len(corr_matrix.columns) <= annot_max
+    fig, ax = plt.subplots(figsize=figsize)
+    sns.heatmap(
+        corr_matrix,
+        annot=annot,
+        fmt='.2f',
+        cmap='RdBu_r',
+        center=0,
+        ax=ax
+    )
+    ax.set_title(f'{method.capitalize()} Correlation Matrix')
+    plt.tight_layout()
+    return fig
+
+
+def _block_correlation_pairs(
+    numeric_df: pd.DataFrame,
+    method: str,
+    threshold: float,
+    block_size: int
+) -> pd.DataFrame:
+    """
+    High-correlation pairs computed one (block_size x block_size) tile at a time.
+
+    Only the upper-triangle tiles are computed and only pairs above the
+    threshold are kept, so the full p x p matrix is never materialized.
+    Missing values use pairwise-complete observations like `DataFrame.corr`;
+    for spearman each column is ranked once over its own non-missing values,
+    so results can differ slightly from pandas when values are missing.
+    """
+    if method == 'spearman':
+        # Spearman is Pearson on ranks (ties averaged, as in pandas)
+        numeric_df = numeric_df.rank()
+    elif method != 'pearson':
+        raise ValueError(f"Block-wise correlation supports 'pearson' and 'spearman', not '{method}'")
+
+    X = numeric_df.to_numpy(dtype=float)
+    X = X - np.nanmean(X, axis=0)  # centring keeps the sums of products well conditioned
+    observed = ~np.isnan(X)
+    pairwise = not observed.all()
+    if pairwise:
+        M = observed.astype(float)
+        X0 = np.where(observed, X, 0.0)
+        X2 = X0 * X0
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Z = X / np.sqrt((X * X).sum(axis=0))  # constant columns become NaN, as in pandas
+
+    p = X.shape[1]
+    starts = range(0, p, block_size)
+    found_i, found_j, found_r = [], [], []
+    for a in starts:
+        ia = slice(a, min(a + block_size, p))
+        for b in starts:
+            if b < a:
+                continue
+            ib = slice(b, min(b + block_size, p))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if pairwise:
+                    n = M[:, ia].T @ M[:, ib]
+                    sx, sy = X0[:, ia].T @ M[:, ib], M[:, ia].T @ X0[:, ib]
+                    cov = X0[:, ia].T @ X0[:, ib] - sx * sy / n
+                    var_x = X2[:, ia].T @ M[:, ib] - sx * sx / n
+                    var_y = M[:, ia].T @ X2[:, ib] - sy * sy / n
+                    tile = cov / np.sqrt(var_x * var_y)
+                    tile[n < 2] = np.nan
+                else:
+                    tile = Z[:, ia].T @ Z[:, ib]
+                hit = np.abs(tile) > threshold
+            if a == b:
+                hit &= np.triu(np.ones_like(hit), k=1)
+            i, j = np.nonzero(hit)
+            found_i.append(i + a)
+            found_j.append(j + b)
+            found_r.append(np.clip(tile[i, j], -1.0, 1.0))
+
+    i, j, r = (np.concatenate(parts) for parts in (found_i, found_j, found_r))
+    order = np.lexsort((j, i))
+    return _correlation_pairs(numeric_df.columns, i[order], j[order], r[order])
+
+
 def correlation_analysis(
     df: pd.DataFrame,
     method: str = 'pearson',
     threshold: float = 0.5,
-    figsize: tuple = (12, 10)
+    figsize: tuple = (12, 10),
+    render: bool = True,
+    block_size: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Perform correlation analysis and identify highly correlated features.
@@ -128,39 +247,42 @@ def correlation_analysis(
         method: Correlation method ('pearson', 'spearman', 'kendall')
         threshold: Threshold for flagging high correlations
         figsize: Figure size for heatmap
+        render: Draw the heatmap now; if False, call `result['plot']()` to
+            draw it on demand (cells are annotated for up to 30 columns)
+        block_size: Compute correlations in column blocks of this size and
+            keep only the high pairs, without building the full matrix
+            (for frames with thousands of columns; pearson/spearman only,
+            no matrix or heatmap is returned)
         
     Returns:
-        Dictionary with correlation matrix and high correlation pairs
+        Dictionary with correlation matrix, high correlation pairs, the
+        heatmap figure (None unless rendered) and a `plot` callable
     """
     numeric_df = df.select_dtypes(include=[np.number])
+
+    if block_size is not None:
+        return {
+            'matrix': None,
+            'high_correlations': _block_correlation_pairs(numeric_df, method, threshold, block_size),
+            'figure': None,
+            'plot': None
+        }
+
     corr_matrix = numeric_df.corr(method=method)
     
-    # Find high correlations
-    high_corr = []
-    for i in range(len(corr_matrix.columns)):
-        for j in range(i + 1, len(corr_matrix.columns)):
-            if abs(corr_matrix.iloc[i, j]) > threshold:
-                high_corr.append({
-                    'feature_1': corr_matrix.columns[i],
-                    'feature_2': corr_matrix.columns[j],
-                    'correlation': corr_matrix.iloc[i, j]
-                })
-    
-    # Create heatmap
-    fig, ax = plt.subplots(figsize=figsize)
-    sns.heatmap(
-        corr_matrix, 
-        annot=True, 
-        fmt='.2f', 
-        cmap='RdBu_r',
-        center=0,
-        ax=ax
-    )
-    ax.set_title(f'{method.capitalize()} Correlation Matrix')
-    plt.tight_layout()
-    
+    # Find high correlations among the upper-triangle pairs
+    values = corr_matrix.to_numpy()
+    i, j = np.triu_indices(len(corr_matrix.columns), k=1)
+    r = values[i, j]
+    keep = np.abs(r) > threshold
+    high_corr = _correlation_pairs(corr_matrix.columns, i[keep], j[keep], r[keep])
+
+    def plot() -> plt.Figure:
+        return _plot_correlation_heatmap(corr_matrix, method, figsize)
+
     return {
         'matrix': corr_matrix,
-        'high_correlations': pd.DataFrame(high_corr),
-        'figure': fig
+        'high_correlations': high_corr,
+        'figure': plot() if render else None,
+        'plot': plot
     }
@@ -0,0 +1,151 @@
+"""
+Group-wise Classification Metrics
+
+Computes confusion matrices, precision/recall and score distributions for
+every slice of one or more grouping columns (e.g. Department x JobRole x
+Gender) in a single pass. Each row gets one integer group code; the
+per-group confusion cells, counts and score moments are then `np.bincount`
+aggregations over that code, and score quantiles come from one sort by
+(group, score), so the cost does not grow with the number of slices.
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayOrColumn = Union[str, np.ndarray, pd.Series, None]
+
+
+def _values(df: pd.DataFrame, data: ArrayOrColumn) -> Optional[np.ndarray]:
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return df[data].to_numpy()
+    return np.asarray(data)
+
+
+def group_codes(df: pd.DataFrame, by: Sequence[str]):
+    """
+    Integer code per row for the combination of the `by` columns.
+
+    Args:
+        df: Frame holding the grouping columns
+        by: Grouping column names (missing values form their own level)
+
+    Returns:
+        Tuple of (codes, groups): codes in [0, len(groups)) for every row and
+        a DataFrame of the `by` values of each observed group, in code order
+    """
+    levels, columns = [], []
+    for col in by:
+        codes, uniques = pd.factorize(df[col], sort=True, use_na_sentinel=False)
+        columns.append(codes)
+        levels.append(np.asarray(uniques))
+    shape = tuple(len(u) for u in levels)
+    size = int(np.prod(shape, dtype=object)) if shape else 1
+
+    if size >= 2 ** 62:
+        # Mixed-radix code would overflow int64: number the observed rows directly
+        present, codes = np.unique(np.column_stack(columns), axis=0, return_inverse=True)
+        values = present.T
+    else:
+        combined = np.ravel_multi_index(columns, shape) if shape else np.zeros(len(df), dtype=np.intp)
+        if size <= max(4 * len(df), 1024):
+            # Dense: renumber the occupied cells 0..G-1 with one bincount
+            present = np.flatnonzero(np.bincount(combined, minlength=size))
+            remap = np.empty(size, dtype=np.intp)
+            remap[present] = np.arange(len(present))
+            codes = remap[combined]
+        else:
+            present, codes = np.unique(combined, return_inverse=True)
+        values = np.unravel_index(present, shape) if shape else ()
+
+    groups = pd.DataFrame({col: u[idx] for col, u, idx in zip(by, levels, values)})
+    return np.ravel(codes), groups
+
+
+def group_metrics(
+    df: pd.DataFrame,
+    by: Union[str, List[str]],
+    y_true: ArrayOrColumn,
+    y_pred: ArrayOrColumn = None,
+    y_score: ArrayOrColumn = None,
+    threshold: float = 0.5,
+    quantiles: Sequence[float] = (0.1, 0.25, 0.5, 0.75, 0.9),
+    min_size: int = 1,
+) -> pd.DataFrame:
+    """
+    Binary classification metrics for every slice of the `by` columns.
+
+    Args:
+        df: Frame holding the grouping columns (and optionally the targets)
+        by: Grouping column name(s), e.g. ['Department', 'JobRole', 'Gender']
+        y_true: True 0/1 labels, as an array or a column name of df
+        y_pred: Predicted 0/1 labels (default: y_score >= threshold)
+        y_score: Optional predicted risk scores (no NaN) for the distribution columns
+        threshold: Decision threshold used when y_pred is not given
+        quantiles: Score quantiles to report per group
+        min_size: Drop groups with fewer rows
+
+    Returns:
+        DataFrame with one row per observed group: the `by` values, n,
+        tp/fp/fn/tn, base_rate, selection_rate, precision, recall, f1,
+        accuracy, false_positive_rate and, with scores, score_mean,
+        score_std and score_p<q> columns. Ratios with an empty
+        denominator are NaN.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    y = _values(df, y_true).astype(bool)
+    scores = _values(df, y_score)
+    if scores is not None:
+        scores = scores.astype(float)
+    pred = _values(df, y_pred)
+    if pred is None:
+        if scores is None:
+            raise ValueError("Either y_pred or y_score is required")
+        pred = scores >= threshold
+    pred = pred.astype(bool)
+
+    codes, table = group_codes(df, by)
+    n_groups = len(table)
+
+    # Cell 2*y + pred of each group's 2x2 confusion matrix: 0=tn, 1=fp, 2=fn, 3=tp
+    cells = np.bincount(codes * 4 + 2 * y + pred, minlength=4 * n_groups).reshape(n_groups, 4)
+    tn, fp, fn, tp = cells.T
+    n = cells.sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = tp / (tp + fp)
+        recall = tp / (tp + fn)
+        table['n'] = n
+        table['tp'], table['fp'], table['fn'], table['tn'] = tp, fp, fn, tn
+        table['base_rate'] = (tp + fn) / n
+        table['selection_rate'] = (tp + fp) / n
+        table['precision'] = precision
+        table['recall'] = recall
+        table['f1'] = 2 * tp / (2 * tp + fp + fn)
+        table['accuracy'] = (tp + tn) / n
+        table['false_positive_rate'] = fp / (fp + tn)
+
+        if scores is not None:
+            mean = np.bincount(codes, weights=scores, minlength=n_groups) / n
+            sq = np.bincount(codes, weights=scores * scores, minlength=n_groups) / n
+            table['score_mean'] = mean
+            table['score_std'] = np.sqrt(np.maximum(sq - mean * mean, 0.0))
+
+    if scores is not None and len(quantiles):
+        # Sorted by (group, score): each group's scores are one contiguous run.
+        # Stable re-sort of the score order by group code; with at most 65536
+        # groups the codes fit 16 bits and NumPy uses a radix sort.
+        order = np.argsort(scores)
+        group_of = codes.astype(np.min_scalar_type(max(n_groups - 1, 0)))[order]
+        ordered = scores[order[np.argsort(group_of, kind='stable')]]
+        starts = np.cumsum(n) - n
+        for q in quantiles:
+            pos = starts + (n - 1) * q
+            lo = np.floor(pos).astype(np.intp)
+            hi = np.ceil(pos).astype(np.intp)
+            table[f'score_p{round(100 * q):g}'] = ordered[lo] + (pos - lo) * (ordered[hi] - ordered[lo])
+
+    return table[table['n'] >= min_size].reset_index(drop=True)
@@ -4,9 +4,11 @@ Data Preprocessing Utilities
 This module provides functions for data cleaning and preprocessing.
 """
 
+import warnings
+
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Literal, Tuple
+from typing import Any, Optional, List, Dict, Iterable, Iterator, Literal, Tuple, Union
 
 
 def handle_missing_values(
@@ -74,12 +76,141 @@ def handle_missing_values(
     return df, changes
 
 
-def detect_outliers(
+def _outlier_bounds(
+    columns: List[str],
+    q1: np.ndarray,
+    q3: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    method: str,
+    threshold: float
+) -> pd.DataFrame:
+    if method == 'iqr':
+        iqr = q3 - q1
+        lower, upper = q1 - threshold * iqr, q3 + threshold * iqr
+    elif method == 'zscore':
+        lower, upper = mean - threshold * std, mean + threshold * std
+    else:
+        raise ValueError(f"Unknown outlier method: {method}")
+    return pd.DataFrame({'lower_bound': lower, 'upper_bound': upper}, index=columns)
+
+
+def fit_outlier_bounds(
     df: pd.DataFrame,
     columns: Optional[List[str]] = None,
     method: Literal['iqr', 'zscore'] = 'iqr',
     threshold: float = 1.5
-) -> Dict[str, Dict]:
+) -> pd.DataFrame:
+    """
+    Outlier bounds for all columns at once.
+    
+    Quartiles for every column come from one `np.nanquantile` call over the
+    whole numeric block (or mean/std reductions for 'zscore').
+    
+    Args:
+        df: Input DataFrame
+        columns: Specific columns to analyze (defaults to all numeric)
+        method: 'iqr' or 'zscore' (see detect_outliers)
+        threshold: IQR multiplier or number of standard deviations
+        
+    Returns:
+        DataFrame indexed by column with lower_bound and upper_bound
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    X = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    
+    q1 = q3 = mean = std = None
+    with warnings.catch_warnings():
+        # All-missing columns get NaN bounds (and therefore no outliers)
+        warnings.simplefilter('ignore', RuntimeWarning)
+        if method == 'iqr':
+            q1, q3 = np.nanquantile(X, [0.25, 0.75], axis=0)
+        else:
+            mean, std = np.nanmean(X, axis=0), np.nanstd(X, axis=0, ddof=1)
+    return _outlier_bounds(columns, q1, q3, mean, std, method, threshold)
+
+
+def outlier_bounds_from_summary(
+    stats: pd.DataFrame,
+    method: Literal['iqr', 'zscore'] = 'iqr',
+    threshold: float = 1.5
+) -> pd.DataFrame:
+    """
+    Outlier bounds from a `get_summary_statistics` table.
+    
+    With `get_summary_statistics(..., streaming=True)` this fits bounds on
+    data that never fits in memory (quartiles are then sketch estimates).
+    """
+    return _outlier_bounds(stats.index.tolist(), stats['25%'].to_numpy(), stats['75%'].to_numpy(),
+                           stats['mean'].to_numpy(), stats['std'].to_numpy(), method, threshold)
+
+
+def apply_outlier_bounds(
+    df: pd.DataFrame,
+    bounds: pd.DataFrame,
+    packed: bool = False
+) -> Dict[str, Any]:
+    """
+    Flag values outside fitted bounds with one broadcast comparison.
+    
+    Args:
+        df: Rows to check (must contain the columns in bounds.index)
+        bounds: Output of fit_outlier_bounds / outlier_bounds_from_summary
+        packed: Return the mask as a bitmap, 8 rows per byte
+        
+    Returns:
+        Dictionary with:
+        - 'mask': (rows, columns) bool array, or with packed=True a
+          (ceil(rows / 8), columns) uint8 bitmap from `np.packbits(axis=0)`;
+          recover a column with `np.unpackbits(bitmap[:, j], count=n_rows)`
+        - 'counts': outliers per column (Series)
+        - 'n_rows': number of rows checked
+        - 'index': the rows' index
+    """
+    X = df[bounds.index.tolist()].to_numpy(dtype=float, na_value=np.nan)
+    # NaN compares False on both sides, so missing values are never outliers
+    mask = (X < bounds['lower_bound'].to_numpy()) | (X > bounds['upper_bound'].to_numpy())
+    return {
+        'mask': np.packbits(mask, axis=0) if packed else mask,
+        'counts': pd.Series(mask.sum(axis=0), index=bounds.index),
+        'n_rows': len(X),
+        'index': df.index
+    }
+
+
+def iter_outlier_masks(
+    source: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    bounds: pd.DataFrame,
+    chunk_size: int = 100_000,
+    packed: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Apply fitted bounds chunk by chunk.
+    
+    Args:
+        source: DataFrame (split into `chunk_size` rows) or iterable of
+            DataFrame chunks, e.g. `pd.read_csv(path, chunksize=...)`
+        bounds: Fitted outlier bounds
+        chunk_size: Rows per chunk when source is a DataFrame
+        packed: Yield bitmaps instead of bool masks
+        
+    Yields:
+        One `apply_outlier_bounds` result per chunk; sum 'counts' for totals
+    """
+    if isinstance(source, pd.DataFrame):
+        source = (source.iloc[start:start + chunk_size] for start in range(0, len(source), chunk_size))
+    for chunk in source:
+        yield apply_outlier_bounds(chunk, bounds, packed=packed)
+
+
+def detect_outliers(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    method: Literal['iqr', 'zscore'] = 'iqr',
+    threshold: float = 1.5,
+    output: Literal['indices', 'mask', 'bitmap'] = 'indices'
+) -> Dict[str, Any]:
     """
     Detect outliers in numeric columns.
     
@@ -92,39 +223,34 @@ def detect_outliers(
         threshold: Threshold for outlier detection
             - For IQR: multiplier (default 1.5)
             - For zscore: number of standard deviations (default 3)
+        output: Result layout
+            - 'indices': per-column dictionaries with outlier index lists
+            - 'mask': one (rows, columns) bool mask plus counts
+            - 'bitmap': the mask packed 8 rows per byte plus counts
             
     Returns:
-        Dictionary with outlier information per column
+        For 'indices', a dictionary with outlier information per column.
+        Otherwise the `apply_outlier_bounds` dictionary plus 'bounds' and
+        'percentage' (of non-missing values per column).
     """
-    if columns is None:
-        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    bounds = fit_outlier_bounds(df, columns=columns, method=method, threshold=threshold)
+    result = apply_outlier_bounds(df, bounds, packed=output == 'bitmap')
+    non_missing = df[bounds.index.tolist()].notna().sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentage = result['counts'] / non_missing * 100
     
-    outlier_info = {}
+    if output != 'indices':
+        return {**result, 'bounds': bounds, 'percentage': percentage}
     
-    for col in columns:
-        series = df[col].dropna()
-        
-        if method == 'iqr':
-            q1 = series.quantile(0.25)
-            q3 = series.quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - threshold * iqr
-            upper_bound = q3 + threshold * iqr
-            outliers = series[(series < lower_bound) | (series > upper_bound)]
-        else:  # zscore
-            mean = series.mean()
-            std = series.std()
-            z_scores = np.abs((series - mean) / std)
-            outliers = series[z_scores > threshold]
-            lower_bound = mean - threshold * std
-            upper_bound = mean + threshold * std
-        
+    mask = result['mask']
+    outlier_info = {}
+    for j, col in enumerate(bounds.index):
         outlier_info[col] = {
-            'count': len(outliers),
-            'percentage': len(outliers) / len(series) * 100,
-            'lower_bound': lower_bound,
-            'upper_bound': upper_bound,
-            'indices': outliers.index.tolist()
+            'count': int(result['counts'][col]),
+            'percentage': percentage[col],
+            'lower_bound': bounds.at[col, 'lower_bound'],
+            'upper_bound': bounds.at[col, 'upper_bound'],
+            'indices': df.index[mask[:, j]].tolist()
         }
     
     return outlier_info
@@ -0,0 +1,296 @@
+"""
+Streaming Summary Statistics
+
+Mergeable accumulators behind `eda.get_summary_statistics(streaming=True)`.
+Each chunk is reduced to per-column moments and quantile-sketch counts in
+one vectorized pass; accumulators from different chunks or worker processes
+combine exactly with `merge`, so a frame can be profiled out-of-core or in
+parallel without holding it in memory.
+
+- MomentAccumulator: count, mean and central moments M2-M4, merged with
+  the Chan/Pebay pairwise update (numerically stable, unlike raw power sums)
+- QuantileSketch: log-bucketed histogram (DDSketch-style) whose quantiles
+  are within `relative_accuracy` of an exact value; merging adds counts
+"""
+
+from typing import Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+class MomentAccumulator:
+    """
+    Per-column count, mean, central moments M2..M4, min and max.
+    """
+
+    def __init__(self, n_columns: int):
+        self.n = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.m3 = np.zeros(n_columns)
+        self.m4 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.nan)
+        self.max = np.full(n_columns, np.nan)
+
+    @classmethod
+    def from_array(cls, X: np.ndarray) -> 'MomentAccumulator':
+        """Moments of one (rows, columns) block; NaN values are skipped."""
+        X = np.asarray(X, dtype=float)
+        acc = cls(X.shape[1])
+        observed = ~np.isnan(X)
+        acc.n = observed.sum(axis=0).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            acc.mean = np.where(acc.n > 0, np.where(observed, X, 0.0).sum(axis=0) / acc.n, 0.0)
+        d = np.where(observed, X - acc.mean, 0.0)
+        d2 = d * d
+        acc.m2 = d2.sum(axis=0)
+        acc.m3 = (d2 * d).sum(axis=0)
+        acc.m4 = (d2 * d2).sum(axis=0)
+        if len(X):
+            acc.min = np.fmin.reduce(X, axis=0)
+            acc.max = np.fmax.reduce(X, axis=0)
+        return acc
+
+    def update(self, X: np.ndarray) -> 'MomentAccumulator':
+        """Fold one more block of rows into the accumulator."""
+        return self.merge(MomentAccumulator.from_array(X))
+
+    def merge(self, other: 'MomentAccumulator') -> 'MomentAccumulator':
+        """Combine with another accumulator in place (Chan et al. / Pebay 2008)."""
+        na, nb = self.n, other.n
+        n = na + nb
+        safe = np.where(n > 0, n, 1.0)
+        delta = other.mean - self.mean
+        d_n = delta / safe
+        d_n2 = d_n * d_n
+
+        m4 = (self.m4 + other.m4
+              + delta * d_n * d_n2 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * d_n2 * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * d_n * (na * other.m3 - nb * self.m3))
+        m3 = (self.m3 + other.m3
+              + delta * d_n2 * na * nb * (na - nb)
+              + 3 * d_n * (na * other.m2 - nb * self.m2))
+        self.m2 = self.m2 + other.m2 + delta * d_n * na * nb
+        self.m3, self.m4 = m3, m4
+        self.mean = self.mean + d_n * nb
+        self.n = n
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Sample variance (ddof=1)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.n > 1, self.m2 / (self.n - 1), np.nan)
+
+    @property
+    def skew(self) -> np.ndarray:
+        """Bias-corrected sample skewness, as `DataFrame.skew`."""
+        n, m2 = self.n, self.m2 / np.maximum(self.n, 1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            g1 = (self.m3 / np.maximum(n, 1)) / m2 ** 1.5
+            G1 = np.sqrt(n * (n - 1)) / (n - 2) * g1
+        return np.where(n < 3, np.nan, np.where(m2 == 0, 0.0, G1))
+
+    @property
+    def kurtosis(self) -> np.ndarray:
+        """Bias-corrected excess kurtosis, as `DataFrame.kurtosis`."""
+        n, m2 = self.n, self.m2 / np.maximum(self.n, 1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            g2 = (self.m4 / np.maximum(n, 1)) / (m2 * m2) - 3.0
+            G2 = (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * g2 + 6.0)
+        return np.where(n < 4, np.nan, np.where(m2 == 0, 0.0, G2))
+
+
+class QuantileSketch:
+    """
+    Mergeable per-column quantile sketch with bounded relative error.
+
+    Values are counted in logarithmic buckets [gamma^(k-1), gamma^k) with
+    gamma = (1 + a) / (1 - a), separately for each sign, plus a zero bucket
+    for |x| < min_value. Reporting each bucket's midpoint keeps every
+    quantile within relative error `a` of an observed value; magnitudes
+    above max_value fall into the last bucket. Memory is fixed per column
+    (about 2 * log(max_value / min_value) / (2a) buckets).
+    """
+
+    def __init__(self, n_columns: int, relative_accuracy: float = 0.01,
+                 min_value: float = 1e-9, max_value: float = 1e15):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        self._offset = int(np.ceil(np.log(min_value) / self._log_gamma))
+        self.n_buckets = int(np.ceil(np.log(max_value) / self._log_gamma)) - self._offset + 1
+        # counts[:, 0] = negatives, counts[:, 1] = positives; zeros counted separately
+        self.counts = np.zeros((n_columns, 2, self.n_buckets), dtype=np.int64)
+        self.zeros = np.zeros(n_columns, dtype=np.int64)
+
+    def update(self, X: np.ndarray) -> 'QuantileSketch':
+        """Count one (rows, columns) block; NaN values are skipped."""
+        X = np.asarray(X, dtype=float)
+        p = X.shape[1]
+        cols = np.broadcast_to(np.arange(p), X.shape)
+        magnitude = np.abs(X)
+        zero = magnitude < self.min_value
+        self.zeros += np.bincount(cols[zero], minlength=p)
+
+        keep = ~zero & ~np.isnan(X)
+        with np.errstate(divide='ignore'):
+            key = np.ceil(np.log(magnitude[keep]) / self._log_gamma).astype(np.int64) - self._offset
+        key = np.clip(key, 0, self.n_buckets - 1)
+        flat = (cols[keep] * 2 + (X[keep] > 0)) * self.n_buckets + key
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Combine with a sketch built with the same settings, in place."""
+        if (other.counts.shape != self.counts.shape or other.gamma != self.gamma
+                or other.min_value != self.min_value):
+            raise ValueError("Can only merge sketches with identical settings")
+        self.counts += other.counts
+        self.zeros += other.zeros
+        return self
+
+    @property
+    def count(self) -> np.ndarray:
+        return self.counts.sum(axis=(1, 2)) + self.zeros
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Approximate quantiles for every column.
+
+        Returns:
+            Array of shape (columns, len(qs)); NaN for empty columns
+        """
+        # Buckets in value order: negatives from largest magnitude, zero, positives
+        ordered = np.concatenate([self.counts[:, 0, ::-1], self.zeros[:, None], self.counts[:, 1]], axis=1)
+        cumulative = np.cumsum(ordered, axis=1)
+        keys = np.arange(self.n_buckets) + self._offset
+        mid = 2 * self.gamma ** keys / (self.gamma + 1)
+        values = np.concatenate([-mid[::-1], [0.0], mid])
+
+        total = cumulative[:, -1]
+        out = np.full((len(total), len(qs)), np.nan)
+        for k, q in enumerate(qs):
+            rank = q * (total - 1)
+            bucket = (cumulative > rank[:, None]).argmax(axis=1)
+            out[:, k] = np.where(total > 0, values[bucket], np.nan)
+        return out
+
+
+class SummaryAccumulator:
+    """
+    Moments plus quantile sketch for a fixed set of numeric columns.
+
+    Build one per chunk (or per worker) with `update`, combine them with
+    `merge` and read the `get_summary_statistics` table from `summary`.
+    """
+
+    def __init__(self, columns: List[str], relative_accuracy: float = 0.01):
+        self.columns = list(columns)
+        self.moments = MomentAccumulator(len(self.columns))
+        self.sketch = QuantileSketch(len(self.columns), relative_accuracy=relative_accuracy)
+
+    def update(self, chunk: Union[pd.DataFrame, np.ndarray]) -> 'SummaryAccumulator':
+        """Fold one chunk of rows (DataFrame columns are matched by name)."""
+        if isinstance(chunk, pd.DataFrame):
+            chunk = chunk[self.columns].to_numpy(dtype=float, na_value=np.nan)
+        self.moments.update(chunk)
+        self.sketch.update(chunk)
+        return self
+
+    def merge(self, other: 'SummaryAccumulator') -> 'SummaryAccumulator':
+        """Combine with an accumulator over the same columns, in place."""
+        if other.columns != self.columns:
+            raise ValueError("Can only merge accumulators over the same columns")
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def summary(self) -> pd.DataFrame:
+        """Statistics in the layout of `get_summary_statistics`."""
+        m = self.moments
+        quartiles = self.sketch.quantiles([0.25, 0.5, 0.75])
+        stats = pd.DataFrame({
+            'count': m.n,
+            'mean': np.where(m.n > 0, m.mean, np.nan),
+            'std': np.sqrt(m.variance),
+            'min': m.min,
+            '25%': quartiles[:, 0],
+            '50%': quartiles[:, 1],
+            '75%': quartiles[:, 2],
+            'max': m.max,
+        }, index=self.columns)
+        # Sketch buckets are midpoints; never report a quartile outside the data range
+        stats[['25%', '50%', '75%']] = stats[['25%', '50%', '75%']].clip(stats['min'], stats['max'], axis=0)
+        stats['median'] = stats['50%']
+        stats['skew'] = m.skew
+        stats['kurtosis'] = m.kurtosis
+        stats['iqr'] = stats['75%'] - stats['25%']
+        return stats
+
+
+def _accumulate(chunk: pd.DataFrame, columns: List[str], relative_accuracy: float) -> SummaryAccumulator:
+    return SummaryAccumulator(columns, relative_accuracy).update(chunk)
+
+
+def _chunks(df: pd.DataFrame, chunk_size: int) -> Iterable[pd.DataFrame]:
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def streaming_summary(
+    source: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    columns: Optional[List[str]] = None,
+    chunk_size: int = 100_000,
+    n_jobs: int = 1,
+    relative_accuracy: float = 0.01,
+) -> SummaryAccumulator:
+    """
+    Accumulate summary statistics over a frame or an iterable of chunks.
+
+    Args:
+        source: DataFrame (split into `chunk_size` rows) or iterable of
+            DataFrame chunks, e.g. `pd.read_csv(path, chunksize=...)`
+        columns: Columns to profile (default: numeric columns of the first chunk)
+        chunk_size: Rows per chunk when source is a DataFrame
+        n_jobs: Worker processes reducing chunks (1 = in this process)
+        relative_accuracy: Relative error bound of the quantile sketch
+
+    Returns:
+        Merged SummaryAccumulator
+    """
+    from itertools import chain
+
+    chunks = iter(_chunks(source, chunk_size) if isinstance(source, pd.DataFrame) else source)
+    first = next(chunks, None)
+    if columns is None:
+        columns = [] if first is None else first.select_dtypes(include=[np.number]).columns.tolist()
+    else:
+        columns = first[columns].select_dtypes(include=[np.number]).columns.tolist() if first is not None else []
+
+    total = SummaryAccumulator(columns, relative_accuracy)
+    if first is None:
+        return total
+    chunks = chain([first], chunks)
+    if n_jobs == 1:
+        for chunk in chunks:
+            total.update(chunk)
+        return total
+
+    from joblib import Parallel, delayed
+
+    # Results stream back as workers finish, so only a few chunks are in flight
+    parts = Parallel(n_jobs=n_jobs, return_as='generator')(
+        delayed(_accumulate)(chunk, columns, relative_accuracy) for chunk in chunks
+    )
+    for part in parts:
+        total.merge(part)
+    return total
@@ -0,0 +1,317 @@
+"""
+Model Explanation Engine
+
+Per-employee feature attributions for the attrition models:
+- Linear models use closed-form SHAP values (coef * (x - mean)), no sampling.
+- Tree models run shap.TreeExplainer over row batches in worker processes.
+- Results are cached on disk keyed by model and data hash.
+"""
+
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def model_hash(model) -> str:
+    """Stable content hash of a fitted model."""
+    return hashlib.sha256(pickle.dumps(model, protocol=4)).hexdigest()
+
+
+def data_hash(X) -> str:
+    """Content hash of a feature matrix (values, column names and dtypes)."""
+    h = hashlib.sha256()
+    if isinstance(X, pd.DataFrame):
+        h.update('|'.join(map(str, X.columns)).encode())
+        h.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+    else:
+        arr = np.ascontiguousarray(X)
+        h.update(str((arr.shape, arr.dtype)).encode())
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+class ExplanationCache:
+    """
+    On-disk store of attribution matrices, one `.npz` per (model, data) pair.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, float]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            return data['values'], float(data['base_value'])
+
+    def put(self, key: str, values: np.ndarray, base_value: float) -> None:
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp = self._path(key).with_suffix('.tmp.npz')
+        np.savez(tmp, values=values, base_value=base_value)
+        tmp.replace(self._path(key))
+
+
+def linear_shap_values(model, X, background=None) -> Tuple[np.ndarray, float]:
+    """
+    Exact SHAP values for a linear model in log-odds space.
+
+    With independent features, the SHAP value of feature j is
+    coef_j * (x_j - E[x_j]), so the whole matrix is one broadcasted product.
+
+    Args:
+        model: Fitted model exposing `coef_` and `intercept_`
+        X: Features to explain
+        background: Data defining E[x] (defaults to X itself)
+
+    Returns:
+        Tuple of (attribution matrix of shape (n, p), base value)
+    """
+    coef = np.asarray(model.coef_, dtype=float).ravel()
+    X_arr = np.asarray(X, dtype=float)
+    mean = np.asarray(background if background is not None else X_arr, dtype=float).mean(axis=0)
+    base_value = float(np.ravel(model.intercept_)[0] + mean @ coef)
+    return (X_arr - mean) * coef, base_value
+
+
+def _positive_class(values) -> np.ndarray:
+    """Normalise TreeExplainer output to the positive-class (n, p) matrix."""
+    if isinstance(values, list):
+        values = values[-1]
+    values = np.asarray(values)
+    if values.ndim == 3:
+        values = values[:, :, -1]
+    return values
+
+
+def _tree_batch(model, X_batch) -> np.ndarray:
+    import shap
+
+    return _positive_class(shap.TreeExplainer(model).shap_values(X_batch))
+
+
+def tree_shap_values(model, X, batch_size: int = 5000, n_jobs: int = -1) -> Tuple[np.ndarray, float]:
+    """
+    TreeExplainer SHAP values computed over row batches in parallel processes.
+
+    Args:
+        model: Fitted tree model (XGBoost, RandomForest, GradientBoosting)
+        X: Features to explain
+        batch_size: Rows per TreeExplainer call
+        n_jobs: Worker processes (-1 = all cores)
+
+    Returns:
+        Tuple of (attribution matrix of shape (n, p), base value)
+    """
+    import shap
+    from joblib import Parallel, delayed
+
+    n_rows = len(X)
+    starts = range(0, n_rows, batch_size)
+    take = (lambda a, b: X.iloc[a:b]) if isinstance(X, pd.DataFrame) else (lambda a, b: X[a:b])
+
+    if len(starts) <= 1 or n_jobs == 1:
+        parts = [_tree_batch(model, take(s, s + batch_size)) for s in starts]
+    else:
+        parts = Parallel(n_jobs=n_jobs)(
+            delayed(_tree_batch)(model, take(s, s + batch_size)) for s in starts
+        )
+
+    base_value = np.ravel(shap.TreeExplainer(model).expected_value)[-1]
+    return np.vstack(parts), float(base_value)
+
+
+def explain_model(
+    model,
+    X,
+    background=None,
+    batch_size: int = 5000,
+    n_jobs: int = -1,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Tuple[np.ndarray, float]:
+    """
+    Per-row feature attributions for a fitted attrition model.
+
+    Dispatches to the closed-form linear path for models with `coef_` and to
+    batched TreeExplainer otherwise. When `cache_dir` is given, results are
+    served from disk for a previously seen (model, data) pair.
+
+    Args:
+        model: Fitted model
+        X: Features to explain
+        background: Reference data for linear attributions (defaults to X)
+        batch_size: Rows per TreeExplainer call (tree models only)
+        n_jobs: Worker processes for tree models
+        cache_dir: Optional directory for the explanation cache
+
+    Returns:
+        Tuple of (attribution matrix of shape (n, p), base value)
+    """
+    cache = ExplanationCache(cache_dir) if cache_dir is not None else None
+    key = None
+    if cache is not None:
+        key = model_hash(model) + '-' + data_hash(X)
+        if background is not None:
+            key += '-' + data_hash(background)[:16]
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    if hasattr(model, 'coef_'):
+        values, base_value = linear_shap_values(model, X, background=background)
+    else:
+        values, base_value = tree_shap_values(model, X, batch_size=batch_size, n_jobs=n_jobs)
+
+    if cache is not None:
+        cache.put(key, values, base_value)
+    return values, base_value
+
+
+def top_k_reasons(
+    contributions: np.ndarray,
+    feature_names,
+    k: int = 3,
+    index=None,
+) -> pd.DataFrame:
+    """
+    Top-k risk-increasing features for every row of a contribution matrix.
+
+    Uses `np.argpartition` to pick the k largest contributions per row in
+    O(n * p), then orders only those k columns, so the cost stays linear in the
+    population size. Only positive contributions count as reasons: a row with
+    fewer than k of them gets an empty name and a NaN impact in the
+    remaining slots.
+
+    Args:
+        contributions: Attribution matrix of shape (n, p), e.g. from `explain_model`
+        feature_names: Names of the p features
+        k: Number of reasons per row
+        index: Optional index for the returned frame (e.g. the rows of X)
+
+    Returns:
+        DataFrame with columns TopReason1..k and TopReason1Impact..k
+    """
+    contributions = np.asarray(contributions, dtype=float)
+    names = np.asarray(feature_names, dtype=object)
+    k = min(k, contributions.shape[1])
+
+    top = np.argpartition(-contributions, k - 1, axis=1)[:, :k]
+    top_vals = np.take_along_axis(contributions, top, axis=1)
+    order = np.argsort(-top_vals, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    top_vals = np.take_along_axis(top_vals, order, axis=1)
+
+    # Features that lower the risk are not reasons for it
+    increases = top_vals > 0
+    columns = {}
+    for i in range(k):
+        columns[f'TopReason{i + 1}'] = np.where(increases[:, i], names[top[:, i]], '')
+        columns[f'TopReason{i + 1}Impact'] = np.where(increases[:, i], np.round(top_vals[:, i], 4), np.nan)
+    return pd.DataFrame(columns, index=index)
+
+
+def _permuted_block(model, X: np.ndarray, base: np.ndarray, features, perms: np.ndarray):
+    """Score every (feature, repeat) permutation of X in one predict_proba call."""
+    n = X.shape[0]
+    n_repeats = perms.shape[0]
+    stacked = np.tile(X, (len(features) * n_repeats, 1))
+    delta_x = np.empty((len(features), n_repeats, n))
+    for i, j in enumerate(features):
+        for r in range(n_repeats):
+            rows = slice((i * n_repeats + r) * n, (i * n_repeats + r + 1) * n)
+            stacked[rows, j] = X[perms[r], j]
+            delta_x[i, r] = stacked[rows, j] - X[:, j]
+    delta_p = model.predict_proba(stacked)[:, 1].reshape(len(features), n_repeats, n) - base
+
+    importance = np.abs(delta_p).mean(axis=(1, 2))
+    # Direction: sign of the average slope between the feature shift and the risk shift
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = (delta_x * delta_p).sum(axis=(1, 2)) / (delta_x ** 2).sum(axis=(1, 2))
+    return np.column_stack([importance, np.nan_to_num(slope)])
+
+
+def permutation_importance(
+    model,
+    X,
+    n_repeats: int = 3,
+    features_per_batch: int = 8,
+    max_rows: Optional[int] = 2000,
+    n_jobs: int = -1,
+    random_state: int = 42,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> pd.DataFrame:
+    """
+    Label-free permutation importance with a signed direction for any classifier.
+
+    For each feature, its column is shuffled and the mean absolute change in
+    predicted risk is the importance. The direction is the sign of the slope
+    between the shift in the feature value and the shift in risk. All
+    permutations for a batch of features go through one stacked
+    `predict_proba` call; batches run on a thread pool.
+
+    Args:
+        model: Fitted classifier with predict_proba
+        X: Features (DataFrame keeps column names in the output)
+        n_repeats: Shuffles per feature
+        features_per_batch: Features scored per stacked predict_proba call
+        max_rows: Row subsample bounding the stacked matrix (None = all rows)
+        n_jobs: Threads for feature batches (-1 = all cores)
+        random_state: Seed for subsampling and shuffles
+        cache_dir: Optional directory for caching results per model/data hash
+
+    Returns:
+        DataFrame indexed by feature with importance and direction (+1 / -1 / 0),
+        sorted by importance
+    """
+    from joblib import Parallel, delayed
+
+    names = list(X.columns) if isinstance(X, pd.DataFrame) else [f'f{j}' for j in range(np.shape(X)[1])]
+    X_arr = np.asarray(X, dtype=float)
+    rng = np.random.default_rng(random_state)
+    if max_rows is not None and len(X_arr) > max_rows:
+        X_arr = X_arr[np.sort(rng.choice(len(X_arr), max_rows, replace=False))]
+
+    cache = ExplanationCache(cache_dir) if cache_dir is not None else None
+    key, result = None, None
+    if cache is not None:
+        key = f"perm-{model_hash(model)}-{data_hash(X_arr)}-{n_repeats}-{random_state}"
+        hit = cache.get(key)
+        if hit is not None:
+            result = hit[0]
+    if result is None:
+        # Predict on a DataFrame when the model was fitted on one, to keep names consistent
+        predictor = model
+        if hasattr(model, 'feature_names_in_'):
+            predictor = _FramePredictor(model, names)
+        base = predictor.predict_proba(X_arr)[:, 1]
+        perms = np.vstack([rng.permutation(len(X_arr)) for _ in range(n_repeats)])
+        batches = [list(range(s, min(s + features_per_batch, len(names))))
+                   for s in range(0, len(names), features_per_batch)]
+        parts = Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(_permuted_block)(predictor, X_arr, base, batch, perms) for batch in batches
+        )
+        result = np.vstack(parts)
+        if cache is not None:
+            cache.put(key, result, float(base.mean()))
+
+    out = pd.DataFrame({'importance': result[:, 0], 'direction': np.sign(result[:, 1])}, index=names)
+    return out.sort_values('importance', ascending=False)
+
+
+class _FramePredictor:
+    """Wraps a model fitted on a DataFrame so arrays are re-labelled before predict_proba."""
+
+    def __init__(self, model, columns):
+        self.model = model
+        self.columns = columns
+
+    def predict_proba(self, X):
+        return self.model.predict_proba(pd.DataFrame(X, columns=self.columns))
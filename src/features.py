@@ -1,9 +1,9 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import StratifiedShuffleSplit
-from sklearn.preprocessing import OneHotEncoder, MinMaxScaler, OrdinalEncoder
 from typing import Tuple, List
 
+# sklearn is imported inside the functions that need it to keep module import cheap.
+
 def calculate_tenure_ratio(df: pd.DataFrame) -> pd.DataFrame:
     """
     Creates 'TenureRatio': YearsAtCompany / TotalWorkingYears
@@ -44,6 +44,34 @@ def calculate_satisfaction_composite(df: pd.DataFrame) -> pd.DataFrame:
     df['SatisfactionComposite'] = df[cols].mean(axis=1)
     return df
 
+# Engineered features -> (raw input columns, constructor). Lets callers recompute
+# only the derived columns affected by a change to their inputs.
+DERIVED_FEATURES = {
+    'TenureRatio': (['YearsAtCompany', 'TotalWorkingYears'], calculate_tenure_ratio),
+    'PromotionStagnation': (['YearsInCurrentRole', 'YearsSinceLastPromotion'], calculate_promotion_stagnation),
+    'IncomeStability': (['MonthlyIncome', 'Age'], calculate_income_stability),
+    'SatisfactionComposite': (['JobSatisfaction', 'EnvironmentSatisfaction',
+                               'RelationshipSatisfaction', 'WorkLifeBalance'], calculate_satisfaction_composite),
+}
+
+# Nominal columns one-hot encoded by encode_features (dummies are named '<col>_<value>')
+NOMINAL_COLUMNS = ['Department', 'JobRole', 'MaritalStatus', 'EducationField', 'Gender', 'BusinessTravel']
+
+def required_raw_columns(features: List[str]) -> List[str]:
+    """
+    Raw input columns needed to build the given engineered features.
+    Derived features expand to their inputs and dummy columns to their source
+    column, e.g. for a pruned sparse model that only uses a few features.
+    """
+    raw = []
+    for feature in features:
+        if feature in DERIVED_FEATURES:
+            raw.extend(DERIVED_FEATURES[feature][0])
+            continue
+        source = next((c for c in NOMINAL_COLUMNS if feature.startswith(c + '_')), feature)
+        raw.append(source)
+    return list(dict.fromkeys(raw))
+
 def encode_features(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
     """
     Applies One-Hot Encoding to nominal variables and Label Encoding to target.
@@ -56,7 +84,7 @@ def encode_features(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
         df['Attrition'] = df['Attrition'].map({'Yes': 1, 'No': 0})
         
     # 2. One-Hot Encoding
-    nominal_cols = ['Department', 'JobRole', 'MaritalStatus', 'EducationField', 'Gender', 'BusinessTravel']
+    nominal_cols = NOMINAL_COLUMNS
     # 'OverTime' is binary Yes/No, map it manually or OHE. Let's map it.
     if 'OverTime' in df.columns:
         df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
@@ -66,16 +94,38 @@ def encode_features(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
     
     return df
 
+def encode_features_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Encoding for models with native categorical support (LightGBM, XGBoost
+    with enable_categorical=True): nominal columns become `category` dtype
+    instead of one-hot dummies, keeping the design matrix narrow.
+    """
+    df = df.copy()
+
+    if 'Attrition' in df.columns:
+        df['Attrition'] = df['Attrition'].map({'Yes': 1, 'No': 0})
+    if 'OverTime' in df.columns:
+        df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
+
+    for col in NOMINAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    return df
+
 def scale_features(df: pd.DataFrame, target_col: str = 'Attrition') -> pd.DataFrame:
     """
     Scales numerical features using MinMaxScaler.
     Excludes the target column and EmployeeNumber if present.
     """
+    from sklearn.preprocessing import MinMaxScaler
+
     df = df.copy()
     scaler = MinMaxScaler()
     
     exclusions = [target_col, 'EmployeeNumber']
-    feature_cols = [c for c in df.columns if c not in exclusions]
+    feature_cols = [c for c in df.columns
+                    if c not in exclusions and not isinstance(df[c].dtype, pd.CategoricalDtype)]
     
     df[feature_cols] = scaler.fit_transform(df[feature_cols])
     return df
@@ -94,11 +144,15 @@ def scale_train_test(X_train: pd.DataFrame, X_test: pd.DataFrame,
     Returns:
         Tuple of (X_train_scaled, X_test_scaled)
     """
+    from sklearn.preprocessing import MinMaxScaler
+
     scaler = MinMaxScaler()
     
     # Exclude target and ID columns if present
     exclusions = [target_col, 'EmployeeNumber']
-    feature_cols = [c for c in X_train.columns if c not in exclusions]
+    # Native categorical columns (encode_features_categorical) are left unscaled
+    feature_cols = [c for c in X_train.columns
+                    if c not in exclusions and not isinstance(X_train[c].dtype, pd.CategoricalDtype)]
     
     # Fit on TRAIN only - this is the key to preventing leakage
     scaler.fit(X_train[feature_cols])
@@ -112,13 +166,16 @@ def scale_train_test(X_train: pd.DataFrame, X_test: pd.DataFrame,
     
     return X_train_scaled, X_test_scaled
 
-def perform_feature_engineering(df: pd.DataFrame, scale: bool = False) -> pd.DataFrame:
+def perform_feature_engineering(df: pd.DataFrame, scale: bool = False,
+                                native_categorical: bool = False) -> pd.DataFrame:
     """
     Pipeline wrapper for feature construction and encoding steps.
     
     Args:
         df: Input dataframe
         scale: If True, applies scaling (NOT recommended - use scale_train_test instead)
+        native_categorical: If True, keep nominal columns as `category` dtype
+            (see encode_features_categorical) instead of one-hot encoding
     
     Returns:
         Encoded dataframe ready for train/test split
@@ -134,7 +191,7 @@ def perform_feature_engineering(df: pd.DataFrame, scale: bool = False) -> pd.Dat
     df = calculate_satisfaction_composite(df)
     
     # 2. Encoding
-    df = encode_features(df)
+    df = encode_features_categorical(df) if native_categorical else encode_features(df)
     
     # 3. Scaling - Only if explicitly requested (legacy support)
     # WARNING: Scaling before split causes data leakage!
@@ -147,6 +204,8 @@ def split_data(df: pd.DataFrame, target_col: str = 'Attrition') -> Tuple[pd.Data
     """
     Performs Stratified Split (80/20).
     """
+    from sklearn.model_selection import StratifiedShuffleSplit
+
     split = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
     
     X = df.drop(columns=[target_col])
@@ -0,0 +1,263 @@
+"""
+Portable Inference Bundles
+
+Compiles fitted models into plain NumPy arrays and scores them with a small
+vectorized evaluator, so scoring processes only need NumPy:
+- Logistic regression -> weight vector + bias
+- Tree ensembles (RandomForest, GradientBoosting, XGBoost) -> flat node tables
+
+Only the export step touches sklearn/xgboost objects; `load_bundle` and
+`predict_proba_bundle` import nothing beyond NumPy and the standard library.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+BUNDLE_VERSION = 1
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _feature_names(model, feature_names: Optional[List[str]]) -> Optional[List[str]]:
+    if feature_names is not None:
+        return list(feature_names)
+    names = getattr(model, 'feature_names_in_', None)
+    return [str(n) for n in names] if names is not None else None
+
+
+def _export_linear(model) -> Dict[str, Any]:
+    return {
+        'kind': 'linear',
+        'weights': np.asarray(model.coef_, dtype=np.float64).ravel(),
+        'bias': np.float64(np.ravel(model.intercept_)[0]),
+    }
+
+
+def _stack_trees(trees: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Concatenate per-tree node tables, re-basing child indices to global offsets."""
+    offsets = np.cumsum([0] + [len(t['feature']) for t in trees[:-1]])
+    left, right = [], []
+    for t, off in zip(trees, offsets):
+        is_leaf = t['left'] < 0
+        left.append(np.where(is_leaf, -1, t['left'] + off))
+        right.append(np.where(is_leaf, -1, t['right'] + off))
+    return {
+        'roots': offsets.astype(np.int32),
+        'feature': np.concatenate([t['feature'] for t in trees]).astype(np.int32),
+        'threshold': np.concatenate([t['threshold'] for t in trees]).astype(np.float64),
+        'left': np.concatenate(left).astype(np.int32),
+        'right': np.concatenate(right).astype(np.int32),
+        'default_left': np.concatenate([t['default_left'] for t in trees]).astype(bool),
+        'value': np.concatenate([t['value'] for t in trees]).astype(np.float64),
+        'max_depth': np.int32(max(t['depth'] for t in trees)),
+    }
+
+
+def _sklearn_tree(tree, leaf_value: np.ndarray) -> Dict[str, np.ndarray]:
+    missing_left = getattr(tree, 'missing_go_to_left', None)
+    return {
+        'feature': np.maximum(tree.feature, 0),
+        'threshold': tree.threshold,
+        'left': tree.children_left,
+        'right': tree.children_right,
+        'default_left': missing_left if missing_left is not None else np.ones(tree.node_count, dtype=bool),
+        'value': leaf_value,
+        'depth': tree.max_depth,
+    }
+
+
+def _export_random_forest(model) -> Dict[str, Any]:
+    if len(model.classes_) != 2:
+        raise ValueError(f"Only binary {type(model).__name__} models can be exported")
+    trees = []
+    for est in model.estimators_:
+        counts = est.tree_.value[:, 0, :]
+        proba = counts / counts.sum(axis=1, keepdims=True)
+        trees.append(_sklearn_tree(est.tree_, proba[:, -1]))
+    bundle = _stack_trees(trees)
+    bundle.update({'kind': 'tree_ensemble', 'aggregation': 'mean', 'comparison': 'le',
+                   'base_margin': np.float64(0.0)})
+    return bundle
+
+
+def _export_gradient_boosting(model) -> Dict[str, Any]:
+    if model.estimators_.shape[1] != 1:
+        raise ValueError("Only binary GradientBoostingClassifier models can be exported")
+    lr = model.learning_rate
+    trees = [_sklearn_tree(est.tree_, lr * est.tree_.value[:, 0, 0]) for est in model.estimators_[:, 0]]
+    bundle = _stack_trees(trees)
+    bundle.update({'kind': 'tree_ensemble', 'aggregation': 'sum_logit', 'comparison': 'le',
+                   'base_margin': np.float64(0.0)})
+
+    # The init estimator's margin is whatever the trees do not explain on a probe row
+    probe = np.zeros((1, model.n_features_in_))
+    names = getattr(model, 'feature_names_in_', None)
+    if names is not None:
+        import pandas as pd
+        margin = float(np.ravel(model.decision_function(pd.DataFrame(probe, columns=names)))[0])
+    else:
+        margin = float(np.ravel(model.decision_function(probe))[0])
+    bundle['base_margin'] = np.float64(margin - _tree_sum(bundle, probe)[0])
+    return bundle
+
+
+def _export_xgboost(model, feature_names: Optional[List[str]]) -> Dict[str, Any]:
+    booster = model.get_booster()
+    objective = json.loads(booster.save_config())['learner']['objective']['name']
+    if getattr(model, 'n_classes_', 2) != 2 or objective != 'binary:logistic':
+        raise ValueError(f"Only binary:logistic XGBoost models can be exported (got {objective})")
+    df = booster.trees_to_dataframe()
+    if 'Category' in df.columns and df['Category'].notna().any():
+        raise ValueError("Categorical XGBoost splits cannot be exported to a NumPy bundle")
+
+    names = booster.feature_names or feature_names
+    index = {name: i for i, name in enumerate(names)} if names else None
+
+    trees = []
+    for _, t in df.groupby('Tree', sort=True):
+        t = t.sort_values('Node')
+        local = {node_id: i for i, node_id in enumerate(t['ID'])}
+        is_leaf = (t['Feature'] == 'Leaf').to_numpy()
+        feat = [0 if leaf else (index[f] if index else int(f.lstrip('f')))
+                for f, leaf in zip(t['Feature'], is_leaf)]
+        left = np.array([-1 if leaf else local[y] for y, leaf in zip(t['Yes'], is_leaf)])
+        right = np.array([-1 if leaf else local[n] for n, leaf in zip(t['No'], is_leaf)])
+        missing = np.array([-1 if leaf else local[m] for m, leaf in zip(t['Missing'], is_leaf)])
+        trees.append({
+            'feature': np.array(feat),
+            # Round-trip through float32 so thresholds equal XGBoost's stored values
+            'threshold': np.nan_to_num(t['Split'].to_numpy(dtype=float)).astype(np.float32),
+            'left': left,
+            'right': right,
+            'default_left': missing == left,
+            'value': np.where(is_leaf, t['Gain'].to_numpy(dtype=float), 0.0),
+            'depth': _depth(left, right),
+        })
+    bundle = _stack_trees(trees)
+    bundle.update({'kind': 'tree_ensemble', 'aggregation': 'sum_logit', 'comparison': 'lt',
+                   'base_margin': np.float64(0.0)})
+
+    # Recover the base margin from the booster itself so it is exact across
+    # XGBoost versions (base_score storage has changed between releases).
+    import xgboost as xgb
+    probe = np.zeros((1, model.n_features_in_))
+    margin = booster.predict(xgb.DMatrix(probe, feature_names=names), output_margin=True)[0]
+    bundle['base_margin'] = np.float64(margin - _tree_sum(bundle, probe)[0])
+    return bundle
+
+
+def _depth(left: np.ndarray, right: np.ndarray) -> int:
+    depth, frontier = 0, np.array([0])
+    while True:
+        children = np.concatenate([left[frontier], right[frontier]])
+        frontier = children[children >= 0]
+        if frontier.size == 0:
+            return depth
+        depth += 1
+
+
+def export_bundle(model, feature_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Compile a fitted model into a dictionary of NumPy arrays.
+
+    Args:
+        model: Fitted LogisticRegression, RandomForestClassifier,
+            GradientBoostingClassifier or XGBClassifier
+        feature_names: Column order expected at scoring time (defaults to the
+            names the model was fitted with, if any)
+
+    Returns:
+        Bundle dictionary accepted by `save_bundle` and `predict_proba_bundle`
+    """
+    names = _feature_names(model, feature_names)
+    cls = type(model).__name__
+    if hasattr(model, 'coef_'):
+        bundle = _export_linear(model)
+    elif cls in ('RandomForestClassifier', 'ExtraTreesClassifier'):
+        bundle = _export_random_forest(model)
+    elif cls == 'GradientBoostingClassifier':
+        bundle = _export_gradient_boosting(model)
+    elif hasattr(model, 'get_booster'):
+        bundle = _export_xgboost(model, names)
+    else:
+        raise TypeError(f"Cannot export model of type {cls}")
+    bundle['version'] = BUNDLE_VERSION
+    bundle['feature_names'] = names
+    bundle['source'] = cls
+    return bundle
+
+
+_META_KEYS = ('kind', 'aggregation', 'comparison', 'version', 'feature_names', 'source')
+
+
+def save_bundle(bundle: Dict[str, Any], path: Union[str, Path]) -> None:
+    """Write a bundle as an uncompressed `.npz` (arrays) with a JSON metadata entry."""
+    filepath = Path(path)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    meta = {k: bundle[k] for k in _META_KEYS if k in bundle}
+    arrays = {k: np.asarray(v) for k, v in bundle.items() if k not in _META_KEYS}
+    with open(filepath, 'wb') as f:
+        np.savez(f, __meta__=np.array(json.dumps(meta)), **arrays)
+
+
+def load_bundle(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a bundle written by `save_bundle` (no pickle involved)."""
+    with np.load(path, allow_pickle=False) as data:
+        bundle = {k: data[k] for k in data.files if k != '__meta__'}
+        bundle.update(json.loads(str(data['__meta__'])))
+    return bundle
+
+
+def _tree_sum(bundle: Dict[str, Any], X: np.ndarray) -> np.ndarray:
+    """Sum (or mean) of leaf values over all trees, advancing every (row, tree) pair in lock-step."""
+    feature, threshold = bundle['feature'], bundle['threshold']
+    left, right, default_left = bundle['left'], bundle['right'], bundle['default_left']
+    less_than = bundle['comparison'] == 'lt'
+
+    if less_than:
+        # XGBoost stores float32 split values and compares float32 inputs
+        X = X.astype(np.float32)
+    rows = np.arange(X.shape[0])[:, None]
+    node = np.broadcast_to(bundle['roots'], (X.shape[0], len(bundle['roots']))).copy()
+    for _ in range(int(bundle['max_depth'])):
+        x = X[rows, feature[node]]
+        go_left = x < threshold[node] if less_than else x <= threshold[node]
+        go_left = np.where(np.isnan(x), default_left[node], go_left)
+        nxt = np.where(go_left, left[node], right[node])
+        node = np.where(nxt < 0, node, nxt)
+    leaves = bundle['value'][node]
+    return leaves.mean(axis=1) if bundle['aggregation'] == 'mean' else leaves.sum(axis=1)
+
+
+def predict_proba_bundle(bundle: Dict[str, Any], X, batch_size: int = 65536) -> np.ndarray:
+    """
+    Positive-class probabilities from a bundle.
+
+    Args:
+        bundle: Dictionary from `export_bundle` or `load_bundle`
+        X: Feature matrix; DataFrames are re-ordered to the bundle's feature names
+        batch_size: Rows scored per step (bounds the (rows, trees) work arrays)
+
+    Returns:
+        1-D array of probabilities
+    """
+    names = bundle.get('feature_names')
+    if names is not None and hasattr(X, 'columns'):
+        X = X[list(names)]
+    X = np.asarray(X, dtype=np.float64)
+
+    if bundle['kind'] == 'linear':
+        return _sigmoid(X @ bundle['weights'] + bundle['bias'])
+
+    out = np.empty(X.shape[0])
+    for start in range(0, X.shape[0], batch_size):
+        block = X[start:start + batch_size]
+        total = _tree_sum(bundle, block)
+        out[start:start + batch_size] = total if bundle['aggregation'] == 'mean' \
+            else _sigmoid(total + bundle['base_margin'])
+    return out
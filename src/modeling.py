@@ -1,13 +1,17 @@
 
+from __future__ import annotations
+
 import pandas as pd
 import numpy as np
-import shap
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from xgboost import XGBClassifier
-from sklearn.metrics import classification_report, confusion_matrix, recall_score, f1_score
-from imblearn.over_sampling import SMOTE
-from typing import Tuple, Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Tuple, Dict, Any, List, Optional, Union
+
+# shap, sklearn, xgboost and imblearn are imported on first use so that
+# `from src.modeling import ...` stays cheap (see scripts/benchmark_imports.py).
+if TYPE_CHECKING:
+    from sklearn.linear_model import LogisticRegression
+    from xgboost import XGBClassifier
 
 def load_processed_data(data_dir: str = 'data/processed') -> Tuple[pd.DataFrame, pd.Series, pd.DataFrame, pd.Series]:
     """
@@ -34,6 +38,8 @@ def apply_smote(X_train: pd.DataFrame, y_train: pd.Series) -> Tuple[pd.DataFrame
     """
     Applies SMOTE to training data to handle class imbalance.
     """
+    from imblearn.over_sampling import SMOTE
+
     smote = SMOTE(random_state=42)
     X_resampled, y_resampled = smote.fit_resample(X_train, y_train)
     return X_resampled, y_resampled
@@ -42,33 +48,228 @@ def train_logistic_regression(X_train, y_train, class_weight='balanced') -> Logi
     """
     Trains a Logistic Regression model.
     """
+    from sklearn.linear_model import LogisticRegression
+
     model = LogisticRegression(max_iter=1000, class_weight=class_weight, random_state=42)
     model.fit(X_train, y_train)
     return model
 
-def train_xgboost(X_train, y_train, scale_pos_weight=None) -> XGBClassifier:
+def train_sparse_logistic_regression(X_train, y_train, X_val=None, y_val=None,
+                                     l1_ratio: float = 1.0, tolerance: float = 0.01,
+                                     class_weight='balanced') -> Tuple[LogisticRegression, pd.DataFrame]:
+    """
+    Trains a sparse (L1 / elastic-net) Logistic Regression.
+
+    Sweeps the regularization path with warm starts, picks the smallest model
+    whose validation ROC AUC is within `tolerance` of the best, and refits it
+    on its non-zero features only (see `sparse.py`).
+
+    Returns:
+        Tuple of (pruned_model, frontier) where frontier lists accuracy and
+        ROC AUC against the number of features for every C on the path.
+    """
+    from .sparse import regularization_path, select_sparse_model, train_pruned_model
+
+    frontier, _ = regularization_path(X_train, y_train, X_val, y_val,
+                                      l1_ratio=l1_ratio, class_weight=class_weight)
+    chosen = select_sparse_model(frontier, tolerance=tolerance)
+    model = train_pruned_model(X_train, y_train, list(chosen['features']), C=chosen['C'],
+                               l1_ratio=l1_ratio, class_weight=class_weight)
+    return model, frontier
+
+def train_xgboost(X_train, y_train, scale_pos_weight=None,
+                  tree_method: Optional[str] = None, n_jobs: Optional[int] = None,
+                  enable_categorical: bool = False) -> XGBClassifier:
     """
     Trains an XGBoost model.
+
+    Args:
+        tree_method: XGBoost tree method, e.g. 'hist' for histogram-based training.
+        n_jobs: Number of threads XGBoost may use (None = library default).
+        enable_categorical: Split natively on `category` dtype columns
+            (features.encode_features_categorical) instead of one-hot dummies.
+            Requires the 'hist' tree method, which is used if none is given.
     """
+    from xgboost import XGBClassifier
+
+    if enable_categorical and tree_method is None:
+        tree_method = 'hist'
+
     # If SMOTE is used, scale_pos_weight might not be needed, but good to have option.
-    model = XGBClassifier(
-        n_estimators=100,
-        learning_rate=0.1,
-        max_depth=4,
-        use_label_encoder=False,
-        eval_metric='logloss',
-        random_state=42
-    )
+    model = XGBClassifier(**_xgboost_params(tree_method=tree_method, n_jobs=n_jobs),
+                          enable_categorical=enable_categorical)
     if scale_pos_weight:
          model.set_params(scale_pos_weight=scale_pos_weight)
          
     model.fit(X_train, y_train)
     return model
 
-def evaluate_model(model, X_test, y_test, model_name="Model") -> Dict[str, Any]:
+def train_lightgbm(X_train, y_train, scale_pos_weight=None, n_jobs: Optional[int] = None):
+    """
+    Trains a LightGBM model on native categorical features.
+
+    `category` dtype columns (features.encode_features_categorical) are split
+    on directly, so no dummy columns are built or scanned. Hyperparameters
+    mirror train_xgboost (depth 4 ~ 15 leaves).
+
+    Args:
+        n_jobs: Number of threads LightGBM may use (None = library default).
+    """
+    from lightgbm import LGBMClassifier
+
+    model = LGBMClassifier(**_lightgbm_params(n_jobs=n_jobs))
+    if scale_pos_weight:
+        model.set_params(scale_pos_weight=scale_pos_weight)
+
+    # categorical_feature='auto' picks up pandas category columns
+    model.fit(X_train, y_train)
+    return model
+
+def _xgboost_params(tree_method: Optional[str] = None, n_jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Shared hyperparameters so in-memory and external-memory models are comparable."""
+    params = {
+        'n_estimators': 100,
+        'learning_rate': 0.1,
+        'max_depth': 4,
+        'eval_metric': 'logloss',
+        'random_state': 42,
+    }
+    if tree_method is not None:
+        params['tree_method'] = tree_method
+    if n_jobs is not None:
+        params['n_jobs'] = n_jobs
+    return params
+
+def _lightgbm_params(n_jobs: Optional[int] = None) -> Dict[str, Any]:
+    """LightGBM equivalent of `_xgboost_params` (depth-4 trees, same rounds and learning rate)."""
+    params = {
+        'n_estimators': 100,
+        'learning_rate': 0.1,
+        'max_depth': 4,
+        'num_leaves': 15,
+        'random_state': 42,
+        'verbose': -1,
+    }
+    if n_jobs is not None:
+        params['n_jobs'] = n_jobs
+    return params
+
+@lru_cache(maxsize=None)
+def _parquet_batch_iter_class():
+    """Builds ParquetBatchIter on first use, since its base class lives in xgboost."""
+    import xgboost as xgb
+
+    class ParquetBatchIter(xgb.DataIter):
+        """
+        Feeds Parquet files to XGBoost one row group at a time.
+
+        Only a single row group is held in memory; XGBoost pages the quantized
+        batches to `cache_prefix` on disk between passes.
+        """
+
+        def __init__(self, paths: List[Union[str, Path]], target: str = 'Attrition',
+                     feature_names: Optional[List[str]] = None, cache_prefix: Optional[str] = None):
+            import pyarrow.parquet as pq
+
+            self._files = [pq.ParquetFile(str(p)) for p in paths]
+            self._batches = [(i, rg) for i, f in enumerate(self._files) for rg in range(f.num_row_groups)]
+            self._target = target
+            if feature_names is None:
+                feature_names = [c for c in self._files[0].schema_arrow.names if c != target]
+            self.feature_names = feature_names
+            self._it = 0
+            super().__init__(cache_prefix=cache_prefix)
+
+        def next(self, input_data) -> bool:
+            if self._it == len(self._batches):
+                return False
+            file_idx, row_group = self._batches[self._it]
+            chunk = self._files[file_idx].read_row_group(
+                row_group, columns=self.feature_names + [self._target]
+            ).to_pandas()
+            input_data(data=chunk[self.feature_names], label=chunk[self._target])
+            self._it += 1
+            return True
+
+        def reset(self) -> None:
+            self._it = 0
+
+    return ParquetBatchIter
+
+def __getattr__(name):
+    # Lazily expose ParquetBatchIter as a module attribute (PEP 562)
+    if name == 'ParquetBatchIter':
+        return _parquet_batch_iter_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def train_xgboost_external_memory(parquet_paths: List[Union[str, Path]], target: str = 'Attrition',
+                                  n_jobs: int = -1, scale_pos_weight=None, max_bin: int = 256,
+                                  cache_dir: Optional[Union[str, Path]] = None) -> XGBClassifier:
+    """
+    Trains XGBoost with the hist method over Parquet chunks that need not fit in RAM.
+
+    Uses the same hyperparameters as `train_xgboost` and returns a fitted
+    XGBClassifier, so the result is a drop-in replacement for the in-memory model.
+
+    Args:
+        parquet_paths: Parquet files holding features and the target column.
+        target: Name of the target column.
+        n_jobs: Number of threads for quantization and training (-1 = all cores).
+        max_bin: Maximum number of histogram bins per feature.
+        cache_dir: Directory for XGBoost's on-disk page cache (defaults to a temp dir).
+    """
+    import os
+    import tempfile
+    import xgboost as xgb
+    from xgboost import XGBClassifier
+
+    nthread = os.cpu_count() if n_jobs in (None, -1) else n_jobs
+    with tempfile.TemporaryDirectory(dir=cache_dir) as tmp:
+        it = _parquet_batch_iter_class()(parquet_paths, target=target, cache_prefix=os.path.join(tmp, 'xgb-cache'))
+        # ExtMemQuantileDMatrix (xgboost>=3) keeps only quantized pages; older
+        # releases fall back to the iterator-backed DMatrix with the same cache.
+        if hasattr(xgb, 'ExtMemQuantileDMatrix'):
+            dtrain = xgb.ExtMemQuantileDMatrix(it, max_bin=max_bin, nthread=nthread)
+        else:
+            dtrain = xgb.DMatrix(it, nthread=nthread)
+
+        sk_params = _xgboost_params(tree_method='hist')
+        params = {
+            'objective': 'binary:logistic',
+            'tree_method': 'hist',
+            'max_bin': max_bin,
+            'eta': sk_params['learning_rate'],
+            'max_depth': sk_params['max_depth'],
+            'eval_metric': sk_params['eval_metric'],
+            'seed': sk_params['random_state'],
+            'nthread': nthread,
+        }
+        if scale_pos_weight:
+            params['scale_pos_weight'] = scale_pos_weight
+        booster = xgb.train(params, dtrain, num_boost_round=sk_params['n_estimators'])
+        # Release the cache pages before the temp directory is removed.
+        del dtrain, it
+
+    model = XGBClassifier(**_xgboost_params(tree_method='hist', n_jobs=n_jobs))
+    model.load_model(booster.save_raw(raw_format='ubj'))
+    return model
+
+def evaluate_model(model, X_test, y_test, model_name="Model",
+                   threshold_sweep: bool = False, n_bootstrap: int = 0,
+                   cost_fp: float = 1.0, cost_fn: float = 5.0, n_jobs: int = -1) -> Dict[str, Any]:
     """
     Evaluates model performance and returns metrics.
+
+    Args:
+        threshold_sweep: Also return the precision/recall/F1/cost curve over
+            every distinct predicted probability (key 'threshold_curve').
+        n_bootstrap: If > 0, also return bootstrap 95% confidence intervals
+            at the 0.5 threshold (key 'confidence_intervals').
+        cost_fp, cost_fn: Costs used for the 'cost' column of the sweep.
+        n_jobs: Threads for the bootstrap batches.
     """
+    from sklearn.metrics import classification_report, confusion_matrix, recall_score, f1_score
+
     y_pred = model.predict(X_test)
     
     recall = recall_score(y_test, y_pred)
@@ -82,19 +283,45 @@ def evaluate_model(model, X_test, y_test, model_name="Model") -> Dict[str, Any]:
     print("Confusion Matrix:")
     print(confusion_matrix(y_test, y_pred))
     
-    return {'recall': recall, 'f1': f1}
+    results = {'recall': recall, 'f1': f1}
+
+    if threshold_sweep or n_bootstrap:
+        from .evaluation import threshold_curve, best_threshold, bootstrap_metrics
+
+        scores = model.predict_proba(X_test)[:, 1]
+        if threshold_sweep:
+            curve = threshold_curve(y_test, scores, cost_fp=cost_fp, cost_fn=cost_fn)
+            results['threshold_curve'] = curve
+            results['best_f1_threshold'] = best_threshold(curve, 'f1')
+            results['min_cost_threshold'] = best_threshold(curve, 'cost')
+            print(f"Best-F1 threshold: {results['best_f1_threshold']:.3f} | "
+                  f"Min-cost threshold: {results['min_cost_threshold']:.3f}")
+        if n_bootstrap:
+            ci = bootstrap_metrics(y_test, scores, n_bootstrap=n_bootstrap, n_jobs=n_jobs)
+            results['confidence_intervals'] = ci
+            print(f"\nBootstrap 95% CIs ({n_bootstrap} resamples):")
+            print(ci.round(4))
+
+    return results
 
 def get_shap_values(model, X_data):
     """
     Calculates SHAP values for interpretation.
+    For linear models, large frames or repeated requests use
+    `explainability.explain_model` (closed-form, batched and cached).
     """
+    import shap
+
     explainer = shap.TreeExplainer(model)
     shap_values = explainer.shap_values(X_data)
     return explainer, shap_values
 
-def get_strategic_insights(model, feature_names):
+def get_strategic_insights(model, feature_names, X=None, cache_dir=None):
     """
     Extracts global drivers with directionality.
+    For models without coefficients, pass X to get signed permutation
+    importance (see explainability.permutation_importance) instead of
+    direction-less feature_importances_.
     Returns: [{'feature': 'OverTime', 'importance': 95, 'raw_coef': 1.2, 'direction': 'Risk Accelerator'}, ...]
     """
     try:
@@ -103,20 +330,30 @@ def get_strategic_insights(model, feature_names):
             # Linear/Logistic models: Coef indicates direction
             raw_coefs = model.coef_[0]
             raw_importances = np.abs(raw_coefs)
+            has_direction = True
+        elif X is not None:
+            # Permutation importance carries a real sign for any model
+            from .explainability import permutation_importance
+
+            perm = permutation_importance(model, X, cache_dir=cache_dir).reindex(feature_names)
+            raw_importances = perm['importance'].to_numpy()
+            raw_coefs = raw_importances * perm['direction'].to_numpy()
+            has_direction = True
         elif hasattr(model, "feature_importances_"):
             # Tree models: Usually absolute importance only (no direction). 
             # We assume positive correlation for simplicity or need SHAP for real direction.
             # For this exercise, we will treat them as general importance without direction (grey).
             raw_coefs = model.feature_importances_ # Treat as magnitude
             raw_importances = model.feature_importances_
+            has_direction = False
         else:
             return _simulate_drivers(feature_names)
 
         # 2. Build insights list
         insights = []
         for name, coef, importance in zip(feature_names, raw_coefs, raw_importances):
-            # Determine direction logic (Logistic Regression specific)
-            if hasattr(model, "coef_"):
+            # Determine direction logic (coefficient or permutation sign)
+            if has_direction:
                 direction = "Risk Accelerator" if coef > 0 else "Protective Factor"
             else:
                 direction = "Key Factor" # Neutral for trees
@@ -4,14 +4,19 @@ Forge Launch Data Science - Models Module
 This module provides machine learning model implementations.
 """
 
-from .base import BaseModel
-from .classifiers import train_classifier, evaluate_classifier
+from .base import BaseModel, iter_batches
+from .classifiers import train_classifier, train_classifier_leaderboard, evaluate_classifier
 from .regressors import train_regressor, evaluate_regressor
+from .learning_curve import learning_curve, summarize_learning_curve
 
 __all__ = [
     'BaseModel',
+    'iter_batches',
     'train_classifier',
+    'train_classifier_leaderboard',
     'evaluate_classifier',
     'train_regressor',
     'evaluate_regressor',
+    'learning_curve',
+    'summarize_learning_curve',
 ]
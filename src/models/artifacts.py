@@ -0,0 +1,366 @@
+"""
+Model Artifacts
+
+Pickle-free, memory-mappable storage for fitted models. An artifact is a
+directory holding:
+    manifest.json   object structure as JSON, format version, and offset,
+                    dtype, shape and sha256 checksum of every array block
+    arrays.npy      one uncompressed uint8 .npy holding every numeric array
+                    (coefficients, tree node tables, scaler min/max,
+                    boosters' raw bytes) at 64-byte aligned offsets
+
+Loading memory-maps arrays.npy and hands out zero-copy views, so worker
+processes that load the same artifact share one physical copy of array
+attributes, and cold start does no unpickling. Loading never calls an
+arbitrary function the way `pickle.load` can:
+- the only callables invoked with stored arguments are the reconstructors
+  in ALLOWED_CALLABLES (numpy RNG and sklearn Cython types)
+- other objects are rebuilt with `cls.__new__` plus their state, and only
+  for classes defined in ALLOWED_MODULES that do not override `__new__`
+- names must be top-level attributes of their module (no dotted paths)
+
+scikit-learn trees copy their node arrays into native structures on load.
+Forests therefore still load quickly, but those arrays are not shared.
+"""
+
+import builtins
+import copyreg
+import hashlib
+import importlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import numpy as np
+
+ARTIFACT_FORMAT = 'forge-model-artifact'
+ARTIFACT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+ARENA_NAME = 'arrays.npy'
+BLOCK_ALIGN = 64
+
+# Packages whose classes may be referenced by an artifact
+ALLOWED_MODULES = ('sklearn', 'xgboost', 'lightgbm', 'numpy', 'scipy')
+ALLOWED_BUILTINS = {'int', 'float', 'bool', 'str', 'complex', 'object'}
+
+# The reconstructors `__reduce_ex__` returns for the supported models: the
+# only callables a loaded artifact may invoke with stored arguments
+ALLOWED_CALLABLES = frozenset({
+    'numpy.random._pickle:__bit_generator_ctor',
+    'numpy.random._pickle:__generator_ctor',
+    'numpy.random._pickle:__randomstate_ctor',
+    'numpy.random.bit_generator:__pyx_unpickle_SeedSequence',
+    'sklearn.tree._tree:Tree',
+    *(f'sklearn._loss._loss:{loss}' for loss in (
+        'CyAbsoluteError', 'CyExponentialLoss', 'CyHalfBinomialLoss', 'CyHalfGammaLoss',
+        'CyHalfMultinomialLoss', 'CyHalfPoissonLoss', 'CyHalfSquaredError', 'CyHalfTweedieLoss',
+        'CyHalfTweedieLossIdentity', 'CyHuberLoss', 'CyPinballLoss')),
+})
+
+
+class ArtifactError(ValueError):
+    """Raised for malformed, tampered or disallowed artifacts."""
+
+
+def _global_name(obj) -> str:
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def _allowed_module(module_name) -> bool:
+    return isinstance(module_name, str) and module_name.split('.')[0] in ALLOWED_MODULES
+
+
+def _resolve(name: str, kind: str = 'global'):
+    """
+    Look up an allowlisted global.
+
+    kind is 'call' for reconstructors invoked with stored arguments (must be
+    in ALLOWED_CALLABLES), 'class' for classes rebuilt via `__new__`, and
+    'global' for plain references (classes, or allowlisted reconstructors).
+    """
+    module_name, sep, qualname = name.partition(':')
+    if not sep or not qualname.isidentifier():
+        raise ArtifactError(f"'{name}' is not a top-level module attribute")
+    if kind == 'call' and name not in ALLOWED_CALLABLES:
+        raise ArtifactError(f"'{name}' may not be called by an artifact")
+
+    if module_name == 'builtins':
+        if qualname not in ALLOWED_BUILTINS or kind == 'call':
+            raise ArtifactError(f"Builtin '{qualname}' is not allowed in artifacts")
+        return getattr(builtins, qualname)
+    if not _allowed_module(module_name):
+        raise ArtifactError(f"Module '{module_name}' is not on the artifact allowlist")
+
+    obj = getattr(importlib.import_module(module_name), qualname, None)
+    # Re-exports (e.g. a module's own `import os`) are not where they claim to be
+    if obj is None or not _allowed_module(getattr(obj, '__module__', None)):
+        raise ArtifactError(f"'{name}' is not defined in an allowlisted module")
+    if kind == 'class' and not (isinstance(obj, type) and obj.__new__ is object.__new__):
+        raise ArtifactError(f"'{name}' cannot be rebuilt from its state")
+    if kind == 'global' and not isinstance(obj, type) and name not in ALLOWED_CALLABLES:
+        raise ArtifactError(f"'{name}' is not an allowlisted class")
+    return obj
+
+
+def _descr(dtype: np.dtype):
+    """JSON-able dtype description (keeps struct padding, e.g. of sklearn tree nodes)."""
+    return np.lib.format.dtype_to_descr(dtype)
+
+
+def _fields(descr):
+    """Restore the tuples JSON turned into lists: fields, nested fields and shapes."""
+    if isinstance(descr, str):
+        return descr
+    fields = []
+    for name, fmt, *shape in descr:
+        fields.append((name, _fields(fmt), *[tuple(s) for s in shape]))
+    return fields
+
+
+def _dtype(descr) -> np.dtype:
+    return np.lib.format.descr_to_dtype(_fields(descr))
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class _Encoder:
+    """Turns an object graph into JSON-able data, collecting arrays as blocks."""
+
+    def __init__(self):
+        self.blocks: Dict[str, Dict[str, Any]] = {}
+        self.arrays = []
+        self.size = 0
+        # id -> (block name, array); holding the array keeps temporaries (e.g.
+        # from __getstate__) alive so their ids cannot be reused
+        self._memo: Dict[int, Any] = {}
+        self._objects: Dict[int, Any] = {}
+
+    def _block(self, arr: np.ndarray) -> str:
+        if id(arr) in self._memo:
+            return self._memo[id(arr)][0]
+        name = f"b{len(self.blocks)}"
+        data = np.ascontiguousarray(arr)
+        offset = -(-self.size // BLOCK_ALIGN) * BLOCK_ALIGN
+        self.blocks[name] = {
+            'offset': offset,
+            'nbytes': data.nbytes,
+            'dtype': _descr(data.dtype),
+            'shape': list(data.shape),
+            'sha256': hashlib.sha256(data.view(np.uint8).ravel() if data.nbytes else b'').hexdigest(),
+        }
+        self.arrays.append((offset, data))
+        self.size = offset + data.nbytes
+        self._memo[id(arr)] = (name, arr)
+        return name
+
+    def write_arena(self, path: Path) -> str:
+        """Write all blocks into one uint8 .npy at their offsets; returns its sha256."""
+        arena = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=(self.size,))
+        for offset, data in self.arrays:
+            arena[offset:offset + data.nbytes] = data.view(np.uint8).ravel()
+        arena.flush()
+        del arena
+        return _sha256(path)
+
+    def encode(self, value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                return {'__objarray__': list(value.shape), 'items': [self.encode(v) for v in value.ravel()]}
+            return {'__array__': self._block(value)}
+        if isinstance(value, np.generic):
+            return {'__scalar__': value.dtype.str, 'value': value.item()}
+        if isinstance(value, (bytes, bytearray)):
+            return {'__bytes__': self._block(np.frombuffer(value, dtype=np.uint8)),
+                    'mutable': isinstance(value, bytearray)}
+        if isinstance(value, list):
+            return [self.encode(v) for v in value]
+        if isinstance(value, tuple):
+            return {'__tuple__': [self.encode(v) for v in value]}
+        if isinstance(value, (set, frozenset)):
+            return {'__set__': [self.encode(v) for v in value], 'frozen': isinstance(value, frozenset)}
+        if isinstance(value, dict):
+            if all(isinstance(k, str) for k in value):
+                return {'__dict__': {k: self.encode(v) for k, v in value.items()}}
+            return {'__items__': [[self.encode(k), self.encode(v)] for k, v in value.items()]}
+        if isinstance(value, np.dtype):
+            return {'__dtype__': _descr(value)}
+        if isinstance(value, type) or callable(value) and hasattr(value, '__qualname__'):
+            name = _global_name(value)
+            _resolve(name)  # refuse to write what could not be read back
+            return {'__global__': name}
+        return self._encode_object(value)
+
+    def _encode_object(self, value):
+        # Objects shared by several owners (e.g. one RandomState passed to every
+        # boosting stage) are stored once and referenced afterwards
+        if id(value) in self._objects:
+            return {'__ref__': self._objects[id(value)][0]}
+        _resolve(_global_name(type(value)))
+        reduced = value.__reduce_ex__(4)
+        if isinstance(reduced, str) or len(reduced) > 3 and any(r is not None for r in reduced[3:]):
+            raise ArtifactError(f"Cannot store object of type {type(value).__name__}")
+        ref = len(self._objects)
+        self._objects[id(value)] = (ref, value)
+        func, args = reduced[0], reduced[1]
+        state = reduced[2] if len(reduced) > 2 else None
+        if func is copyreg.__newobj__:
+            _resolve(_global_name(args[0]), kind='class')
+            return {'__object__': _global_name(args[0]), 'id': ref, 'args': self.encode(tuple(args[1:])),
+                    'state': self.encode(state)}
+        _resolve(_global_name(func), kind='call')
+        return {'__call__': self.encode(func), 'id': ref, 'args': self.encode(tuple(args)),
+                'state': self.encode(state)}
+
+
+class _Decoder:
+    """Inverse of `_Encoder`, viewing blocks out of the memory-mapped arena."""
+
+    def __init__(self, arena: np.ndarray, blocks: Dict[str, Dict[str, Any]], verify: bool):
+        self.arena = arena
+        self.blocks = blocks
+        self.verify = verify
+        self._cache: Dict[str, np.ndarray] = {}
+        self._objects: Dict[int, Any] = {}
+
+    def _block(self, name: str) -> np.ndarray:
+        if name not in self._cache:
+            meta = self.blocks[name]
+            raw = self.arena[meta['offset']:meta['offset'] + meta['nbytes']]
+            if self.verify and hashlib.sha256(raw).hexdigest() != meta['sha256']:
+                raise ArtifactError(f"Checksum mismatch for block {name}")
+            dtype = _dtype(meta['dtype'])
+            if dtype.hasobject:
+                # Object pointers read from a file would be arbitrary memory
+                raise ArtifactError(f"Block {name} has an object dtype")
+            self._cache[name] = raw.view(dtype).reshape(meta['shape'])
+        return self._cache[name]
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(v) for v in value]
+        if not isinstance(value, dict):
+            return value
+        if '__array__' in value:
+            return self._block(value['__array__'])
+        if '__dict__' in value:
+            return {k: self.decode(v) for k, v in value['__dict__'].items()}
+        if '__tuple__' in value:
+            return tuple(self.decode(v) for v in value['__tuple__'])
+        if '__scalar__' in value:
+            return np.dtype(value['__scalar__']).type(value['value'])
+        if '__objarray__' in value:
+            out = np.empty(len(value['items']), dtype=object)
+            out[:] = [self.decode(v) for v in value['items']]
+            return out.reshape(value['__objarray__'])
+        if '__bytes__' in value:
+            data = self._block(value['__bytes__']).tobytes()
+            return bytearray(data) if value['mutable'] else data
+        if '__items__' in value:
+            return {self.decode(k): self.decode(v) for k, v in value['__items__']}
+        if '__set__' in value:
+            items = [self.decode(v) for v in value['__set__']]
+            return frozenset(items) if value['frozen'] else set(items)
+        if '__dtype__' in value:
+            return _dtype(value['__dtype__'])
+        if '__global__' in value:
+            return _resolve(value['__global__'])
+        if '__ref__' in value:
+            return self._objects[value['__ref__']]
+        if '__object__' in value:
+            cls = _resolve(value['__object__'], kind='class')
+            obj = cls.__new__(cls, *self.decode(value['args']))
+            self._objects[value['id']] = obj
+            return self._set_state(obj, value['state'])
+        if '__call__' in value:
+            func = value['__call__']
+            if not isinstance(func, dict) or set(func) != {'__global__'}:
+                raise ArtifactError("Artifact calls must name a reconstructor")
+            obj = _resolve(func['__global__'], kind='call')(*self.decode(value['args']))
+            self._objects[value['id']] = obj
+            return self._set_state(obj, value['state'])
+        raise ArtifactError(f"Unknown artifact entry: {sorted(value)}")
+
+    def _set_state(self, obj, state):
+        state = self.decode(state)
+        if state is None:
+            return obj
+        if hasattr(obj, '__setstate__'):
+            obj.__setstate__(state)
+        else:
+            obj.__dict__.update(state)
+        return obj
+
+
+def save_artifact(obj: Any, path: Union[str, Path]) -> Path:
+    """
+    Write an object graph (typically a dict holding a fitted estimator) as an artifact directory.
+
+    Args:
+        obj: Object to store; classes must come from ALLOWED_MODULES
+        path: Target directory (created if needed; an existing artifact is replaced)
+
+    Returns:
+        Path of the artifact directory
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    encoder = _Encoder()
+    root = encoder.encode(obj)
+    arena_tmp = path / (ARENA_NAME + '.tmp.npy')
+    arena_sha = encoder.write_arena(arena_tmp)
+    manifest = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'arena': {'file': ARENA_NAME, 'nbytes': encoder.size, 'sha256': arena_sha},
+        'blocks': encoder.blocks,
+        'root': root,
+    }
+    # Arena first, manifest last: readers never see a manifest without its data
+    manifest_tmp = path / (MANIFEST_NAME + '.tmp')
+    manifest_tmp.write_text(json.dumps(manifest))
+    arena_tmp.replace(path / ARENA_NAME)
+    manifest_tmp.replace(path / MANIFEST_NAME)
+    return path
+
+
+def load_artifact(path: Union[str, Path], mmap: bool = True, verify: bool = True) -> Any:
+    """
+    Read an artifact directory written by `save_artifact`.
+
+    Args:
+        path: Artifact directory
+        mmap: Memory-map the array arena copy-on-write (pages are shared
+            between processes until written) instead of reading it
+        verify: Check every block used against its manifest checksum
+
+    Returns:
+        The stored object graph
+    """
+    path = Path(path)
+    manifest = json.loads((path / MANIFEST_NAME).read_text())
+    if manifest.get('format') != ARTIFACT_FORMAT:
+        raise ArtifactError(f"{path} is not a model artifact")
+    if manifest.get('version', 0) > ARTIFACT_VERSION:
+        raise ArtifactError(f"Artifact version {manifest['version']} is newer than supported ({ARTIFACT_VERSION})")
+
+    arena = np.load(path / manifest['arena']['file'], mmap_mode='c' if mmap else None, allow_pickle=False)
+    # Plain ndarray views of the map: memmap's Python-level indexing is slow
+    # for estimators that read their arrays element by element
+    arena = arena.view(np.ndarray)
+    if arena.shape != (manifest['arena']['nbytes'],):
+        raise ArtifactError(f"Array arena of {path} is truncated")
+    return _Decoder(arena, manifest['blocks'], verify=verify).decode(manifest['root'])
+
+
+def is_artifact(path: Union[str, Path]) -> bool:
+    """True if path is an artifact directory."""
+    return (Path(path) / MANIFEST_NAME).is_file()
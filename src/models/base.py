@@ -5,13 +5,66 @@ This module provides a base class for all machine learning models.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 import numpy as np
 import pandas as pd
 import pickle
 from pathlib import Path
 
 
+def iter_batches(source: Union[str, Path, np.ndarray, pd.DataFrame, Iterable],
+                 batch_size: int = 10_000,
+                 columns: Optional[List[str]] = None) -> Iterator[Union[np.ndarray, pd.DataFrame]]:
+    """
+    Yield feature batches of at most `batch_size` rows from a chunked source.
+
+    Supported sources:
+        - `.csv` path: read with `pd.read_csv(chunksize=...)`
+        - `.parquet` path: read record batches with pyarrow
+        - `.npy` path: memory-mapped, sliced lazily
+        - NumPy array / memmap or DataFrame: sliced as views
+        - Any other iterable of arrays/DataFrames: re-split to `batch_size`
+
+    Args:
+        source: Data source
+        batch_size: Maximum rows per yielded batch
+        columns: Column subset to read (CSV/Parquet/DataFrame only)
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if suffix == '.csv':
+            yield from pd.read_csv(path, usecols=columns, chunksize=batch_size)
+        elif suffix == '.parquet':
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+                yield batch.to_pandas()
+        elif suffix == '.npy':
+            yield from iter_batches(np.load(path, mmap_mode='r'), batch_size)
+        else:
+            raise ValueError(f"Unsupported file type: {path.suffix}")
+        return
+
+    if isinstance(source, pd.DataFrame):
+        frame = source if columns is None else source[columns]
+        for start in range(0, len(frame), batch_size):
+            yield frame.iloc[start:start + batch_size]
+        return
+
+    if isinstance(source, np.ndarray):
+        for start in range(0, len(source), batch_size):
+            # Copy only the current slice out of a memmap
+            yield np.asarray(source[start:start + batch_size])
+        return
+
+    for chunk in source:
+        yield from iter_batches(chunk, batch_size, columns)
+
+
 class BaseModel(ABC):
     """
     Abstract base class for machine learning models.
@@ -74,52 +127,120 @@ class BaseModel(ABC):
         """
         pass
     
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities for new data.
+
+        Defaults to the wrapped estimator's `predict_proba`; subclasses
+        whose estimator does not expose one should override this.
+
+        Args:
+            X: Features for prediction
+
+        Returns:
+            Array of shape (n_samples, n_classes)
+        """
+        if not hasattr(self.model, 'predict_proba'):
+            raise NotImplementedError(f"{self.__class__.__name__} does not provide probabilities")
+        return self.model.predict_proba(X)
+
+    def predict_iter(self, source, batch_size: int = 10_000,
+                     columns: Optional[List[str]] = None) -> Iterator[np.ndarray]:
+        """
+        Stream predictions batch by batch.
+
+        Neither the full input nor the full output is held in memory; see
+        `iter_batches` for the supported sources (CSV chunks, Parquet row
+        groups, memmaps, DataFrames, iterables of chunks).
+
+        Args:
+            source: Data source
+            batch_size: Rows per batch
+            columns: Feature columns to read (CSV/Parquet/DataFrame only)
+
+        Yields:
+            Predictions for each batch, in source order
+        """
+        if not self.is_fitted:
+            raise ValueError("Model must be fitted before prediction")
+        for batch in iter_batches(source, batch_size, columns):
+            yield self.predict(batch)
+
+    def predict_proba_iter(self, source, batch_size: int = 10_000,
+                           columns: Optional[List[str]] = None) -> Iterator[np.ndarray]:
+        """
+        Stream class probabilities batch by batch (see `predict_iter`).
+
+        Yields:
+            Array of shape (batch_rows, n_classes) for each batch
+        """
+        if not self.is_fitted:
+            raise ValueError("Model must be fitted before prediction")
+        for batch in iter_batches(source, batch_size, columns):
+            yield self.predict_proba(batch)
+
     def save(self, path: str) -> None:
         """
-        Save the model to disk.
-        
+        Save the model to disk as an artifact directory.
+
+        Numeric parameters are written as uncompressed array blocks next to a
+        JSON manifest with checksums (see `models.artifacts`); nothing is
+        pickled.
+
         Args:
-            path: File path for saving the model
+            path: Directory for the artifact
         """
+        from .artifacts import save_artifact
+
         if not self.is_fitted:
             raise ValueError("Cannot save unfitted model")
-        
-        filepath = Path(path)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filepath, 'wb') as f:
-            pickle.dump({
-                'name': self.name,
-                'model': self.model,
-                'config': self.config,
-                'metrics': self.metrics
-            }, f)
-        
+
+        filepath = save_artifact({
+            'name': self.name,
+            'model': self.model,
+            'config': self.config,
+            'metrics': self.metrics
+        }, path)
+
         print(f"✅ Model saved to {filepath}")
-    
+
     @classmethod
-    def load(cls, path: str) -> 'BaseModel':
+    def load(cls, path: str, mmap: bool = True, verify: bool = True,
+             allow_pickle: bool = False) -> 'BaseModel':
         """
         Load a model from disk.
-        
+
         Args:
-            path: File path to load from
-            
+            path: Artifact directory written by `save`
+            mmap: Memory-map array blocks so processes share one copy
+            verify: Check block checksums against the manifest
+            allow_pickle: Also accept a legacy pickle file. Only use this for
+                files from a trusted source: unpickling can run arbitrary code.
+
         Returns:
             Loaded model instance
         """
-        with open(path, 'rb') as f:
-            data = pickle.load(f)
-        
+        from .artifacts import is_artifact, load_artifact
+
+        if is_artifact(path):
+            data = load_artifact(path, mmap=mmap, verify=verify)
+        elif Path(path).is_file():
+            if not allow_pickle:
+                raise ValueError(f"{path} is a legacy pickle; pass allow_pickle=True to load a trusted file")
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        else:
+            raise FileNotFoundError(f"No model artifact at {path}")
+
         instance = cls.__new__(cls)
         instance.name = data['name']
         instance.model = data['model']
         instance.config = data['config']
         instance.metrics = data['metrics']
         instance.is_fitted = True
-        
+
         return instance
-    
+
     def __repr__(self) -> str:
         status = "fitted" if self.is_fitted else "unfitted"
         return f"{self.__class__.__name__}(name='{self.name}', status={status})"
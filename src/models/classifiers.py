@@ -7,24 +7,48 @@ This module provides classification model implementations and utilities.
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, List, Literal
-from sklearn.model_selection import cross_val_score, train_test_split
-from sklearn.metrics import (
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    classification_report,
-    confusion_matrix
-)
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.svm import SVC
+
+# scikit-learn is imported inside each function to keep `import models` cheap.
+
+CLASSIFIER_TYPES = ('logistic', 'random_forest', 'gradient_boost', 'svm', 'svm_approx')
+
+
+def build_classifier(model_type: str, **model_params):
+    """
+    Instantiate one unfitted classifier by name.
+
+    Only the requested estimator class is imported and constructed.
+
+    Args:
+        model_type: One of CLASSIFIER_TYPES
+        **model_params: Parameters for the estimator
+
+    Returns:
+        Unfitted scikit-learn estimator
+    """
+    if model_type == 'logistic':
+        from sklearn.linear_model import LogisticRegression
+        return LogisticRegression(**{'max_iter': 1000, **model_params})
+    if model_type == 'random_forest':
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(**{'n_estimators': 100, **model_params})
+    if model_type == 'gradient_boost':
+        from sklearn.ensemble import GradientBoostingClassifier
+        return GradientBoostingClassifier(**model_params)
+    if model_type == 'svm':
+        from sklearn.svm import SVC
+        return SVC(**model_params)
+    if model_type == 'svm_approx':
+        # Nystroem/random-Fourier features + linear SVM; see kernel_approx.py
+        from .kernel_approx import approximate_kernel_model
+        return approximate_kernel_model('classification', **model_params)
+    raise ValueError(f"Unknown model type: {model_type}")
 
 
 def train_classifier(
     X: np.ndarray,
     y: np.ndarray,
-    model_type: Literal['logistic', 'random_forest', 'gradient_boost', 'svm'] = 'random_forest',
+    model_type: Literal['logistic', 'random_forest', 'gradient_boost', 'svm', 'svm_approx'] = 'random_forest',
     test_size: float = 0.2,
     random_state: int = 42,
     **model_params
@@ -43,23 +67,16 @@ def train_classifier(
     Returns:
         Dictionary containing model, predictions, and metrics
     """
+    from sklearn.model_selection import train_test_split
+
+    # Build the model first so an unknown type fails before any work is done
+    model = build_classifier(model_type, **model_params)
+
     # Split data
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=test_size, random_state=random_state, stratify=y
     )
     
-    # Select model
-    models = {
-        'logistic': LogisticRegression(max_iter=1000, **model_params),
-        'random_forest': RandomForestClassifier(n_estimators=100, **model_params),
-        'gradient_boost': GradientBoostingClassifier(**model_params),
-        'svm': SVC(**model_params)
-    }
-    
-    model = models.get(model_type)
-    if model is None:
-        raise ValueError(f"Unknown model type: {model_type}")
-    
     # Train
     model.fit(X_train, y_train)
     
@@ -80,6 +97,98 @@ def train_classifier(
     }
 
 
+def _fit_and_time(model_type: str, model_params: Dict[str, Any], X_train, y_train, X_test, y_test) -> Dict[str, Any]:
+    """Fit one leaderboard entry and measure its fit/predict latency and serialized size."""
+    import pickle
+    import time
+
+    model = build_classifier(model_type, **model_params)
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    predict_time = time.perf_counter() - start
+
+    return {
+        'model': model,
+        'row': {
+            'model_type': model_type,
+            **evaluate_classifier(y_test, y_pred),
+            'fit_time_s': fit_time,
+            'predict_time_s': predict_time,
+            'predict_us_per_row': 1e6 * predict_time / max(len(y_test), 1),
+            'model_size_bytes': len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)),
+        },
+    }
+
+
+def train_classifier_leaderboard(
+    X: np.ndarray,
+    y: np.ndarray,
+    model_types: Optional[List[str]] = None,
+    test_size: float = 0.2,
+    random_state: int = 42,
+    n_jobs: int = -1,
+    model_params: Optional[Dict[str, Dict[str, Any]]] = None,
+    sort_by: str = 'f1',
+) -> Dict[str, Any]:
+    """
+    Fit several classifier types on one shared split and rank them.
+
+    Each model is fitted in its own worker process. Alongside the
+    `evaluate_classifier` metrics, the leaderboard records fit time, predict
+    latency and serialized model size, so models can be picked on cost as
+    well as quality. Timings are wall-clock inside the worker; with
+    n_jobs > 1 the fits share the machine, so compare them relative to each
+    other.
+
+    Args:
+        X: Feature matrix
+        y: Target labels
+        model_types: Subset of CLASSIFIER_TYPES (default: all)
+        test_size: Fraction of data for testing
+        random_state: Random seed for the shared split
+        n_jobs: Parallel workers (-1 = all cores, 1 = sequential)
+        model_params: Optional per-type parameters, e.g. {'svm': {'C': 10}}
+        sort_by: Metric column to rank by (descending)
+
+    Returns:
+        Dictionary with 'leaderboard' (DataFrame, one row per model type),
+        'models' (type -> fitted model) and the shared split arrays
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import train_test_split
+
+    model_types = list(model_types or CLASSIFIER_TYPES)
+    model_params = model_params or {}
+    unknown = [t for t in model_types if t not in CLASSIFIER_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown model type(s): {unknown}")
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state, stratify=y
+    )
+
+    results = Parallel(n_jobs=min(n_jobs, len(model_types)) if n_jobs > 0 else n_jobs)(
+        delayed(_fit_and_time)(t, model_params.get(t, {}), X_train, y_train, X_test, y_test)
+        for t in model_types
+    )
+
+    leaderboard = (pd.DataFrame([r['row'] for r in results])
+                   .sort_values(sort_by, ascending=False)
+                   .reset_index(drop=True))
+    return {
+        'leaderboard': leaderboard,
+        'models': {t: r['model'] for t, r in zip(model_types, results)},
+        'X_train': X_train,
+        'X_test': X_test,
+        'y_train': y_train,
+        'y_test': y_test,
+    }
+
+
 def evaluate_classifier(
     y_true: np.ndarray,
     y_pred: np.ndarray,
@@ -96,6 +205,8 @@ def evaluate_classifier(
     Returns:
         Dictionary of evaluation metrics
     """
+    from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+
     return {
         'accuracy': accuracy_score(y_true, y_pred),
         'precision': precision_score(y_true, y_pred, average=average, zero_division=0),
@@ -120,6 +231,8 @@ def get_classification_report(
     Returns:
         Formatted classification report string
     """
+    from sklearn.metrics import classification_report
+
     return classification_report(y_true, y_pred, target_names=target_names)
 
 
@@ -137,4 +250,6 @@ def get_confusion_matrix(
     Returns:
         Confusion matrix as numpy array
     """
+    from sklearn.metrics import confusion_matrix
+
     return confusion_matrix(y_true, y_pred)
@@ -0,0 +1,78 @@
+"""
+Approximate-Kernel Models
+
+Linear-time stand-ins for the exact RBF-kernel SVM/SVR: an explicit
+feature map approximating the RBF kernel followed by a linear solver.
+- 'nystroem': Nystroem low-rank approximation from a sample of the
+  training rows; usually more accurate per component (default)
+- 'rff': random Fourier features (`RBFSampler`)
+Fit cost grows linearly in the number of rows instead of the O(n^2)-O(n^3)
+of libsvm, and prediction no longer scales with the number of support
+vectors. Selected through `model_type='svm_approx'` / `'svr_approx'`.
+"""
+
+from typing import Optional, Union
+
+
+def gamma_scale(X) -> float:
+    """
+    SVC's gamma='scale' for X: 1 / (n_features * X.var()).
+
+    Pass the result as `gamma` to reproduce the exact SVM's default kernel
+    width with the Nystroem method.
+    """
+    import numpy as np
+
+    X = np.asarray(X, dtype=float)
+    var = X.var()
+    return 1.0 / (X.shape[1] * var) if var > 0 else 1.0
+
+
+def approximate_kernel_model(
+    task: str = 'classification',
+    C: float = 1.0,
+    gamma: Optional[Union[str, float]] = None,
+    n_components: int = 1000,
+    method: str = 'nystroem',
+    epsilon: float = 0.1,
+    random_state=None,
+):
+    """
+    Build an unfitted RBF feature map + linear SVM pipeline.
+
+    Args:
+        task: 'classification' (LinearSVC) or 'regression' (LinearSVR)
+        C: Regularization strength, as for SVC/SVR
+        gamma: RBF width. None uses each method's default: 1 / n_features
+            for 'nystroem' (SVC's 'scale' for unit-variance features, see
+            `gamma_scale`) and 'scale' for 'rff'
+        n_components: Dimension of the approximate feature map
+        method: 'nystroem' or 'rff'
+        epsilon: Insensitive-zone width for regression, as for SVR
+        random_state: Seed for the feature map
+
+    Returns:
+        Unfitted scikit-learn Pipeline
+    """
+    from sklearn.kernel_approximation import Nystroem, RBFSampler
+    from sklearn.pipeline import Pipeline
+    from sklearn.svm import LinearSVC, LinearSVR
+
+    if method == 'rff':
+        feature_map = RBFSampler(gamma='scale' if gamma is None else gamma,
+                                 n_components=n_components, random_state=random_state)
+    elif method == 'nystroem':
+        feature_map = Nystroem(kernel='rbf', gamma=gamma, n_components=n_components, random_state=random_state)
+    else:
+        raise ValueError(f"Unknown kernel approximation: {method}")
+
+    # Same losses as SVC/SVR; liblinear's dual solver is the faster one when
+    # n_samples >> n_components
+    if task == 'classification':
+        solver = LinearSVC(C=C, loss='hinge', dual=True, max_iter=5000)
+    elif task == 'regression':
+        solver = LinearSVR(C=C, epsilon=epsilon, loss='epsilon_insensitive', dual=True, max_iter=5000)
+    else:
+        raise ValueError(f"Unknown task: {task}")
+
+    return Pipeline([('feature_map', feature_map), ('linear', solver)])
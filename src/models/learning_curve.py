@@ -0,0 +1,172 @@
+"""
+Learning Curves
+
+Trains a model type on nested subsamples of the training data (every
+smaller sample is a prefix of the larger ones) and scores each fit on one
+fixed test set, recording quality metrics, fit time and peak memory per
+training size. The fits run in parallel worker processes.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .classifiers import build_classifier, evaluate_classifier
+from .regressors import build_regressor, evaluate_regressor
+
+
+def _nested_order(y: np.ndarray, seed, stratify: bool) -> np.ndarray:
+    """Random row order whose every prefix keeps the class ratio (if stratified)."""
+    order = np.random.default_rng(seed).permutation(len(y))
+    if not stratify:
+        return order
+    _, codes = np.unique(y[order], return_inverse=True)
+    counts = np.bincount(codes)
+    # Rank of each row within its class, then interleave classes by relative rank
+    by_class = np.argsort(codes, kind='stable')
+    rank = np.empty(len(y))
+    rank[by_class] = np.arange(len(y)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return order[np.argsort((rank + 0.5) / counts[codes], kind='stable')]
+
+
+def _resolve_sizes(train_sizes: Sequence[Union[int, float]], n: int) -> List[int]:
+    sizes = []
+    for size in train_sizes:
+        rows = int(round(size * n)) if isinstance(size, float) else int(size)
+        if not 0 < rows <= n:
+            raise ValueError(f"Training size {size} is outside (0, {n}]")
+        sizes.append(rows)
+    return sorted(set(sizes))
+
+
+def _take(data, rows):
+    return data.iloc[rows] if isinstance(data, (pd.DataFrame, pd.Series)) else data[rows]
+
+
+def _fit_at_size(task: str, model_type: str, model_params: Dict[str, Any], X_train, y_train,
+                 X_test, y_test, rows: np.ndarray, average: Optional[str], track_memory: bool) -> Dict[str, Any]:
+    """Fit one (model type, size) point and measure its fit time and peak traced memory."""
+    import time
+    import tracemalloc
+
+    build = build_classifier if task == 'classification' else build_regressor
+    model = build(model_type, **model_params)
+    X_sub, y_sub = _take(X_train, rows), _take(y_train, rows)
+
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    model.fit(X_sub, y_sub)
+    fit_time = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if track_memory else np.nan
+    if track_memory:
+        tracemalloc.stop()
+
+    y_pred = model.predict(X_test)
+    if task == 'classification':
+        metrics = evaluate_classifier(y_test, y_pred, average=average)
+    else:
+        metrics = evaluate_regressor(y_test, y_pred)
+    return {
+        'model_type': model_type,
+        'train_size': len(rows),
+        **metrics,
+        'fit_time_s': fit_time,
+        'peak_memory_mb': peak / 2 ** 20,
+    }
+
+
+def learning_curve(
+    X: np.ndarray,
+    y: np.ndarray,
+    model_types: Union[str, List[str]] = 'logistic',
+    task: str = 'classification',
+    train_sizes: Sequence[Union[int, float]] = (0.1, 0.25, 0.5, 0.75, 1.0),
+    n_repeats: int = 1,
+    test_size: float = 0.2,
+    random_state: int = 42,
+    n_jobs: int = -1,
+    model_params: Optional[Dict[str, Dict[str, Any]]] = None,
+    average: Optional[str] = None,
+    track_memory: bool = True,
+) -> pd.DataFrame:
+    """
+    Quality, fit time and peak memory against training-set size.
+
+    One stratified test split is held out; each repeat draws a fresh nested
+    ordering of the training rows, and every (model type, size, repeat)
+    point is fitted in its own worker process. Peak memory is the
+    tracemalloc high-water mark of the fit, which covers Python and NumPy
+    allocations but not native buffers allocated by XGBoost/LightGBM;
+    tracing also adds some overhead to the fit times (set track_memory=False
+    for pure timings).
+
+    Args:
+        X: Feature matrix
+        y: Target values
+        model_types: One or more CLASSIFIER_TYPES / REGRESSOR_TYPES names
+        task: 'classification' or 'regression'
+        train_sizes: Fractions (float) or row counts (int) of the training split
+        n_repeats: Independent nested orderings per size
+        test_size: Fraction of data held out for scoring
+        random_state: Seed for the split and the orderings
+        n_jobs: Parallel workers (-1 = all cores, 1 = sequential)
+        model_params: Optional per-type parameters, e.g. {'svm': {'C': 10}}
+        average: Metric averaging for classification (default: 'binary' for
+            two classes, so recall is the positive-class recall, else 'weighted')
+        track_memory: Record peak traced memory per fit
+
+    Returns:
+        DataFrame with one row per fit: model_type, repeat, train_size,
+        fraction, the evaluation metrics, fit_time_s and peak_memory_mb
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import train_test_split
+
+    if task not in ('classification', 'regression'):
+        raise ValueError(f"Unknown task: {task}")
+    model_types = [model_types] if isinstance(model_types, str) else list(model_types)
+    model_params = model_params or {}
+    classification = task == 'classification'
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state, stratify=y if classification else None
+    )
+    y_values = np.asarray(y_train)
+    if classification and average is None:
+        average = 'binary' if len(np.unique(y_values)) == 2 else 'weighted'
+
+    n = len(y_values)
+    sizes = _resolve_sizes(train_sizes, n)
+    seeds = np.random.SeedSequence(random_state).spawn(n_repeats)
+    orders = [_nested_order(y_values, seed, stratify=classification) for seed in seeds]
+
+    # Largest fits first so the slow tail is not left to a single worker
+    grid = [(t, r, size) for size in reversed(sizes) for t in model_types for r in range(n_repeats)]
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_at_size)(task, t, model_params.get(t, {}), X_train, y_train, X_test, y_test,
+                              orders[r][:size], average, track_memory)
+        for t, r, size in grid
+    )
+
+    for (_, r, _), row in zip(grid, results):
+        row['repeat'] = r
+    curve = pd.DataFrame(results)
+    curve.insert(1, 'repeat', curve.pop('repeat'))
+    curve.insert(3, 'fraction', curve['train_size'] / n)
+    return curve.sort_values(['model_type', 'train_size', 'repeat']).reset_index(drop=True)
+
+
+def summarize_learning_curve(curve: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mean and standard deviation over repeats for every model type and size.
+
+    Args:
+        curve: Output of `learning_curve`
+
+    Returns:
+        DataFrame indexed by (model_type, train_size) with (metric, mean/std) columns
+    """
+    values = curve.drop(columns=['repeat', 'fraction'])
+    return values.groupby(['model_type', 'train_size']).agg(['mean', 'std'])
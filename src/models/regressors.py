@@ -7,22 +7,48 @@ This module provides regression model implementations and utilities.
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, Literal
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.metrics import (
-    mean_squared_error,
-    mean_absolute_error,
-    r2_score,
-    mean_absolute_percentage_error
-)
-from sklearn.linear_model import LinearRegression, Ridge, Lasso, ElasticNet
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.svm import SVR
+
+# scikit-learn is imported inside each function to keep `import models` cheap.
+
+REGRESSOR_TYPES = ('linear', 'ridge', 'lasso', 'elastic_net', 'random_forest', 'gradient_boost', 'svr', 'svr_approx')
+
+
+def build_regressor(model_type: str, **model_params):
+    """
+    Instantiate one unfitted regressor by name.
+
+    Args:
+        model_type: One of REGRESSOR_TYPES
+        **model_params: Parameters for the estimator
+
+    Returns:
+        Unfitted scikit-learn estimator
+    """
+    if model_type in ('linear', 'ridge', 'lasso', 'elastic_net'):
+        from sklearn.linear_model import LinearRegression, Ridge, Lasso, ElasticNet
+        cls = {'linear': LinearRegression, 'ridge': Ridge, 'lasso': Lasso, 'elastic_net': ElasticNet}[model_type]
+        return cls(**model_params)
+    if model_type == 'random_forest':
+        from sklearn.ensemble import RandomForestRegressor
+        return RandomForestRegressor(**{'n_estimators': 100, **model_params})
+    if model_type == 'gradient_boost':
+        from sklearn.ensemble import GradientBoostingRegressor
+        return GradientBoostingRegressor(**model_params)
+    if model_type == 'svr':
+        from sklearn.svm import SVR
+        return SVR(**model_params)
+    if model_type == 'svr_approx':
+        # Nystroem/random-Fourier features + linear SVR; see kernel_approx.py
+        from .kernel_approx import approximate_kernel_model
+        return approximate_kernel_model('regression', **model_params)
+    raise ValueError(f"Unknown model type: {model_type}")
 
 
 def train_regressor(
     X: np.ndarray,
     y: np.ndarray,
-    model_type: Literal['linear', 'ridge', 'lasso', 'elastic_net', 'random_forest', 'gradient_boost', 'svr'] = 'random_forest',
+    model_type: Literal['linear', 'ridge', 'lasso', 'elastic_net', 'random_forest', 'gradient_boost', 'svr',
+                        'svr_approx'] = 'random_forest',
     test_size: float = 0.2,
     random_state: int = 42,
     **model_params
@@ -41,26 +67,16 @@ def train_regressor(
     Returns:
         Dictionary containing model, predictions, and metrics
     """
+    from sklearn.model_selection import train_test_split
+
+    # Build the model first so an unknown type fails before any work is done
+    model = build_regressor(model_type, **model_params)
+
     # Split data
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=test_size, random_state=random_state
     )
     
-    # Select model
-    models = {
-        'linear': LinearRegression(**model_params),
-        'ridge': Ridge(**model_params),
-        'lasso': Lasso(**model_params),
-        'elastic_net': ElasticNet(**model_params),
-        'random_forest': RandomForestRegressor(n_estimators=100, **model_params),
-        'gradient_boost': GradientBoostingRegressor(**model_params),
-        'svr': SVR(**model_params)
-    }
-    
-    model = models.get(model_type)
-    if model is None:
-        raise ValueError(f"Unknown model type: {model_type}")
-    
     # Train
     model.fit(X_train, y_train)
     
@@ -95,6 +111,13 @@ def evaluate_regressor(
     Returns:
         Dictionary of evaluation metrics
     """
+    from sklearn.metrics import (
+        mean_squared_error,
+        mean_absolute_error,
+        r2_score,
+        mean_absolute_percentage_error
+    )
+
     return {
         'mse': mean_squared_error(y_true, y_pred),
         'rmse': np.sqrt(mean_squared_error(y_true, y_pred)),
@@ -124,6 +147,8 @@ def cross_validate_regressor(
     Returns:
         Dictionary with CV results
     """
+    from sklearn.model_selection import cross_val_score
+
     scores = cross_val_score(model, X, y, cv=cv, scoring=scoring)
     
     return {
@@ -0,0 +1,131 @@
+"""
+Retention Budget Optimizer
+
+Chooses which employees to target with a retention intervention so that the
+expected number of retained employees is maximal under a fixed budget. Each
+candidate has a cost and an expected risk reduction (e.g. from
+`ScenarioEngine.risk_reduction`); the problem is a 0/1 knapsack, solved with
+the gain/cost ratio ordering:
+- 'lp': the LP relaxation - take candidates by ratio until the budget runs
+  out, plus a fraction of the next one. Optimal for divisible spend and an
+  upper bound for the 0/1 problem.
+- 'greedy': whole candidates only - the ratio prefix, refilled with any
+  later candidates that still fit, compared against the best single
+  candidate (which guarantees at least half the optimum).
+Both are one sort and a few cumulative sums, so hundreds of thousands of
+candidates solve in milliseconds.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _ratio_order(gain: np.ndarray, cost: np.ndarray) -> np.ndarray:
+    """Useful candidates (positive gain) sorted by gain per unit cost, best first."""
+    useful = np.flatnonzero(gain > 0)
+    with np.errstate(divide='ignore'):
+        ratio = np.where(cost[useful] > 0, gain[useful] / cost[useful], np.inf)
+    return useful[np.argsort(-ratio, kind='stable')]
+
+
+def _greedy_fill(order: np.ndarray, cost: np.ndarray, budget: float) -> np.ndarray:
+    """Whole candidates in ratio order, skipping any that no longer fit."""
+    chosen = []
+    remaining = budget
+    while len(order):
+        order = order[cost[order] <= remaining]
+        spent = np.cumsum(cost[order])
+        take = np.searchsorted(spent, remaining, side='right')
+        if take == 0:
+            break
+        chosen.append(order[:take])
+        remaining -= spent[take - 1]
+        order = order[take:]
+    return np.concatenate(chosen) if chosen else np.array([], dtype=int)
+
+
+def optimize_retention_budget(
+    risk_reduction,
+    cost,
+    budget: float,
+    method: str = 'greedy',
+    index: Optional[pd.Index] = None,
+) -> pd.DataFrame:
+    """
+    Select the candidates that maximise expected retained employees under a budget.
+
+    Args:
+        risk_reduction: Expected drop in attrition probability per candidate
+        cost: Intervention cost per candidate (same units as budget)
+        budget: Total spend available
+        method: 'greedy' (whole interventions) or 'lp' (fractional relaxation)
+        index: Optional index for the result (defaults to the Series index or a range)
+
+    Returns:
+        DataFrame with one row per candidate: RiskReduction, Cost, Fraction
+        (1.0 when fully funded, partial only for 'lp'), Selected and Priority
+        (funding order, NaN if not funded), sorted by Priority
+    """
+    if method not in ('greedy', 'lp'):
+        raise ValueError(f"Unknown method: {method}")
+    if index is None:
+        index = getattr(risk_reduction, 'index', None)
+    gain = np.asarray(risk_reduction, dtype=float)
+    cost = np.asarray(cost, dtype=float)
+    if gain.shape != cost.shape:
+        raise ValueError("risk_reduction and cost must have the same length")
+    if (cost < 0).any():
+        raise ValueError("Costs must be non-negative")
+
+    order = _ratio_order(gain, cost)
+    fraction = np.zeros(len(gain))
+
+    if method == 'lp':
+        spent = np.cumsum(cost[order])
+        take = np.searchsorted(spent, budget, side='right')
+        selected = order[:take]
+        fraction[selected] = 1.0
+        if take < len(order):
+            left = budget - (spent[take - 1] if take else 0.0)
+            fraction[order[take]] = left / cost[order[take]]
+            selected = order[:take + 1]
+    else:
+        selected = _greedy_fill(order, cost, budget)
+        affordable = np.flatnonzero((cost <= budget) & (gain > 0))
+        if len(affordable):
+            best = affordable[np.argmax(gain[affordable])]
+            if gain[best] > gain[selected].sum():
+                selected = np.array([best])
+        fraction[selected] = 1.0
+
+    priority = np.full(len(gain), np.nan)
+    priority[selected] = np.arange(1, len(selected) + 1)
+    plan = pd.DataFrame({
+        'RiskReduction': gain,
+        'Cost': cost,
+        'Fraction': fraction,
+        'Selected': fraction > 0,
+        'Priority': priority,
+    }, index=index)
+    return plan.sort_values('Priority', kind='stable')
+
+
+def summarize_plan(plan: pd.DataFrame, budget: float) -> dict:
+    """
+    Headline numbers for a plan from `optimize_retention_budget`.
+
+    Returns:
+        Dictionary with employees_targeted, spend, budget, expected_retained
+        and cost_per_retained
+    """
+    spend = float((plan['Cost'] * plan['Fraction']).sum())
+    retained = float((plan['RiskReduction'] * plan['Fraction']).sum())
+    return {
+        'employees_targeted': int(plan['Selected'].sum()),
+        'spend': spend,
+        'budget': float(budget),
+        'expected_retained': retained,
+        'cost_per_retained': spend / retained if retained > 0 else float('nan'),
+    }
@@ -0,0 +1,181 @@
+"""
+What-If Scenario Engine
+
+Applies declarative retention interventions to employee cohorts and rescores
+them with the fitted model. Only the columns an intervention touches (plus the
+derived features in `features.DERIVED_FEATURES` that depend on them) are
+recomputed, and only for the cohort rows. For linear models the new score is
+a delta update to the cached logit, so hundreds of scenarios over the whole
+population run interactively.
+
+A scenario is a dict, e.g.:
+
+    {
+        'name': 'No overtime in Sales',
+        'cohort': {'Department': 'Sales'},      # scalar, list or callable
+        'set': {'OverTime': 0},                 # engineered (unscaled) units
+        'add': {'StockOptionLevel': 1},
+        'multiply': {'MonthlyIncome': 1.10},
+    }
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .features import DERIVED_FEATURES
+
+
+class ScenarioEngine:
+    """
+    Rescores interventions against a fitted model and its unscaled feature frame.
+    """
+
+    def __init__(
+        self,
+        model,
+        X: pd.DataFrame,
+        cohort_frame: Optional[pd.DataFrame] = None,
+        data_min: Optional[pd.Series] = None,
+        data_max: Optional[pd.Series] = None,
+        clip: bool = True,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            model: Fitted classifier trained on min-max scaled X
+            X: Unscaled engineered features (output of perform_feature_engineering
+                without target/ID), one row per employee
+            cohort_frame: Frame with raw columns for cohort selection (e.g. the
+                cleaned data with Department as text), aligned to X's index
+            data_min, data_max: Scaler range per column (defaults to X's own
+                min/max, matching `scale_train_test(X, X)` in main.py)
+            clip: Clip intervened raw values to the observed [min, max]
+        """
+        X = X.astype(float)  # one-hot dummies arrive as bool
+        self.model = model
+        self.X = X
+        self.cohort_frame = cohort_frame if cohort_frame is not None else X
+        self.data_min = X.min() if data_min is None else data_min.reindex(X.columns)
+        data_max = X.max() if data_max is None else data_max.reindex(X.columns)
+        span = (data_max - self.data_min).astype(float)
+        self.data_range = span.where(span != 0, 1.0)  # MinMaxScaler convention
+        self.clip = clip
+        self._lo, self._hi = X.min(), X.max()
+
+        self.is_linear = hasattr(model, 'coef_')
+        X_scaled = self._scale(X)
+        if self.is_linear:
+            self.weights = pd.Series(np.ravel(model.coef_), index=X.columns)
+            self.base_logit = X_scaled.to_numpy(dtype=float) @ self.weights.to_numpy() + np.ravel(model.intercept_)[0]
+            self.base_scores = 1.0 / (1.0 + np.exp(-self.base_logit))
+        else:
+            self.base_scores = model.predict_proba(X_scaled)[:, 1]
+
+    def _scale(self, X: pd.DataFrame) -> pd.DataFrame:
+        cols = X.columns
+        return (X - self.data_min[cols]) / self.data_range[cols]
+
+    def cohort_mask(self, cohort: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Boolean mask of employees matching every cohort condition."""
+        mask = np.ones(len(self.X), dtype=bool)
+        for column, cond in (cohort or {}).items():
+            frame = self.cohort_frame if column in self.cohort_frame.columns else self.X
+            values = frame[column]
+            if callable(cond):
+                mask &= np.asarray(cond(values), dtype=bool)
+            elif isinstance(cond, (list, tuple, set)):
+                mask &= values.isin(list(cond)).to_numpy()
+            else:
+                mask &= (values == cond).to_numpy()
+        return mask
+
+    def _intervened(self, scenario: Dict[str, Any], rows: np.ndarray) -> pd.DataFrame:
+        """New values of every column affected by the scenario, for the cohort rows only."""
+        edits = {op: scenario.get(op, {}) for op in ('set', 'add', 'multiply')}
+        touched = set().union(*[set(e) for e in edits.values()])
+        unknown = touched - set(self.X.columns)
+        if unknown:
+            raise ValueError(f"Scenario '{scenario.get('name')}' changes unknown columns: {sorted(unknown)}")
+
+        derived = [name for name, (inputs, _) in DERIVED_FEATURES.items()
+                   if name in self.X.columns and touched & set(inputs)]
+        inputs = sorted(touched | {c for d in derived for c in DERIVED_FEATURES[d][0]})
+        new = self.X.iloc[rows][inputs]
+
+        for col, val in edits['set'].items():
+            new[col] = val
+        for col, val in edits['add'].items():
+            new[col] = new[col] + val
+        for col, val in edits['multiply'].items():
+            new[col] = new[col] * val
+        if self.clip:
+            cols = sorted(touched)
+            new[cols] = new[cols].clip(self._lo[cols], self._hi[cols], axis=1)
+
+        for name in derived:
+            new[name] = DERIVED_FEATURES[name][1](new)[name]
+        return new[sorted(touched) + derived]
+
+    def score(self, scenario: Dict[str, Any]) -> np.ndarray:
+        """
+        Risk scores for the whole population after applying one scenario.
+
+        Args:
+            scenario: Scenario dictionary (see module docstring)
+
+        Returns:
+            Array of new risk probabilities aligned with X
+        """
+        rows = np.flatnonzero(self.cohort_mask(scenario.get('cohort')))
+        scores = self.base_scores.copy()
+        if len(rows) == 0:
+            return scores
+
+        new = self._intervened(scenario, rows)
+        old = self.X.iloc[rows][new.columns]
+        if self.is_linear:
+            # Delta update: only changed columns contribute to the logit shift
+            delta = ((new - old) / self.data_range[new.columns]).to_numpy() @ self.weights[new.columns].to_numpy()
+            scores[rows] = 1.0 / (1.0 + np.exp(-(self.base_logit[rows] + delta)))
+        else:
+            X_rows = self.X.iloc[rows].copy()
+            X_rows[new.columns] = new
+            scores[rows] = self.model.predict_proba(self._scale(X_rows))[:, 1]
+        return scores
+
+    def risk_reduction(self, scenario: Dict[str, Any]) -> np.ndarray:
+        """Per-employee drop in risk if the scenario is applied (0 outside the cohort)."""
+        return self.base_scores - self.score(scenario)
+
+    def run(self, scenarios: List[Dict[str, Any]], population: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Summarise many scenarios.
+
+        Args:
+            scenarios: List of scenario dictionaries
+            population: Optional mask restricting the summary (e.g. active employees)
+
+        Returns:
+            DataFrame with one row per scenario: cohort_size, expected leavers
+            before/after (sum of probabilities), leavers_avoided, mean_risk_before/after
+        """
+        population = np.ones(len(self.X), dtype=bool) if population is None else np.asarray(population)
+        rows = []
+        for i, scenario in enumerate(scenarios):
+            cohort = self.cohort_mask(scenario.get('cohort')) & population
+            after = self.score(scenario)
+            before_sum = self.base_scores[population].sum()
+            after_sum = after[population].sum()
+            rows.append({
+                'scenario': scenario.get('name', f'scenario_{i}'),
+                'cohort_size': int(cohort.sum()),
+                'expected_leavers_before': before_sum,
+                'expected_leavers_after': after_sum,
+                'leavers_avoided': before_sum - after_sum,
+                'mean_risk_before': self.base_scores[cohort].mean() if cohort.any() else np.nan,
+                'mean_risk_after': after[cohort].mean() if cohort.any() else np.nan,
+            })
+        return pd.DataFrame(rows)
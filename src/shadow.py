@@ -0,0 +1,126 @@
+"""
+Champion/Challenger Shadow Scoring
+
+Scores one population with the production model and any number of candidate
+versions side by side:
+- Logistic models are stacked into one (p, m) coefficient matrix and scored
+  with a single matrix multiply (versions may use different feature subsets).
+- XGBoost models share one DMatrix built from the feature matrix.
+- Any other classifier falls back to `predict_proba` on the same frame.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _is_linear(model) -> bool:
+    return hasattr(model, 'coef_') and hasattr(model, 'predict_proba') and np.ravel(model.intercept_).size == 1
+
+
+def shadow_score(
+    models: Dict[str, Any],
+    X: pd.DataFrame,
+    champion: Optional[str] = None,
+    top_k: int = 50,
+    threshold: float = 0.5,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Score a population with several model versions and compare them.
+
+    Args:
+        models: Mapping of version name -> fitted model, e.g. outputs of
+            `train_logistic_regression` and `train_xgboost`
+        X: Engineered (scaled) feature frame, built once for all models
+        champion: Name of the production model (defaults to the first entry)
+        top_k: Size of the watch list used for the overlap statistic
+        threshold: Decision threshold for the flag-agreement statistic
+
+    Returns:
+        Tuple of (scores, agreement):
+        - scores: one probability column per model, indexed like X
+        - agreement: per model vs the champion: spearman, top_k_overlap,
+          flag_agreement, mean_abs_diff
+    """
+    if not models:
+        raise ValueError("At least one model is required")
+    names = list(models)
+    champion = champion or names[0]
+    if champion not in models:
+        raise ValueError(f"Unknown champion: {champion}")
+
+    scores = {}
+
+    linear = [n for n in names if _is_linear(models[n])]
+    if linear:
+        # One row per column of X; a model that uses fewer features gets zeros
+        W = np.zeros((X.shape[1], len(linear)))
+        for i, n in enumerate(linear):
+            used = getattr(models[n], 'feature_names_in_', X.columns)
+            cols = X.columns.get_indexer(used)
+            if (cols < 0).any():
+                raise ValueError(f"Model '{n}' needs features missing from X: {list(np.asarray(used)[cols < 0])}")
+            W[cols, i] = np.ravel(models[n].coef_)
+        b = np.array([np.ravel(models[n].intercept_)[0] for n in linear])
+        proba = 1.0 / (1.0 + np.exp(-(X.to_numpy(dtype=float) @ W + b)))
+        scores.update({n: proba[:, i] for i, n in enumerate(linear)})
+
+    boosted = [n for n in names if n not in scores and hasattr(models[n], 'get_booster')]
+    if boosted:
+        import xgboost as xgb
+
+        dmatrix = xgb.DMatrix(X, enable_categorical=True)
+        for n in boosted:
+            scores[n] = models[n].get_booster().predict(dmatrix)
+
+    for n in names:
+        if n not in scores:
+            scores[n] = models[n].predict_proba(X)[:, 1]
+
+    score_df = pd.DataFrame({n: scores[n] for n in names}, index=X.index)
+    return score_df, agreement_table(score_df, champion, top_k=top_k, threshold=threshold)
+
+
+def agreement_table(
+    scores: pd.DataFrame,
+    champion: str,
+    top_k: int = 50,
+    threshold: float = 0.5,
+) -> pd.DataFrame:
+    """
+    Agreement of every score column with the champion column.
+
+    Args:
+        scores: One probability column per model
+        champion: Column to compare against
+        top_k: Size of the highest-risk list compared for overlap
+        threshold: Decision threshold for flag agreement
+
+    Returns:
+        DataFrame indexed by model with spearman, top_k_overlap,
+        flag_agreement and mean_abs_diff
+    """
+    values = scores.to_numpy()
+    ref = scores.columns.get_loc(champion)
+    k = min(top_k, len(scores))
+
+    # Ranks for all columns at once; Spearman = Pearson on ranks
+    ranks = scores.rank(axis=0).to_numpy()
+    centred = ranks - ranks.mean(axis=0)
+    norms = np.sqrt((centred ** 2).sum(axis=0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spearman = (centred * centred[:, [ref]]).sum(axis=0) / (norms * norms[ref])
+
+    top = np.argpartition(-values, k - 1, axis=0)[:k]
+    in_top = np.zeros(values.shape, dtype=bool)
+    np.put_along_axis(in_top, top, True, axis=0)
+    overlap = (in_top & in_top[:, [ref]]).sum(axis=0) / k
+
+    flags = values >= threshold
+    return pd.DataFrame({
+        'spearman': spearman,
+        'top_k_overlap': overlap,
+        'flag_agreement': (flags == flags[:, [ref]]).mean(axis=0),
+        'mean_abs_diff': np.abs(values - values[:, [ref]]).mean(axis=0),
+    }, index=scores.columns)
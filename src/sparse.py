@@ -0,0 +1,131 @@
+"""
+Sparse Logistic Models
+
+Sweeps the L1 / elastic-net regularization path of the attrition logistic
+model, strongest penalty first, warm-starting each fit from the previous
+solution. The result is a frontier of validation accuracy/AUC against the
+number of non-zero features, and a pruned model that only needs its
+non-zero columns (see `features.required_raw_columns` for the raw inputs
+behind them), so scoring builds and reads fewer features.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _elasticnet_params(l1_ratio: float) -> Dict[str, Any]:
+    """L1/elastic-net arguments for LogisticRegression across sklearn versions."""
+    import inspect
+    from sklearn.linear_model import LogisticRegression
+
+    # scikit-learn 1.8 deprecated `penalty`; l1_ratio alone selects the mix
+    if inspect.signature(LogisticRegression).parameters['penalty'].default == 'deprecated':
+        return {'l1_ratio': l1_ratio}
+    return {'penalty': 'elasticnet', 'l1_ratio': l1_ratio}
+
+
+def regularization_path(
+    X_train: pd.DataFrame,
+    y_train,
+    X_val: Optional[pd.DataFrame] = None,
+    y_val=None,
+    Cs: Optional[np.ndarray] = None,
+    l1_ratio: float = 1.0,
+    class_weight='balanced',
+    tol: float = 1e-4,
+    max_iter: int = 2000,
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Fit the sparse logistic model along a grid of regularization strengths.
+
+    Args:
+        X_train: Scaled training features
+        y_train: Binary target
+        X_val, y_val: Held-out data for the frontier metrics (defaults to the
+            training data)
+        Cs: Inverse regularization strengths (default: 30 points log-spaced
+            over [1e-3, 10]); fitted in increasing order
+        l1_ratio: 1.0 for pure L1, between 0 and 1 for elastic net
+        class_weight: Passed to LogisticRegression
+        tol, max_iter: saga solver settings
+
+    Returns:
+        Tuple of (frontier, coefs):
+        - frontier: one row per C with C, n_features, accuracy, roc_auc, features
+        - coefs: (len(Cs), p + 1) array of coefficients followed by the intercept
+    """
+    import warnings
+    from sklearn.exceptions import ConvergenceWarning
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score, roc_auc_score
+
+    if X_val is None:
+        X_val, y_val = X_train, y_train
+    Cs = np.sort(np.logspace(-3, 1, 30) if Cs is None else np.asarray(Cs, dtype=float))
+    columns = np.asarray(X_train.columns)
+
+    model = LogisticRegression(solver='saga', warm_start=True, class_weight=class_weight,
+                               tol=tol, max_iter=max_iter, random_state=42,
+                               **_elasticnet_params(l1_ratio))
+    rows, coefs = [], []
+    for C in Cs:
+        model.set_params(C=C)
+        with warnings.catch_warnings():
+            # Early, heavily penalised fits converge loosely; warm starts fix that downstream
+            warnings.simplefilter('ignore', ConvergenceWarning)
+            model.fit(X_train, y_train)
+        coef = model.coef_.ravel()
+        support = np.flatnonzero(coef)
+        proba = model.predict_proba(X_val)[:, 1]
+        rows.append({
+            'C': C,
+            'n_features': len(support),
+            'accuracy': accuracy_score(y_val, proba >= 0.5),
+            'roc_auc': roc_auc_score(y_val, proba),
+            'features': tuple(columns[support]),
+        })
+        coefs.append(np.r_[coef, model.intercept_[0]])
+    return pd.DataFrame(rows), np.vstack(coefs)
+
+
+def select_sparse_model(frontier: pd.DataFrame, metric: str = 'roc_auc',
+                        tolerance: float = 0.01) -> pd.Series:
+    """
+    Smallest model whose metric is within `tolerance` of the best on the path.
+
+    Args:
+        frontier: Output of `regularization_path`
+        metric: 'roc_auc' or 'accuracy'
+        tolerance: Allowed drop from the best value
+
+    Returns:
+        The chosen frontier row
+    """
+    ok = frontier[(frontier[metric] >= frontier[metric].max() - tolerance) & (frontier['n_features'] > 0)]
+    return ok.sort_values(['n_features', metric], ascending=[True, False]).iloc[0]
+
+
+def train_pruned_model(
+    X_train: pd.DataFrame,
+    y_train,
+    features: List[str],
+    C: float,
+    l1_ratio: float = 1.0,
+    class_weight='balanced',
+    max_iter: int = 2000,
+):
+    """
+    Refit the sparse model on its non-zero features only.
+
+    The returned LogisticRegression has `feature_names_in_ == features`, so
+    callers (and `shadow.shadow_score`) only need to build those columns.
+    """
+    from sklearn.linear_model import LogisticRegression
+
+    model = LogisticRegression(solver='saga', C=C, class_weight=class_weight,
+                               max_iter=max_iter, random_state=42,
+                               **_elasticnet_params(l1_ratio))
+    model.fit(X_train[list(features)], y_train)
+    return model
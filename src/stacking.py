@@ -0,0 +1,250 @@
+"""
+Stacking Ensemble
+
+Stacks the attrition base models (logistic regression, random forest,
+XGBoost) under a meta-learner trained on their out-of-fold scores:
+positive-class probabilities, or decision-function margins for base models
+without `predict_proba` (e.g. 'svm').
+Every (base model, fold) fit and every full-data refit runs once, in
+parallel, and is persisted per base model keyed by the training data, so
+trying other meta-learners or base-model subsets only refits the (tiny)
+meta-learner on the cached out-of-fold matrix.
+
+Cache layout (`cache_dir`):
+    <name>-<key>.npz       out-of-fold scores and fold ids
+    <name>-<key>.model/    full-data base model (models.artifacts format)
+"""
+
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+BASE_MODELS = ('logistic', 'random_forest', 'xgboost')
+
+
+def _fit_base(name: str, X, y, random_state: int):
+    """Fit one base model the way the rest of the pipeline trains it."""
+    if name == 'logistic':
+        from .modeling import train_logistic_regression
+        return train_logistic_regression(X, y)
+    if name == 'xgboost':
+        from .modeling import train_xgboost
+        # One thread per fit: the (model, fold) grid is the parallel axis
+        return train_xgboost(X, y, n_jobs=1)
+    from .models.classifiers import build_classifier
+    return build_classifier(name, random_state=random_state).fit(X, y)
+
+
+def _has_proba(model) -> bool:
+    return hasattr(model, 'predict_proba')
+
+
+def _positive_score(model, X) -> np.ndarray:
+    if _has_proba(model):
+        return model.predict_proba(X)[:, 1]
+    return model.decision_function(X)
+
+
+def _fit_task(name: str, X, y, train_idx, test_idx, random_state: int):
+    if test_idx is None:
+        return _fit_base(name, X, y, random_state)
+    rows = X.iloc if isinstance(X, pd.DataFrame) else X
+    model = _fit_base(name, rows[train_idx], y[train_idx], random_state)
+    return _positive_score(model, rows[test_idx])
+
+
+def _meta_features(P, models: Dict[str, Any]) -> np.ndarray:
+    """
+    Base-model scores on a log-odds-like scale, where a linear meta-learner blends them.
+
+    Probability columns are mapped to the logit scale; decision-function
+    margins (models without `predict_proba`) are already unbounded and are
+    kept as they are.
+    """
+    P = pd.DataFrame(P)
+    features = P.to_numpy(dtype=float, copy=True)
+    proba = np.array([_has_proba(models[name]) for name in P.columns], dtype=bool)
+    clipped = np.clip(features[:, proba], 1e-6, 1 - 1e-6)
+    features[:, proba] = np.log(clipped) - np.log1p(-clipped)
+    return features
+
+
+def _build_meta(meta_model):
+    from sklearn.base import clone
+    from .models.classifiers import build_classifier
+
+    if isinstance(meta_model, str):
+        return build_classifier(meta_model)
+    return clone(meta_model)
+
+
+def fit_base_models(
+    X,
+    y,
+    base_models: Sequence[str] = BASE_MODELS,
+    n_splits: int = 5,
+    random_state: int = 42,
+    n_jobs: int = -1,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Dict[str, Any]:
+    """
+    Out-of-fold predictions and full-data fits for every base model.
+
+    Base models missing from the cache are fitted on all (model, fold)
+    pairs plus one full-data refit each, in a single parallel batch.
+
+    Args:
+        X: Scaled training features
+        y: Binary target
+        base_models: 'logistic', 'xgboost' or any `models.CLASSIFIER_TYPES` name
+        n_splits: Stratified folds for the out-of-fold predictions
+        random_state: Seed for the folds and the base models
+        n_jobs: Parallel workers (-1 = all cores)
+        cache_dir: Optional directory persisting results per base model
+
+    Returns:
+        Dictionary with 'oof' (DataFrame, one column per base model),
+        'models' (fitted on all of X) and 'folds' (fold id per row)
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import StratifiedKFold
+    from .explainability import data_hash
+    from .models.artifacts import load_artifact, save_artifact
+
+    y_arr = np.asarray(y)
+    splits = list(StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(X, y_arr))
+    folds = np.empty(len(y_arr), dtype=np.int8)
+    for k, (_, test_idx) in enumerate(splits):
+        folds[test_idx] = k
+
+    cache = Path(cache_dir) if cache_dir is not None else None
+    key = f"{data_hash(X)[:16]}-{data_hash(y_arr)[:8]}-{n_splits}-{random_state}"
+    oof, models = {}, {}
+    if cache is not None:
+        cache.mkdir(parents=True, exist_ok=True)
+        for name in base_models:
+            if (cache / f"{name}-{key}.npz").exists() and (cache / f"{name}-{key}.model").exists():
+                with np.load(cache / f"{name}-{key}.npz") as data:
+                    oof[name] = data['oof']
+                models[name] = load_artifact(cache / f"{name}-{key}.model")['model']
+
+    todo = [name for name in base_models if name not in oof]
+    tasks = [(name, train_idx, test_idx) for name in todo for train_idx, test_idx in splits]
+    tasks += [(name, None, None) for name in todo]
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_task)(name, X, y_arr, train_idx, test_idx, random_state)
+        for name, train_idx, test_idx in tasks
+    )
+
+    for (name, _, test_idx), result in zip(tasks, results):
+        if test_idx is None:
+            models[name] = result
+        else:
+            oof.setdefault(name, np.empty(len(y_arr)))[test_idx] = result
+    if cache is not None:
+        for name in todo:
+            save_artifact({'model': models[name]}, cache / f"{name}-{key}.model")
+            np.savez(cache / f"{name}-{key}.npz", oof=oof[name], folds=folds)
+
+    index = X.index if isinstance(X, pd.DataFrame) else None
+    return {
+        'oof': pd.DataFrame({name: oof[name] for name in base_models}, index=index),
+        'models': {name: models[name] for name in base_models},
+        'folds': folds,
+    }
+
+
+class StackingEnsemble:
+    """
+    Base models fitted on all training data plus a meta-learner fitted on their
+    out-of-fold scores (probabilities on the logit scale, margins as they are).
+    """
+
+    def __init__(self, base_models: Dict[str, Any], meta_model):
+        self.base_models = base_models
+        self.meta_model = meta_model
+
+    def base_predictions(self, X) -> pd.DataFrame:
+        """Positive-class probability (or margin) of every base model, one column each."""
+        index = X.index if isinstance(X, pd.DataFrame) else None
+        return pd.DataFrame({name: _positive_score(model, X) for name, model in self.base_models.items()},
+                            index=index)
+
+    def predict_proba(self, X) -> np.ndarray:
+        return self.meta_model.predict_proba(_meta_features(self.base_predictions(X), self.base_models))
+
+    def predict(self, X) -> np.ndarray:
+        return self.meta_model.predict(_meta_features(self.base_predictions(X), self.base_models))
+
+
+def fit_stacking_ensemble(
+    base: Dict[str, Any],
+    y,
+    meta_model='logistic',
+    base_models: Optional[Sequence[str]] = None,
+) -> StackingEnsemble:
+    """
+    Fit a meta-learner on cached out-of-fold predictions.
+
+    Args:
+        base: Output of `fit_base_models`
+        y: Target used for `fit_base_models`
+        meta_model: `models.CLASSIFIER_TYPES` name or an unfitted estimator
+        base_models: Subset of base model names (default: all in `base`)
+
+    Returns:
+        Fitted StackingEnsemble
+    """
+    names = list(base_models or base['oof'].columns)
+    meta = _build_meta(meta_model)
+    meta.fit(_meta_features(base['oof'][names], base['models']), np.asarray(y))
+    return StackingEnsemble({name: base['models'][name] for name in names}, meta)
+
+
+def compare_stacks(
+    base: Dict[str, Any],
+    y,
+    meta_models: Sequence = ('logistic',),
+    subsets: Optional[List[Sequence[str]]] = None,
+) -> pd.DataFrame:
+    """
+    Cross-validated score of every meta-learner on every base-model subset.
+
+    The meta-learner is cross-validated on the cached out-of-fold matrix with
+    the base models' own folds, so no base model is refitted.
+
+    Args:
+        base: Output of `fit_base_models`
+        y: Target used for `fit_base_models`
+        meta_models: `models.CLASSIFIER_TYPES` names or unfitted estimators
+        subsets: Base-model subsets (default: every non-empty combination)
+
+    Returns:
+        DataFrame with meta_model, base_models, roc_auc and accuracy, best first
+    """
+    from sklearn.metrics import accuracy_score, roc_auc_score
+    from sklearn.model_selection import PredefinedSplit, cross_val_predict
+
+    names = list(base['oof'].columns)
+    if subsets is None:
+        subsets = [c for r in range(1, len(names) + 1) for c in combinations(names, r)]
+    y_arr = np.asarray(y)
+    cv = PredefinedSplit(base['folds'])
+
+    rows = []
+    for meta_model in meta_models:
+        label = meta_model if isinstance(meta_model, str) else type(meta_model).__name__
+        for subset in subsets:
+            features = _meta_features(base['oof'][list(subset)], base['models'])
+            proba = cross_val_predict(_build_meta(meta_model), features, y_arr, cv=cv,
+                                      method='predict_proba')[:, 1]
+            rows.append({
+                'meta_model': label,
+                'base_models': '+'.join(subset),
+                'roc_auc': roc_auc_score(y_arr, proba),
+                'accuracy': accuracy_score(y_arr, proba >= 0.5),
+            })
+    return pd.DataFrame(rows).sort_values('roc_auc', ascending=False).reset_index(drop=True)
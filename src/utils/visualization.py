@@ -4,9 +4,13 @@ Visualization Utilities
 This module provides functions for setting up and creating visualizations.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Tuple, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Tuple, Optional
+
+# matplotlib/seaborn are imported on first use
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 def setup_plotting_style(
@@ -24,6 +28,9 @@ def setup_plotting_style(
         font_scale: Font scaling factor
         palette: Color palette name
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     sns.set_style(style)
     sns.set_context(context, font_scale=font_scale)
     sns.set_palette(palette)
@@ -56,6 +63,8 @@ def create_figure(
     Returns:
         Tuple of (Figure, Axes)
     """
+    import matplotlib.pyplot as plt
+
     if figsize is None:
         figsize = (6 * ncols, 4 * nrows)
     
@@ -1,18 +1,24 @@
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 from pathlib import Path
-import shap
+
+# matplotlib and seaborn are imported inside each plotting function so that
+# importing this module (e.g. from main.py) does not pay their startup cost.
 
 def setup_styles():
     """Sets professional plotting aesthetics."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     sns.set_style("whitegrid")
     plt.rcParams["figure.figsize"] = (10, 6)
     plt.rcParams["figure.dpi"] = 300
 
 def plot_attrition_by_overtime(df, output_path):
     """Plots Attrition rates for OverTime vs Non-OverTime employees."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     plt.figure()
     
     # Calculate percentages
@@ -45,6 +51,9 @@ def plot_attrition_by_overtime(df, output_path):
 
 def plot_feature_importance(model, X_test, feature_names, output_path):
     """Generates a SHAP summary plot to explain model decisions."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     # Note: Using TreeExplainer for XGBoost or LinearExplainer/KernelExplainer for generic
     # For Logistic Regression, we can plot coefficients, but SHAP is more 'bonus points'
     # We will use simple coefficient magnitude for the Logistic Regression if SHAP is too heavy
@@ -70,6 +79,9 @@ def plot_feature_importance(model, X_test, feature_names, output_path):
 
 def plot_risk_distribution(risk_scores, output_path):
     """Visualizes the distribution of risk scores across the workforce."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     plt.figure()
     sns.histplot(risk_scores, kde=True, bins=30, color="navy")
     plt.axvline(x=0.7, color='red', linestyle='--', label='High Risk Threshold (70%)')
@@ -83,7 +95,9 @@ def plot_risk_distribution(risk_scores, output_path):
 def plot_correlation_heatmap(df, output_path):
     """Generates a correlation heatmap for numeric features."""
     import numpy as np
-    
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     plt.figure(figsize=(12, 10))
     numeric_df = df.select_dtypes(include=['int64', 'float64'])
     corr = numeric_df.corr()
@@ -95,3 +109,25 @@ def plot_correlation_heatmap(df, output_path):
     plt.tight_layout()
     plt.savefig(output_path / '00_correlation_heatmap.png')
     plt.close()
+
+def plot_partial_dependence(pdp_results, output_path, max_ice_lines=100):
+    """Plots partial-dependence curves (with a sample of ICE lines) for the top drivers."""
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    n = len(pdp_results)
+    fig, axes = plt.subplots(1, n, figsize=(4 * n, 4), sharey=True, squeeze=False)
+    for ax, (feature, curve) in zip(axes[0], pdp_results.items()):
+        if 'ice' in curve:
+            ice = curve['ice']
+            rows = np.linspace(0, len(ice) - 1, min(max_ice_lines, len(ice))).astype(int)
+            ax.plot(curve['grid'], ice[rows].T, color='grey', alpha=0.15, linewidth=0.8)
+        ax.plot(curve['grid'], curve['average'], color='navy', linewidth=2.5, label='Average')
+        ax.set_title(feature, fontsize=12)
+        ax.set_xlabel("Feature value (scaled)")
+    axes[0][0].set_ylabel("Predicted Risk Probability")
+    axes[0][0].legend()
+    fig.suptitle("How Each Driver Moves Attrition Risk (Partial Dependence)", fontsize=14)
+    plt.tight_layout()
+    plt.savefig(output_path / '04_partial_dependence.png')
+    plt.close()
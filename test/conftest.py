@@ -13,6 +13,7 @@ from pathlib import Path
 # Add src to path
 ROOT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(ROOT_DIR / "src"))
+sys.path.insert(0, str(ROOT_DIR))
 
 
 @pytest.fixture
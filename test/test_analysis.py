@@ -16,6 +16,7 @@ from analysis.preprocessing import (
     detect_outliers,
     validate_data_types
 )
+from analysis.group_metrics import group_metrics
 
 
 class TestExploreDataframe:
@@ -58,6 +59,68 @@ class TestSummaryStatistics:
         assert len(stats) == 1
         assert 'numeric_1' in stats.index
 
+    def test_streaming_matches_exact(self, sample_dataframe, tmp_path):
+        """Test one-pass chunked moments equal pandas and sketch quartiles are close."""
+        exact = get_summary_statistics(sample_dataframe)
+        path = tmp_path / 'data.csv'
+        sample_dataframe.to_csv(path, index=False)
+
+        streamed = get_summary_statistics(pd.read_csv(path, chunksize=7), streaming=True)
+
+        moments = ['count', 'mean', 'std', 'min', 'max', 'skew', 'kurtosis']
+        pd.testing.assert_frame_equal(streamed[moments], exact[moments], rtol=1e-9)
+        for q in ['25%', '50%', '75%']:
+            np.testing.assert_allclose(streamed[q], exact[q], rtol=0.05, atol=0.05)
+
+    def test_accumulators_merge(self):
+        """Test accumulators from separate chunks/workers merge to the whole-data result."""
+        from analysis.streaming import SummaryAccumulator
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({'a': rng.lognormal(size=1000), 'b': rng.standard_normal(1000) - 5})
+        whole = SummaryAccumulator(['a', 'b']).update(df).summary()
+
+        merged = SummaryAccumulator(['a', 'b']).update(df.iloc[:10])
+        merged.merge(SummaryAccumulator(['a', 'b']).update(df.iloc[10:]))
+        parallel = get_summary_statistics(df, streaming=True, chunk_size=300, n_jobs=2)
+
+        pd.testing.assert_frame_equal(merged.summary(), whole)
+        pd.testing.assert_frame_equal(parallel, whole)
+        assert (whole['50%'] - df.median()).abs().max() <= 0.01 * df.abs().median().max()
+
+
+class TestCorrelationAnalysis:
+    """Tests for correlation_analysis function."""
+
+    @pytest.fixture
+    def correlated_frame(self):
+        rng = np.random.default_rng(0)
+        base = rng.standard_normal((300, 3))
+        values = np.hstack([base, base @ rng.standard_normal((3, 9)) + rng.standard_normal((300, 9))])
+        df = pd.DataFrame(values, columns=[f'c{i}' for i in range(12)])
+        return df.mask(rng.random(df.shape) < 0.05)
+
+    def test_pairs_match_matrix(self, correlated_frame):
+        """Test vectorized pairs equal the upper-triangle entries above the threshold."""
+        result = correlation_analysis(correlated_frame, threshold=0.4, render=False)
+        corr = result['matrix']
+
+        expected = [(a, b) for i, a in enumerate(corr.columns) for b in corr.columns[i + 1:]
+                    if abs(corr.loc[a, b]) > 0.4]
+        pairs = result['high_correlations']
+        assert list(zip(pairs['feature_1'], pairs['feature_2'])) == expected
+        assert result['figure'] is None and callable(result['plot'])
+
+    def test_block_mode_matches_dense(self, correlated_frame):
+        """Test block-wise pairs (pairwise-complete) equal the dense computation."""
+        dense = correlation_analysis(correlated_frame, threshold=0.4, render=False)['high_correlations']
+
+        blocked = correlation_analysis(correlated_frame, threshold=0.4, block_size=5)
+
+        assert blocked['matrix'] is None
+        pd.testing.assert_frame_equal(blocked['high_correlations'], dense, check_exact=False, atol=1e-10)
+        with pytest.raises(ValueError):
+            correlation_analysis(correlated_frame, method='kendall', block_size=5)
+
 
 class TestHandleMissingValues:
     """Tests for handle_missing_values function."""
@@ -95,6 +158,40 @@ class TestDetectOutliers:
         
         assert 'numeric_1' in outliers
 
+    @pytest.mark.parametrize('method', ['iqr', 'zscore'])
+    def test_mask_and_bitmap_match_indices(self, sample_dataframe, method):
+        """Test the vectorized mask/bitmap outputs agree with the per-column indices."""
+        df = sample_dataframe.copy()
+        df.loc[[3, 17], 'numeric_1'] = [25.0, -30.0]
+        indices = detect_outliers(df, method=method, threshold=2)
+
+        masked = detect_outliers(df, method=method, threshold=2, output='mask')
+        bitmap = detect_outliers(df, method=method, threshold=2, output='bitmap')
+
+        assert masked['mask'].shape == (100, 3) and bitmap['mask'].dtype == np.uint8
+        for j, col in enumerate(masked['bounds'].index):
+            assert df.index[masked['mask'][:, j]].tolist() == indices[col]['indices']
+            unpacked = np.unpackbits(bitmap['mask'][:, j], count=bitmap['n_rows']).astype(bool)
+            np.testing.assert_array_equal(unpacked, masked['mask'][:, j])
+            assert masked['counts'][col] == indices[col]['count']
+            assert masked['percentage'][col] == pytest.approx(indices[col]['percentage'])
+        assert {3, 17} <= set(indices['numeric_1']['indices'])
+
+    def test_streaming_application(self, sample_dataframe, tmp_path):
+        """Test fitted bounds applied chunk by chunk give the whole-frame counts."""
+        from analysis.preprocessing import fit_outlier_bounds, iter_outlier_masks, outlier_bounds_from_summary
+        bounds = fit_outlier_bounds(sample_dataframe, method='iqr', threshold=1.0)
+        path = tmp_path / 'data.csv'
+        sample_dataframe.to_csv(path, index=False)
+
+        chunks = list(iter_outlier_masks(pd.read_csv(path, chunksize=30), bounds))
+        whole = detect_outliers(sample_dataframe, threshold=1.0, output='mask')
+
+        assert [c['n_rows'] for c in chunks] == [30, 30, 30, 10]
+        pd.testing.assert_series_equal(sum(c['counts'] for c in chunks), whole['counts'])
+        stats = get_summary_statistics(sample_dataframe)
+        pd.testing.assert_frame_equal(outlier_bounds_from_summary(stats, threshold=1.0), bounds)
+
 
 class TestValidateDataTypes:
     """Tests for validate_data_types function."""
@@ -119,3 +216,45 @@ class TestValidateDataTypes:
         
         assert results['nonexistent_column']['valid'] is False
         assert 'not found' in results['nonexistent_column']['error']
+
+
+class TestGroupMetrics:
+    """Tests for the vectorized group-wise metric engine."""
+
+    def test_matches_per_group_loop(self):
+        """Test every slice matches sklearn metrics computed on that slice alone."""
+        from sklearn.metrics import precision_score, recall_score
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            'Department': rng.choice(['Sales', 'R&D', 'HR'], 3000),
+            'Gender': rng.choice(['Male', 'Female'], 3000),
+            'Attrition': rng.random(3000) < 0.2,
+            'score': rng.random(3000),
+        })
+        df.loc[::50, 'Department'] = None
+
+        table = group_metrics(df, ['Department', 'Gender'], 'Attrition', y_score='score', threshold=0.7)
+
+        assert len(table) == 8 and table['n'].sum() == 3000
+        for _, row in table.iterrows():
+            dept = df['Department'].isna() if pd.isna(row['Department']) else df['Department'] == row['Department']
+            part = df[dept & (df['Gender'] == row['Gender'])]
+            pred = part['score'] >= 0.7
+            assert row['n'] == len(part)
+            assert row['recall'] == pytest.approx(recall_score(part['Attrition'], pred))
+            assert row['precision'] == pytest.approx(precision_score(part['Attrition'], pred))
+            assert row['score_p50'] == pytest.approx(part['score'].median())
+            assert row['score_std'] == pytest.approx(part['score'].std(ddof=0))
+
+    def test_predictions_and_empty_denominators(self):
+        """Test given labels, NaN ratios for empty denominators and min_size."""
+        df = pd.DataFrame({'g': ['a', 'a', 'b', 'b', 'b', 'c']})
+
+        table = group_metrics(df, 'g', y_true=[0, 0, 1, 1, 0, 1], y_pred=[0, 0, 1, 0, 1, 1], min_size=2)
+
+        assert table['g'].tolist() == ['a', 'b']
+        assert np.isnan(table.loc[0, 'recall']) and np.isnan(table.loc[0, 'precision'])
+        assert table.loc[1, ['tp', 'fp', 'fn', 'tn']].tolist() == [1, 1, 1, 0]
+        assert 'score_mean' not in table
+        with pytest.raises(ValueError):
+            group_metrics(df, 'g', y_true=[0] * 6)
@@ -0,0 +1,78 @@
+"""
+Tests for Threshold Sweeps and Bootstrap Intervals
+"""
+
+import pytest
+import numpy as np
+from sklearn.metrics import precision_recall_curve, roc_auc_score, f1_score
+
+from src.evaluation import threshold_curve, best_threshold, bootstrap_metrics
+from src.modeling import train_logistic_regression, evaluate_model
+
+
+@pytest.fixture
+def scored_labels():
+    """Create labels with informative, partly tied scores."""
+    rng = np.random.default_rng(0)
+    y = rng.random(2000) < 0.2
+    scores = np.clip(0.3 * y + 0.7 * rng.random(2000), 0, 1).round(2)
+    return y.astype(int), scores
+
+
+class TestThresholdCurve:
+    """Tests for the single-sort threshold sweep."""
+
+    def test_matches_sklearn(self, scored_labels):
+        """Test precision/recall agree with sklearn at every threshold."""
+        y, scores = scored_labels
+
+        curve = threshold_curve(y, scores).set_index('threshold')
+        precision, recall, thresholds = precision_recall_curve(y, scores)
+
+        np.testing.assert_allclose(curve.loc[thresholds, 'precision'], precision[:-1])
+        np.testing.assert_allclose(curve.loc[thresholds, 'recall'], recall[:-1])
+
+    def test_best_threshold(self, scored_labels):
+        """Test the best-F1 threshold reproduces the reported F1."""
+        y, scores = scored_labels
+
+        curve = threshold_curve(y, scores)
+        t = best_threshold(curve, 'f1')
+
+        assert f1_score(y, scores >= t) == pytest.approx(curve['f1'].max())
+        assert 0 <= best_threshold(curve, 'cost') <= 1
+
+
+class TestBootstrap:
+    """Tests for batched bootstrap confidence intervals."""
+
+    def test_intervals_bracket_estimate(self, scored_labels):
+        """Test point estimates are exact and lie inside their intervals."""
+        y, scores = scored_labels
+
+        ci = bootstrap_metrics(y, scores, n_bootstrap=300, n_jobs=2)
+
+        assert ci.loc['roc_auc', 'estimate'] == pytest.approx(roc_auc_score(y, scores))
+        assert ci.loc['f1', 'estimate'] == pytest.approx(f1_score(y, scores >= 0.5))
+        assert (ci['lower'] <= ci['estimate']).all()
+        assert (ci['estimate'] <= ci['upper']).all()
+
+    def test_reproducible(self, scored_labels):
+        """Test the same seed gives identical intervals regardless of threads."""
+        y, scores = scored_labels
+
+        a = bootstrap_metrics(y, scores, n_bootstrap=200, n_jobs=1, random_state=7)
+        b = bootstrap_metrics(y, scores, n_bootstrap=200, n_jobs=4, random_state=7)
+
+        np.testing.assert_allclose(a.to_numpy(), b.to_numpy())
+
+
+def test_evaluate_model_sweep_mode(classification_data):
+    """Test evaluate_model returns the curve and intervals when requested."""
+    X, y = classification_data
+    model = train_logistic_regression(X, y)
+
+    results = evaluate_model(model, X, y, threshold_sweep=True, n_bootstrap=100)
+
+    assert {'threshold_curve', 'best_f1_threshold', 'confidence_intervals'} <= set(results)
+    assert results['confidence_intervals'].loc['recall', 'estimate'] == pytest.approx(results['recall'])
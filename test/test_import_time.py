@@ -0,0 +1,20 @@
+"""
+Import Hygiene Tests
+
+Guards against heavy dependencies creeping back into module-level imports.
+Millisecond budgets are machine-dependent and are checked by
+`make bench-imports` (scripts/benchmark_imports.py), not here.
+"""
+
+import pytest
+
+from scripts.benchmark_imports import HEAVY_MODULES, discover_modules, measure
+
+
+@pytest.mark.parametrize('module', discover_modules())
+def test_import_without_heavy_deps(module):
+    """Test each src module imports without loading heavy dependencies."""
+    _, imported = measure(module)
+
+    heavy = {name.split('.')[0] for _, name in imported} & set(HEAVY_MODULES)
+    assert not heavy, f"{module} imports {sorted(heavy)} at module load"
@@ -0,0 +1,77 @@
+"""
+Tests for Portable Inference Bundles
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import pandas as pd
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from xgboost import XGBClassifier
+
+from src.inference import export_bundle, save_bundle, load_bundle, predict_proba_bundle
+
+
+@pytest.fixture
+def frame_with_missing():
+    """Create a feature frame with a column containing NaNs."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((500, 5)), columns=list('abcde'))
+    y = ((X['a'] + 0.5 * X['b'] * rng.random(500)) > 0.7).astype(int)
+    X.iloc[::13, 2] = np.nan
+    return X, y
+
+
+@pytest.mark.parametrize('model, needs_impute', [
+    (LogisticRegression(max_iter=1000), True),
+    (RandomForestClassifier(n_estimators=20, random_state=0), False),
+    (GradientBoostingClassifier(n_estimators=20, random_state=0), True),
+    (XGBClassifier(n_estimators=20, max_depth=4), False),
+])
+def test_bundle_matches_predict_proba(model, needs_impute, frame_with_missing, tmp_path):
+    """Test bundle scores match the source model after a save/load round trip."""
+    X, y = frame_with_missing
+    if needs_impute:
+        X = X.fillna(0.5)
+    model.fit(X, y)
+
+    save_bundle(export_bundle(model), tmp_path / 'model.npz')
+    bundle = load_bundle(tmp_path / 'model.npz')
+
+    np.testing.assert_allclose(predict_proba_bundle(bundle, X), model.predict_proba(X)[:, 1], atol=1e-6)
+
+
+@pytest.mark.parametrize('model', [
+    RandomForestClassifier(n_estimators=5, random_state=0),
+    XGBClassifier(n_estimators=5, max_depth=2),
+])
+def test_multiclass_export_rejected(model, frame_with_missing):
+    """Test multi-class tree ensembles fail at export instead of scoring one class."""
+    X, _ = frame_with_missing
+    y = np.digitize(X['a'], [0.33, 0.66])
+    model.fit(X, y)
+
+    with pytest.raises(ValueError, match='binary'):
+        export_bundle(model)
+
+
+def test_scoring_imports_numpy_only(frame_with_missing, tmp_path):
+    """Test loading and scoring a bundle never imports sklearn or xgboost."""
+    X, y = frame_with_missing
+    model = XGBClassifier(n_estimators=5).fit(X, y)
+    path = tmp_path / 'model.npz'
+    save_bundle(export_bundle(model), path)
+    np.save(tmp_path / 'X.npy', X.to_numpy())
+
+    code = (
+        "import sys, numpy as np\n"
+        "from src.inference import load_bundle, predict_proba_bundle\n"
+        f"p = predict_proba_bundle(load_bundle(r'{path}'), np.load(r'{tmp_path / 'X.npy'}'))\n"
+        "assert p.shape == (500,)\n"
+        "assert not {'sklearn', 'xgboost', 'pandas'} & set(sys.modules)\n"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).parent.parent, check=True)
@@ -0,0 +1,506 @@
+"""
+Tests for the Attrition Modeling Pipeline
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.modeling import (
+    train_logistic_regression,
+    train_sparse_logistic_regression,
+    train_xgboost,
+    train_lightgbm,
+    train_xgboost_external_memory,
+    get_shap_values,
+    get_strategic_insights,
+)
+from src.explainability import explain_model, top_k_reasons, permutation_importance
+from src.uncertainty import fit_bootstrap_ensemble, score_with_intervals
+from src.shadow import shadow_score
+from src.partial_dependence import partial_dependence
+from src.scenarios import ScenarioEngine
+from src.retention import optimize_retention_budget, summarize_plan
+from src.features import (calculate_income_stability, scale_train_test, required_raw_columns,
+                          encode_features_categorical)
+from src.sparse import regularization_path
+from src.quantized import MISSING_CODE, QuantizedDataset, load_or_build, train_xgboost_quantized
+from src.stacking import fit_base_models, fit_stacking_ensemble, compare_stacks
+
+
+@pytest.fixture
+def attrition_frame():
+    """Create a small engineered-feature frame with a binary Attrition target."""
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.random((400, 4)), columns=['OverTime', 'MonthlyIncome', 'Age', 'StockOptionLevel'])
+    y = ((X['OverTime'] - X['StockOptionLevel'] + 0.3 * rng.standard_normal(400)) > 0).astype(int)
+    return X, pd.Series(y, name='Attrition')
+
+
+class TestXGBoostTraining:
+    """Tests for in-memory and external-memory XGBoost training."""
+
+    def test_hist_with_threads(self, attrition_frame):
+        """Test hist tree method and thread count are applied."""
+        X, y = attrition_frame
+
+        model = train_xgboost(X, y, tree_method='hist', n_jobs=2)
+
+        assert model.get_params()['tree_method'] == 'hist'
+        assert model.get_params()['n_jobs'] == 2
+
+    def test_external_memory_matches_in_memory(self, attrition_frame, tmp_path):
+        """Test training over Parquet row groups gives a usable classifier."""
+        X, y = attrition_frame
+        paths = []
+        for i, idx in enumerate(np.array_split(np.arange(len(X)), 2)):
+            path = tmp_path / f'part_{i}.parquet'
+            X.iloc[idx].assign(Attrition=y.iloc[idx]).to_parquet(path, row_group_size=50)
+            paths.append(path)
+
+        model = train_xgboost_external_memory(paths, n_jobs=2)
+        baseline = train_xgboost(X, y, tree_method='hist', n_jobs=2)
+
+        proba = model.predict_proba(X)[:, 1]
+        assert proba.shape == (len(X),)
+        assert abs((model.predict(X) == y).mean() - (baseline.predict(X) == y).mean()) < 0.05
+
+
+class TestExplanationEngine:
+    """Tests for closed-form, batched and cached attributions."""
+
+    def test_linear_matches_shap(self, attrition_frame):
+        """Test closed-form linear attributions match shap.LinearExplainer."""
+        import shap
+        X, y = attrition_frame
+        model = train_logistic_regression(X, y)
+
+        values, base_value = explain_model(model, X)
+        masker = shap.maskers.Independent(X, max_samples=len(X))
+        expected = shap.LinearExplainer(model, masker).shap_values(X)
+
+        np.testing.assert_allclose(values, expected, atol=1e-8)
+        np.testing.assert_allclose(values.sum(axis=1) + base_value, model.decision_function(X))
+
+    def test_tree_batches_match_single_call(self, attrition_frame):
+        """Test batched TreeExplainer output equals one full call."""
+        X, y = attrition_frame
+        model = train_xgboost(X, y, n_jobs=1)
+
+        batched, _ = explain_model(model, X, batch_size=150, n_jobs=2)
+        _, full = get_shap_values(model, X)
+
+        np.testing.assert_allclose(batched, full, atol=1e-5)
+
+    def test_cache_hit(self, attrition_frame, tmp_path):
+        """Test repeated requests are served from the on-disk cache."""
+        X, y = attrition_frame
+        model = train_logistic_regression(X, y)
+
+        first, _ = explain_model(model, X, cache_dir=tmp_path)
+        assert len(list(tmp_path.glob('*.npz'))) == 1
+        second, _ = explain_model(model, X, cache_dir=tmp_path)
+
+        np.testing.assert_array_equal(first, second)
+
+    def test_top_k_reasons(self):
+        """Test per-row top-k features are ordered by contribution."""
+        contributions = np.array([[0.1, 0.5, -0.2, 0.3],
+                                  [0.9, -0.1, 0.2, 0.0]])
+
+        reasons = top_k_reasons(contributions, ['a', 'b', 'c', 'd'], k=2)
+
+        assert reasons['TopReason1'].tolist() == ['b', 'a']
+        assert reasons['TopReason2'].tolist() == ['d', 'c']
+        assert reasons['TopReason1Impact'].tolist() == [0.5, 0.9]
+
+    def test_top_k_reasons_skips_risk_lowering(self):
+        """Test features with non-positive contributions are never listed as reasons."""
+        contributions = np.array([[-0.4, 0.3, -0.1, 0.0]])
+
+        reasons = top_k_reasons(contributions, ['a', 'b', 'c', 'd'], k=3)
+
+        assert reasons.loc[0, 'TopReason1'] == 'b' and reasons.loc[0, 'TopReason1Impact'] == 0.3
+        assert reasons.loc[0, ['TopReason2', 'TopReason3']].tolist() == ['', '']
+        assert reasons.loc[0, ['TopReason2Impact', 'TopReason3Impact']].isna().all()
+
+
+class TestRiskIntervals:
+    """Tests for bootstrap-ensemble risk intervals."""
+
+    def test_stacked_scoring_matches_replicas(self, attrition_frame):
+        """Test the matrix-multiply scores match per-replica sigmoid scores."""
+        X, y = attrition_frame
+
+        ensemble = fit_bootstrap_ensemble(X, y, n_replicas=8, n_jobs=2)
+        intervals = score_with_intervals(ensemble, X, alpha=0.0)
+
+        assert ensemble['coef'].shape == (8, X.shape[1])
+        logits = X.to_numpy() @ ensemble['coef'].T + ensemble['intercept']
+        proba = 1 / (1 + np.exp(-logits))
+        np.testing.assert_allclose(intervals['RiskScoreLow'], proba.min(axis=1))
+        np.testing.assert_allclose(intervals['RiskScoreHigh'], proba.max(axis=1))
+
+    def test_interval_contains_mean(self, attrition_frame):
+        """Test every interval brackets its mean score."""
+        X, y = attrition_frame
+
+        intervals = score_with_intervals(fit_bootstrap_ensemble(X, y, n_replicas=10, n_jobs=1), X)
+
+        assert (intervals['RiskScoreLow'] <= intervals['RiskScoreMean']).all()
+        assert (intervals['RiskScoreMean'] <= intervals['RiskScoreHigh']).all()
+
+
+class TestShadowScoring:
+    """Tests for batched champion/challenger scoring."""
+
+    def test_scores_match_predict_proba(self, attrition_frame):
+        """Test stacked and shared-matrix scores equal each model's predict_proba."""
+        X, y = attrition_frame
+        models = {
+            'champion': train_logistic_regression(X, y),
+            'lr_unweighted': train_logistic_regression(X, y, class_weight=None),
+            'lr_subset': train_logistic_regression(X[['OverTime', 'Age']], y),
+            'xgb': train_xgboost(X, y, n_jobs=1),
+        }
+
+        scores, agreement = shadow_score(models, X, top_k=40)
+
+        for name, model in models.items():
+            X_used = X[model.feature_names_in_] if hasattr(model, 'feature_names_in_') else X
+            np.testing.assert_allclose(scores[name], model.predict_proba(X_used)[:, 1], atol=1e-6)
+        assert agreement.loc['champion', 'spearman'] == pytest.approx(1.0)
+        assert agreement.loc['champion', 'top_k_overlap'] == 1.0
+        assert 0 <= agreement.loc['xgb', 'top_k_overlap'] <= 1
+
+    def test_unknown_champion(self, attrition_frame):
+        """Test an unknown champion name is rejected."""
+        X, y = attrition_frame
+
+        with pytest.raises(ValueError):
+            shadow_score({'a': train_logistic_regression(X, y)}, X, champion='b')
+
+
+class TestPermutationImportance:
+    """Tests for signed permutation importance on tree models."""
+
+    def test_direction_recovered(self, attrition_frame):
+        """Test known risk and protective drivers get the right sign."""
+        X, y = attrition_frame
+        model = train_xgboost(X, y, n_jobs=1)
+
+        perm = permutation_importance(model, X, n_repeats=2, features_per_batch=2, n_jobs=2)
+
+        assert perm.loc['OverTime', 'direction'] == 1
+        assert perm.loc['StockOptionLevel', 'direction'] == -1
+        assert set(perm.index[:2]) == {'OverTime', 'StockOptionLevel'}
+
+    def test_cached(self, attrition_frame, tmp_path):
+        """Test repeated requests reuse the cached result."""
+        X, y = attrition_frame
+        model = train_xgboost(X, y, n_jobs=1)
+
+        first = permutation_importance(model, X, cache_dir=tmp_path)
+        second = permutation_importance(model, X, cache_dir=tmp_path)
+
+        assert len(list(tmp_path.glob('perm-*.npz'))) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_strategic_insights_for_trees(self, attrition_frame):
+        """Test tree models get real directions in get_strategic_insights."""
+        X, y = attrition_frame
+        model = train_xgboost(X, y, n_jobs=1)
+
+        drivers = get_strategic_insights(model, X.columns.tolist(), X=X)
+
+        by_name = {d['feature']: d for d in drivers}
+        assert by_name['OverTime']['direction'] == 'Risk Accelerator'
+        assert by_name['StockOptionLevel']['direction'] == 'Protective Factor'
+        assert drivers[0]['normalized_score'] == 100.0
+
+
+class TestPartialDependence:
+    """Tests for batched PDP/ICE curves."""
+
+    def test_matches_sklearn(self, attrition_frame):
+        """Test averages equal sklearn's partial_dependence on the same grid."""
+        from sklearn.inspection import partial_dependence as sk_partial_dependence
+        X, y = attrition_frame
+        model = train_xgboost(X, y, n_jobs=1)
+
+        curves = partial_dependence(model, X, features=['OverTime'], max_rows=None,
+                                    chunk_rows=1000, n_jobs=2, ice=True)
+        grid = curves['OverTime']['grid']
+        expected = sk_partial_dependence(model, X, ['OverTime'], custom_values={'OverTime': grid},
+                                         kind='average')['average'][0]
+
+        np.testing.assert_allclose(curves['OverTime']['average'], expected, atol=1e-6)
+        assert curves['OverTime']['ice'].shape == (len(X), len(grid))
+
+    def test_default_features_and_subsample(self, attrition_frame):
+        """Test default driver list is filtered to X and rows are subsampled."""
+        X, y = attrition_frame
+        model = train_logistic_regression(X, y)
+
+        curves = partial_dependence(model, X, max_rows=50, ice=True)
+
+        assert set(curves) == {'OverTime', 'StockOptionLevel', 'MonthlyIncome'}
+        assert curves['MonthlyIncome']['ice'].shape[0] == 50
+
+
+class TestScenarioEngine:
+    """Tests for what-if scenario rescoring."""
+
+    @pytest.fixture
+    def engineered(self, attrition_frame):
+        X, y = attrition_frame
+        X = X.assign(OverTime=(X['OverTime'] > 0.5).astype(int),
+                     MonthlyIncome=2000 + 8000 * X['MonthlyIncome'],
+                     Age=20 + 40 * X['Age'],
+                     StockOptionLevel=np.floor(X['StockOptionLevel'] * 4))
+        X = calculate_income_stability(X)
+        cohort = pd.DataFrame({'Department': np.where(np.arange(len(X)) % 3 == 0, 'Sales', 'R&D')}, index=X.index)
+        return X, y, cohort
+
+    def _full_rescore(self, model, X, X_new):
+        _, X_new_scaled = scale_train_test(X, X_new)
+        return model.predict_proba(X_new_scaled)[:, 1]
+
+    def test_linear_delta_matches_full_rescore(self, engineered):
+        """Test delta-logit scores equal re-engineering and predict_proba."""
+        X, y, cohort = engineered
+        X_scaled, _ = scale_train_test(X, X)
+        model = train_logistic_regression(X_scaled, y)
+        engine = ScenarioEngine(model, X, cohort_frame=cohort)
+        scenario = {'name': 'raise', 'cohort': {'Department': 'Sales'},
+                    'set': {'OverTime': 0}, 'multiply': {'MonthlyIncome': 1.1}}
+
+        scores = engine.score(scenario)
+
+        sales = (cohort['Department'] == 'Sales').to_numpy()
+        X_new = X.copy()
+        X_new.loc[sales, 'OverTime'] = 0
+        X_new.loc[sales, 'MonthlyIncome'] = np.minimum(X.loc[sales, 'MonthlyIncome'] * 1.1, X['MonthlyIncome'].max())
+        X_new = calculate_income_stability(X_new)
+        np.testing.assert_allclose(scores, self._full_rescore(model, X, X_new), atol=1e-10)
+        np.testing.assert_allclose(engine.base_scores, model.predict_proba(X_scaled)[:, 1], atol=1e-10)
+
+    def test_tree_model_rescores_cohort(self, engineered):
+        """Test non-linear models only change scores inside the cohort."""
+        X, y, cohort = engineered
+        X_scaled, _ = scale_train_test(X, X)
+        model = train_xgboost(X_scaled, y, n_jobs=1)
+        engine = ScenarioEngine(model, X, cohort_frame=cohort)
+
+        summary = engine.run([{'name': 'no_ot', 'cohort': {'Department': ['Sales']}, 'set': {'OverTime': 0}},
+                              {'name': 'all_ot', 'set': {'OverTime': 1}}])
+        scores = engine.score({'cohort': {'Department': 'Sales'}, 'set': {'OverTime': 0}})
+
+        sales = (cohort['Department'] == 'Sales').to_numpy()
+        np.testing.assert_array_equal(scores[~sales], engine.base_scores[~sales])
+        assert summary.loc[0, 'cohort_size'] == sales.sum()
+        assert summary.loc[0, 'leavers_avoided'] > 0
+        assert summary.loc[1, 'leavers_avoided'] < 0
+
+    def test_unknown_column(self, engineered):
+        """Test interventions on unknown columns are rejected."""
+        X, y, cohort = engineered
+        model = train_logistic_regression(scale_train_test(X, X)[0], y)
+        engine = ScenarioEngine(model, X)
+
+        with pytest.raises(ValueError):
+            engine.score({'set': {'Bonus': 1}})
+
+
+class TestRetentionBudget:
+    """Tests for the budget-constrained intervention optimizer."""
+
+    def test_greedy_matches_brute_force_bounds(self):
+        """Test greedy stays within the budget and between half the optimum and the LP bound."""
+        from itertools import combinations
+        rng = np.random.default_rng(0)
+        gain, cost, budget = rng.random(10), rng.integers(1, 10, 10).astype(float), 20.0
+        optimum = max(gain[list(s)].sum() for r in range(11) for s in combinations(range(10), r)
+                      if cost[list(s)].sum() <= budget)
+
+        greedy = summarize_plan(optimize_retention_budget(gain, cost, budget), budget)
+        lp = summarize_plan(optimize_retention_budget(gain, cost, budget, method='lp'), budget)
+
+        assert greedy['spend'] <= budget
+        assert optimum / 2 <= greedy['expected_retained'] <= optimum + 1e-12
+        assert lp['expected_retained'] >= optimum - 1e-12
+        assert lp['spend'] == pytest.approx(budget)
+
+    def test_plan_layout(self):
+        """Test zero-gain candidates are never funded and priorities follow the ratio."""
+        gain = pd.Series([0.2, 0.0, 0.3, 0.1], index=[101, 102, 103, 104])
+        cost = [1.0, 1.0, 1.0, 5.0]
+
+        plan = optimize_retention_budget(gain, cost, budget=2.5)
+
+        assert plan.index[:2].tolist() == [103, 101]
+        assert not plan.loc[102, 'Selected'] and not plan.loc[104, 'Selected']
+        with pytest.raises(ValueError):
+            optimize_retention_budget(gain, cost, budget=1, method='ilp')
+
+
+class TestSparseModel:
+    """Tests for the L1 regularization path and pruned model."""
+
+    def test_path_grows_support(self, attrition_frame):
+        """Test the number of features grows along the path and the pruned model uses only its support."""
+        X, y = attrition_frame
+        X = X.assign(Noise=np.random.default_rng(1).random(len(X)))
+
+        frontier, coefs = regularization_path(X, y, Cs=[0.001, 0.05, 1.0, 10.0])
+        model, _ = train_sparse_logistic_regression(X, y, tolerance=0.02)
+
+        assert frontier['n_features'].is_monotonic_increasing
+        assert coefs.shape == (4, X.shape[1] + 1)
+        assert {'OverTime', 'StockOptionLevel'} <= set(model.feature_names_in_)
+        assert len(model.feature_names_in_) < X.shape[1]
+
+    def test_required_raw_columns(self):
+        """Test derived features and dummies map back to raw columns."""
+        raw = required_raw_columns(['OverTime', 'IncomeStability', 'Department_Sales', 'MonthlyIncome'])
+
+        assert raw == ['OverTime', 'MonthlyIncome', 'Age', 'Department']
+
+
+class TestNativeCategorical:
+    """Tests for training on category columns without one-hot expansion."""
+
+    @pytest.fixture
+    def categorical_frame(self):
+        rng = np.random.default_rng(0)
+        n = 400
+        raw = pd.DataFrame({
+            'Department': rng.choice(['Sales', 'Research & Development', 'Human Resources'], n),
+            'OverTime': rng.choice(['Yes', 'No'], n),
+            'MonthlyIncome': rng.integers(1000, 20000, n),
+        })
+        risk = (raw['Department'] == 'Sales').astype(int) + (raw['OverTime'] == 'Yes') + rng.standard_normal(n) * 0.3
+        raw['Attrition'] = np.where(risk > 1, 'Yes', 'No')
+        return encode_features_categorical(raw)
+
+    def test_encoding_keeps_columns_narrow(self, categorical_frame):
+        """Test nominal columns become category dtype and scaling skips them."""
+        assert isinstance(categorical_frame['Department'].dtype, pd.CategoricalDtype)
+        assert categorical_frame['OverTime'].isin([0, 1]).all()
+
+        scaled, _ = scale_train_test(categorical_frame, categorical_frame)
+        assert scaled['MonthlyIncome'].max() == pytest.approx(1.0)
+        assert isinstance(scaled['Department'].dtype, pd.CategoricalDtype)
+
+    @pytest.mark.parametrize('train', [train_lightgbm, lambda X, y: train_xgboost(X, y, enable_categorical=True)])
+    def test_models_learn_category(self, categorical_frame, train):
+        """Test LightGBM and XGBoost split on the category column directly."""
+        X, y = categorical_frame.drop(columns='Attrition'), categorical_frame['Attrition']
+
+        model = train(X, y)
+
+        proba = pd.Series(model.predict_proba(X)[:, 1], index=X.index)
+        by_dept = proba.groupby(X['Department'], observed=True).mean()
+        assert by_dept['Sales'] > by_dept['Human Resources']
+
+
+class TestStacking:
+    """Tests for the stacking ensemble over cached out-of-fold predictions."""
+
+    def test_oof_cached_and_reused(self, attrition_frame, tmp_path, monkeypatch):
+        """Test base models are fitted once and later calls only read the cache."""
+        import src.stacking as stacking
+        X, y = attrition_frame
+
+        base = fit_base_models(X, y, n_splits=3, n_jobs=1, cache_dir=tmp_path)
+
+        def refit(*args, **kwargs):
+            raise AssertionError("base model refitted")
+        monkeypatch.setattr(stacking, '_fit_base', refit)
+        cached = fit_base_models(X, y, n_splits=3, n_jobs=1, cache_dir=tmp_path)
+
+        assert list(base['oof'].columns) == ['logistic', 'random_forest', 'xgboost']
+        assert base['oof'].notna().all().all() and sorted(np.unique(base['folds'])) == [0, 1, 2]
+        pd.testing.assert_frame_equal(cached['oof'], base['oof'])
+        np.testing.assert_allclose(cached['models']['xgboost'].predict_proba(X),
+                                   base['models']['xgboost'].predict_proba(X))
+
+        board = compare_stacks(base, y, meta_models=['logistic', 'random_forest'])
+        assert len(board) == 2 * 7 and board['roc_auc'].is_monotonic_decreasing
+
+    def test_ensemble_predicts(self, attrition_frame):
+        """Test a fitted stack scores new rows from a subset of base models."""
+        from sklearn.metrics import roc_auc_score
+        X, y = attrition_frame
+        base = fit_base_models(X.iloc[:300], y.iloc[:300], n_splits=3, n_jobs=2)
+
+        stack = fit_stacking_ensemble(base, y.iloc[:300], base_models=['logistic', 'xgboost'])
+        proba = stack.predict_proba(X.iloc[300:])[:, 1]
+
+        assert list(stack.base_models) == ['logistic', 'xgboost']
+        assert roc_auc_score(y.iloc[300:], proba) > 0.8
+
+    def test_margins_not_logit_transformed(self, attrition_frame):
+        """Test decision-function margins of base models without probabilities reach the meta-learner unchanged."""
+        from src.stacking import _meta_features
+        X, y = attrition_frame
+        base = fit_base_models(X.iloc[:300], y.iloc[:300], base_models=['logistic', 'svm'], n_splits=3, n_jobs=2)
+
+        features = _meta_features(base['oof'], base['models'])
+        oof = base['oof'].to_numpy()
+
+        np.testing.assert_allclose(features[:, 1], oof[:, 1])
+        np.testing.assert_allclose(features[:, 0], np.log(oof[:, 0] / (1 - oof[:, 0])))
+        assert np.abs(features[:, 1]).max() < 13
+        stack = fit_stacking_ensemble(base, y.iloc[:300])
+        assert stack.predict_proba(X.iloc[300:]).shape == (len(X) - 300, 2)
+
+
+class TestQuantizedDataset:
+    """Tests for the pre-binned uint8 feature cache."""
+
+    def test_matches_hist_training(self, attrition_frame):
+        """Test training on codes equals hist training when every value has its own bin."""
+        X, y = attrition_frame
+        X = X.round(2)
+        dataset = QuantizedDataset.from_frame(X, y)
+
+        model = train_xgboost_quantized(dataset, n_jobs=1)
+        baseline = train_xgboost(X, y, tree_method='hist', n_jobs=1)
+
+        assert dataset.codes.dtype == np.uint8
+        np.testing.assert_allclose(model.predict_proba(dataset.transform(X)), baseline.predict_proba(X))
+
+    def test_max_bin_reserves_missing_code(self):
+        """Test the constructor defaults below the missing code and rejects max_bin colliding with it."""
+        codes = np.zeros((3, 1), dtype=np.uint8)
+
+        assert QuantizedDataset(codes, [np.array([])], ['a']).max_bin < MISSING_CODE
+        with pytest.raises(ValueError, match='max_bin'):
+            QuantizedDataset(codes, [np.array([])], ['a'], max_bin=MISSING_CODE)
+
+    def test_cache_roundtrip(self, attrition_frame, tmp_path):
+        """Test the cached dataset is reloaded memory-mapped with missing values preserved."""
+        X, y = attrition_frame
+        X = X.copy()
+        X.iloc[::10, 1] = np.nan
+
+        built = load_or_build(X, y, cache_dir=tmp_path, max_bin=16)
+        loaded = load_or_build(X, y, cache_dir=tmp_path, max_bin=16)
+
+        assert len(list(tmp_path.iterdir())) == 1
+        assert isinstance(loaded.codes, np.memmap)
+        np.testing.assert_array_equal(loaded.codes, built.codes)
+        assert (loaded.codes[::10, 1] == 255).all() and loaded.codes[:, 0].max() < 16
+        folds = train_xgboost_quantized(loaded, rows=np.arange(200), n_jobs=1)
+        assert folds.predict_proba(loaded.transform(X)).shape == (len(X), 2)
+
+    def test_cache_keyed_by_label(self, attrition_frame, tmp_path):
+        """Test the same features with a different (or no) label are not served stale labels."""
+        X, y = attrition_frame
+        y = np.asarray(y)
+
+        assert load_or_build(X, cache_dir=tmp_path, max_bin=16).label is None
+        np.testing.assert_array_equal(load_or_build(X, y, cache_dir=tmp_path, max_bin=16).label, y)
+        np.testing.assert_array_equal(load_or_build(X, 1 - y, cache_dir=tmp_path, max_bin=16).label, 1 - y)
+        assert len(list(tmp_path.iterdir())) == 3
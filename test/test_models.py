@@ -5,8 +5,27 @@ Tests for Model Modules
 import pytest
 import numpy as np
 
-from models.classifiers import train_classifier, evaluate_classifier
+from models.classifiers import train_classifier, train_classifier_leaderboard, evaluate_classifier
 from models.regressors import train_regressor, evaluate_regressor
+from models.base import BaseModel
+from models.learning_curve import learning_curve, summarize_learning_curve, _nested_order
+from models.artifacts import ArtifactError, load_artifact, save_artifact
+
+
+class LogisticModel(BaseModel):
+    """Minimal concrete model used to exercise BaseModel behaviour."""
+
+    def fit(self, X, y):
+        from sklearn.linear_model import LogisticRegression
+        self.model = LogisticRegression().fit(X, y)
+        self.is_fitted = True
+        return self
+
+    def predict(self, X):
+        return self.model.predict(X)
+
+    def evaluate(self, X, y):
+        return evaluate_classifier(y, self.predict(X))
 
 
 class TestClassifiers:
@@ -46,6 +65,33 @@ class TestClassifiers:
         assert 0 <= metrics['accuracy'] <= 1
 
 
+class TestLeaderboard:
+    """Tests for the multi-model leaderboard mode."""
+
+    def test_shared_split_and_costs(self, classification_data):
+        """Test every model is scored on the same split with latency and size columns."""
+        X, y = classification_data
+
+        result = train_classifier_leaderboard(X, y, model_types=['logistic', 'random_forest'], n_jobs=2,
+                                              model_params={'random_forest': {'n_estimators': 20}})
+        board = result['leaderboard']
+
+        assert set(board['model_type']) == {'logistic', 'random_forest'}
+        assert board['f1'].is_monotonic_decreasing
+        assert (board[['fit_time_s', 'predict_time_s', 'model_size_bytes']] > 0).all().all()
+        assert result['models']['random_forest'].n_estimators == 20
+        single = train_classifier(X, y, model_type='logistic')
+        np.testing.assert_array_equal(single['X_test'], result['X_test'])
+        assert board.set_index('model_type').loc['logistic', 'accuracy'] == single['metrics']['accuracy']
+
+    def test_unknown_type(self, classification_data):
+        """Test unknown model types are rejected before fitting."""
+        X, y = classification_data
+
+        with pytest.raises(ValueError):
+            train_classifier_leaderboard(X, y, model_types=['logistic', 'knn'])
+
+
 class TestRegressors:
     """Tests for regression models."""
     
@@ -84,6 +130,66 @@ class TestRegressors:
         assert metrics['rmse'] >= 0
 
 
+class TestApproximateKernel:
+    """Tests for the approximate-kernel svm_approx / svr_approx model types."""
+
+    @pytest.mark.parametrize("method", ["nystroem", "rff"])
+    def test_close_to_exact(self, classification_data, regression_data, method):
+        """Test approximations score close to the exact SVC / SVR."""
+        X, y = classification_data
+        exact = train_classifier(X, y, model_type='svm')
+        approx = train_classifier(X, y, model_type='svm_approx', method=method,
+                                  n_components=150, random_state=0)
+        assert approx['metrics']['accuracy'] >= exact['metrics']['accuracy'] - 0.1
+
+        X, y = regression_data
+        result = train_regressor(X, y, model_type='svr_approx', method=method, n_components=150,
+                                 random_state=0, C=10.0)
+        assert result['metrics']['r2'] > 0.8
+
+    def test_gamma_scale_and_invalid_method(self, classification_data):
+        """Test gamma_scale matches SVC's 'scale' and unknown methods fail."""
+        from sklearn.svm import SVC
+        from models.kernel_approx import gamma_scale
+
+        X, y = classification_data
+        assert gamma_scale(X) == pytest.approx(SVC().fit(X, y)._gamma)
+        with pytest.raises(ValueError):
+            train_classifier(X, y, model_type='svm_approx', method='fastfood')
+
+
+class TestLearningCurve:
+    """Tests for the nested-subsample learning curve."""
+
+    def test_nested_stratified_order(self):
+        """Test every prefix of the ordering keeps the class ratio."""
+        y = np.r_[np.zeros(80), np.ones(20)].astype(int)
+
+        order = _nested_order(y, np.random.SeedSequence(0), stratify=True)
+
+        assert sorted(order) == list(range(100))
+        for size in (10, 25, 50):
+            assert y[order[:size]].mean() == pytest.approx(0.2, abs=1 / size)
+
+    def test_report(self, classification_data, regression_data):
+        """Test one row per (type, size, repeat) with metrics, fit time and memory."""
+        X, y = classification_data
+        curve = learning_curve(X, y, model_types=['logistic', 'random_forest'], train_sizes=[0.5, 1.0, 40],
+                               n_repeats=2, n_jobs=2)
+
+        assert len(curve) == 2 * 3 * 2
+        assert curve.groupby('model_type')['train_size'].unique()['logistic'].tolist() == [40, 80, 160]
+        assert (curve['fit_time_s'] > 0).all() and (curve['peak_memory_mb'] > 0).all()
+        assert summarize_learning_curve(curve).loc[('logistic', 160), ('recall', 'mean')] > 0.8
+
+        X, y = regression_data
+        curve = learning_curve(X, y, model_types='ridge', task='regression', train_sizes=[0.5, 1.0],
+                               n_jobs=1, track_memory=False)
+        assert 'r2' in curve and curve['peak_memory_mb'].isna().all()
+        with pytest.raises(ValueError):
+            learning_curve(X, y, task='regression', train_sizes=[2.0])
+
+
 class TestModelEdgeCases:
     """Tests for edge cases in model training."""
     
@@ -103,3 +209,127 @@ class TestModelEdgeCases:
         
         with pytest.raises(ValueError):
             train_classifier(X, y, model_type='invalid_model')
+
+
+class TestStreamingPrediction:
+    """Tests for BaseModel.predict_iter / predict_proba_iter."""
+
+    @pytest.fixture
+    def fitted(self, classification_data):
+        import pandas as pd
+        X, y = classification_data
+        frame = pd.DataFrame(X, columns=[f'f{i}' for i in range(X.shape[1])])
+        return LogisticModel('lr').fit(frame, y), frame
+
+    @pytest.mark.filterwarnings('ignore:X does not have valid feature names')
+    @pytest.mark.parametrize('kind', ['frame', 'csv', 'parquet', 'npy', 'chunks'])
+    def test_sources_match_full_predict(self, fitted, kind, tmp_path):
+        """Test every chunked source yields the whole-array predictions in order."""
+        model, frame = fitted
+        if kind == 'frame':
+            source = frame
+        elif kind == 'csv':
+            source = tmp_path / 'x.csv'
+            frame.to_csv(source, index=False)
+        elif kind == 'parquet':
+            source = tmp_path / 'x.parquet'
+            frame.to_parquet(source, row_group_size=64)
+        elif kind == 'npy':
+            source = tmp_path / 'x.npy'
+            np.save(source, frame.to_numpy())
+        else:
+            source = (frame.iloc[i:i + 70] for i in range(0, len(frame), 70))
+
+        batches = list(model.predict_proba_iter(source, batch_size=50))
+
+        assert max(len(b) for b in batches) <= 50
+        np.testing.assert_allclose(np.vstack(batches), model.predict_proba(frame))
+
+    def test_unfitted_and_column_subset(self, fitted, tmp_path):
+        """Test column selection on CSV sources and the unfitted guard."""
+        model, frame = fitted
+        path = tmp_path / 'x.csv'
+        frame.assign(EmployeeNumber=range(len(frame))).to_csv(path, index=False)
+
+        preds = np.concatenate(list(model.predict_iter(path, batch_size=64, columns=list(frame.columns))))
+
+        np.testing.assert_array_equal(preds, model.predict(frame))
+        with pytest.raises(ValueError):
+            next(LogisticModel('new').predict_iter(frame))
+
+
+class TestModelArtifacts:
+    """Tests for pickle-free BaseModel.save/load."""
+
+    def test_roundtrip_is_memory_mapped(self, classification_data, tmp_path):
+        """Test a saved model reloads with identical predictions and mapped arrays."""
+        X, y = classification_data
+        model = LogisticModel('lr', C=1.0).fit(X, y)
+        model.metrics = {'accuracy': 0.9}
+        model.save(tmp_path / 'lr')
+
+        loaded = LogisticModel.load(tmp_path / 'lr')
+
+        np.testing.assert_allclose(loaded.predict_proba(X), model.predict_proba(X))
+        assert not loaded.model.coef_.flags.owndata
+        assert loaded.config == {'C': 1.0} and loaded.metrics == {'accuracy': 0.9}
+
+    @pytest.mark.parametrize('model_type', ['random_forest', 'gradient_boost'])
+    def test_tree_ensembles(self, classification_data, model_type, tmp_path):
+        """Test tree ensembles (node tables, shared RNGs) survive the round trip."""
+        X, y = classification_data
+        estimator = train_classifier(X, y, model_type=model_type)['model']
+
+        save_artifact({'model': estimator}, tmp_path / 'm')
+        restored = load_artifact(tmp_path / 'm')['model']
+
+        np.testing.assert_array_equal(restored.predict_proba(X), estimator.predict_proba(X))
+
+    def test_tampered_and_disallowed(self, classification_data, tmp_path):
+        """Test corrupted blocks and non-allowlisted globals are rejected."""
+        import json
+        X, y = classification_data
+        path = save_artifact({'model': LogisticModel('lr').fit(X, y).model}, tmp_path / 'a')
+        arena = np.load(path / 'arrays.npy', mmap_mode='r+')
+        arena[0] ^= 1
+        arena.flush()
+        del arena
+
+        with pytest.raises(ArtifactError):
+            load_artifact(path)
+
+        manifest = json.loads((path / 'manifest.json').read_text())
+        marker = tmp_path / 'pwned.txt'
+        payloads = [
+            ({'__global__': 'os:system'}, [f'echo hi > {marker}']),
+            # Nested qualname reaching a module re-exported by an allowlisted package
+            ({'__global__': 'xgboost.core:os.system'}, [f'echo PWNED > {marker}']),
+            # Allowlisted package, but not one of the known reconstructors
+            ({'__global__': 'numpy:load'}, [str(path / 'arrays.npy'), None, True]),
+        ]
+        for func, args in payloads:
+            manifest['root'] = {'__call__': func, 'id': 0, 'args': {'__tuple__': args}, 'state': None}
+            (path / 'manifest.json').write_text(json.dumps(manifest))
+            with pytest.raises(ArtifactError):
+                load_artifact(path, verify=False)
+        assert not marker.exists()
+
+        # Classes must come from an allowlisted module even when rebuilt via __new__
+        for name in ('xgboost.core:os.PathLike', 'sklearn.utils:Bunch.__init__', 'numpy:ndarray'):
+            manifest['root'] = {'__object__': name, 'id': 0, 'args': {'__tuple__': []}, 'state': None}
+            (path / 'manifest.json').write_text(json.dumps(manifest))
+            with pytest.raises(ArtifactError):
+                load_artifact(path, verify=False)
+
+    def test_legacy_pickle_needs_opt_in(self, classification_data, tmp_path):
+        """Test old pickle files only load with allow_pickle=True."""
+        import pickle
+        X, y = classification_data
+        model = LogisticModel('lr').fit(X, y)
+        path = tmp_path / 'old.pkl'
+        with open(path, 'wb') as f:
+            pickle.dump({'name': 'lr', 'model': model.model, 'config': {}, 'metrics': {}}, f)
+
+        with pytest.raises(ValueError):
+            LogisticModel.load(path)
+        assert LogisticModel.load(path, allow_pickle=True).is_fitted